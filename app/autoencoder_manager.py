@@ -1,12 +1,75 @@
 import numpy as np
 from keras.models import Model, load_model
-from keras.callbacks import EarlyStopping, ModelCheckpoint
+from keras.callbacks import EarlyStopping
 import tensorflow as tf
 from keras.optimizers import Adam
 from tensorflow.keras.losses import Huber
-from tensorflow.keras.mixed_precision import set_global_policy
+from app.precision import apply_precision_policy
+from app.fast_inference import predict
+from app.instrumentation import stage
+from app.checkpointing import TrainingCheckpoint, checkpoint_path, load_checkpoint
+from app.threshold_stopping import ThresholdStopping
+from app.dataset_information import get_dataset_statistics, information_from_statistics
+from app.windowed_dataset import WindowedDataset, StreamingWindowedDataset, is_windowed_dataset
+
+# Keras compile options for each execution mode
+EXECUTION_MODES = {
+    'eager': {'run_eagerly': True, 'jit_compile': False},  # Op-by-op Python execution, for debugging
+    'graph': {'run_eagerly': False, 'jit_compile': False},  # tf.function graphs
+    'xla': {'run_eagerly': False, 'jit_compile': True}  # tf.function graphs compiled with XLA
+}
+
+def transfer_weights(source_model, target_model):
+    """
+    Copy compatible weights from source_model into target_model, layer by layer.
+
+    Layers are paired in order among layers of the same class, since auto-generated layer names
+    differ between models built in the same process. Weights with equal shapes are copied,
+    weights with the same rank but different shapes get their overlapping slice copied, and the
+    rest keep their fresh initialization.
+
+    Args:
+        source_model (keras.Model): Trained model to copy from.
+        target_model (keras.Model): Freshly built model to copy into.
+
+    Returns:
+        dict: Number of weight tensors copied, partially copied and re-initialized.
+    """
+    counts = {'copied': 0, 'partial': 0, 'reinitialized': 0}
+    source_layers = {}
+    for layer in source_model.layers:
+        if layer.weights:
+            source_layers.setdefault(type(layer).__name__, []).append(layer)
+
+    for target_layer in target_model.layers:
+        if not target_layer.weights:
+            continue
+        candidates = source_layers.get(type(target_layer).__name__)
+        if not candidates:
+            counts['reinitialized'] += len(target_layer.weights)
+            continue
+        source_layer = candidates.pop(0)
+        new_weights = []
+        source_weights = source_layer.get_weights()
+        target_weights = target_layer.get_weights()
+        for i, target_weight in enumerate(target_weights):
+            source_weight = source_weights[i] if i < len(source_weights) else None
+            if source_weight is not None and source_weight.shape == target_weight.shape:
+                new_weights.append(source_weight)
+                counts['copied'] += 1
+            elif source_weight is not None and source_weight.ndim == target_weight.ndim:
+                # Copy the overlapping block, keep the fresh initialization elsewhere
+                overlap = tuple(slice(0, min(a, b)) for a, b in zip(source_weight.shape, target_weight.shape))
+                merged_weight = target_weight.copy()
+                merged_weight[overlap] = source_weight[overlap]
+                new_weights.append(merged_weight)
+                counts['partial'] += 1
+            else:
+                new_weights.append(target_weight)
+                counts['reinitialized'] += 1
+        target_layer.set_weights(new_weights)
+    return counts
 
-set_global_policy('mixed_float16')
 
 class AutoencoderManager:
     def __init__(self, encoder_plugin, decoder_plugin):
@@ -15,16 +78,24 @@ class AutoencoderManager:
         self.autoencoder_model = None
         self.encoder_model = None
         self.decoder_model = None
+        self.history = None
+        self.epochs_trained = 0
+        self.interface_size = None
+        self.stop_reason = None
         print(f"[AutoencoderManager] Initialized with encoder plugin and decoder plugin")
 
     def build_autoencoder(self, input_shape, interface_size, config, num_channels):
         try:
             print("[build_autoencoder] Starting to build autoencoder...")
 
+            # Apply the run's precision policy before any layer is created
+            apply_precision_policy(config.get('precision', 'float32'))
+
             # Determine if sliding windows are used
             use_sliding_windows = config.get('use_sliding_windows', True)
 
             # Configure encoder size
+            self.interface_size = interface_size
             self.encoder_plugin.configure_size(input_shape, interface_size, num_channels, use_sliding_windows)
 
             # Get the encoder model
@@ -67,11 +138,15 @@ class AutoencoderManager:
                 return 1 - (ss_res / (ss_tot + tf.keras.backend.epsilon()))  # Avoid division by zero
 
             # Compile autoencoder with the custom loss function
+            execution_mode = config.get('execution_mode', 'graph')
+            if execution_mode not in EXECUTION_MODES:
+                raise ValueError(f"[build_autoencoder] Unknown execution_mode '{execution_mode}', expected one of {list(EXECUTION_MODES)}")
+            print(f"[build_autoencoder] Compiling with execution mode: {execution_mode}")
             self.autoencoder_model.compile(
                 optimizer=adam_optimizer,
                 loss=Huber(delta=1.0),
                 metrics=['mae'],
-                run_eagerly=True
+                **EXECUTION_MODES[execution_mode]
             )
             print("[build_autoencoder] Autoencoder model built and compiled successfully")
             self.autoencoder_model.summary()
@@ -84,9 +159,27 @@ class AutoencoderManager:
 
 
 
-    def train_autoencoder(self, data, epochs=100, batch_size=32, config=None):
+    def warm_start_from(self, previous_manager):
+        """
+        Initialize the built encoder and decoder from a previously trained manager's weights.
+
+        Args:
+            previous_manager (AutoencoderManager): Manager of the previous interface size candidate.
+
+        Returns:
+            dict: Transfer counts for the encoder and the decoder.
+        """
+        transfer_counts = {
+            'encoder': transfer_weights(previous_manager.encoder_model, self.encoder_model),
+            'decoder': transfer_weights(previous_manager.decoder_model, self.decoder_model)
+        }
+        print(f"[warm_start_from] Transferred weights: {transfer_counts}")
+        return transfer_counts
+
+    def train_autoencoder(self, data, epochs=100, batch_size=32, config=None, validation_data=None):
         try:
             print(f"[train_autoencoder] Received data with shape: {data.shape}")
+            profile = getattr(data, 'profile', None)  # Read before reshaping, reshaped views do not carry it
 
             # Determine if sliding windows are used
             use_sliding_windows = config.get('use_sliding_windows', True)
@@ -96,6 +189,8 @@ class AutoencoderManager:
                 print("[train_autoencoder] Reshaping data to add channel dimension for Conv1D compatibility...")
                 data = np.expand_dims(data, axis=-1)  # Add channel dimension (num_samples, num_features, 1)
                 print(f"[train_autoencoder] Reshaped data shape: {data.shape}")
+                if validation_data is not None and len(validation_data.shape) == 2:
+                    validation_data = np.expand_dims(validation_data, axis=-1)
 
             num_channels = data.shape[-1]
             input_shape = data.shape[1]
@@ -105,30 +200,80 @@ class AutoencoderManager:
             if not self.autoencoder_model:
                 self.build_autoencoder(input_shape, interface_size, config, num_channels)
 
-            # Validate data for NaN values before training
-            if np.isnan(data).any():
+            # Validate data for NaN values before training, from the data profile when available
+            if profile is not None:
+                has_nan = profile.has_nan  # Counted once after loading
+            else:
+                has_nan = np.isnan(data.series if isinstance(data, WindowedDataset) else data).any()
+            if has_nan:
                 raise ValueError("[train_autoencoder] Training data contains NaN values. Please check your data preprocessing pipeline.")
 
             # Calculate entropy and useful information using Shannon-Hartley theorem
-            self.calculate_dataset_information(data, config)
+            with stage('dataset_information'):
+                self.calculate_dataset_information(data, config)
 
             print(f"[train_autoencoder] Training autoencoder with data shape: {data.shape}")
 
             # Implement Early Stopping
             early_stopping = EarlyStopping(monitor='loss', patience=3, restore_best_weights=True)
+            callbacks = [early_stopping]
+
+            # Stop as soon as the candidate meets the threshold, or abandon it when it is not going to
+            threshold_stopping = None
+            if config.get('threshold_stopping') and validation_data is not None:
+                if config.get('incremental_search', True):
+                    threshold_stopping = ThresholdStopping(
+                        validation_data, config['threshold_error'], config.get('threshold_check_every', 5),
+                        config.get('threshold_validation_samples')
+                    )
+                    callbacks.append(threshold_stopping)
+                else:
+                    print("[train_autoencoder] threshold_stopping is only used with incremental search.")
+
+            # Periodic checkpoints of this candidate, listed last so that the early and threshold stopping states are restored on resume
+            # and a stop requested by the other callbacks is recorded
+            checkpoint = None
+            if config.get('checkpoint_dir'):
+                file_path = checkpoint_path(config['checkpoint_dir'], self.interface_size)
+                resume_from = load_checkpoint(file_path) if config.get('resume') else None
+                checkpoint = TrainingCheckpoint(file_path, config.get('checkpoint_every', 1), early_stopping, resume_from,
+                                                threshold_stopping=threshold_stopping)
+                callbacks.append(checkpoint)
+            elif config.get('resume'):
+                print("[train_autoencoder] --resume needs --checkpoint_dir, training from scratch.")
+            initial_epoch = checkpoint.initial_epoch if checkpoint else 0
 
             # Start training with early stopping
-            history = self.autoencoder_model.fit(
-                data,
-                data,
-                epochs=epochs,
-                batch_size=batch_size,
-                verbose=1,
-                callbacks=[early_stopping]
-            )
-
-            # Log training loss
-            print(f"[train_autoencoder] Training loss values: {history.history['loss']}")
+            with stage('fit', epochs=epochs, batch_size=batch_size, initial_epoch=initial_epoch):
+                if checkpoint and (checkpoint.stopped_early or initial_epoch >= epochs):
+                    # The checkpoint already holds the finished training of this candidate
+                    checkpoint.restore(self.autoencoder_model)
+                elif is_windowed_dataset(data):
+                    # Windows are sliced per batch from the 2D series or streamed chunks and prefetched
+                    history = self.autoencoder_model.fit(
+                        data.as_tf_dataset(batch_size, shuffle=True),
+                        epochs=epochs,
+                        initial_epoch=initial_epoch,
+                        verbose=1,
+                        callbacks=callbacks
+                    )
+                else:
+                    history = self.autoencoder_model.fit(
+                        data,
+                        data,
+                        epochs=epochs,
+                        initial_epoch=initial_epoch,
+                        batch_size=batch_size,
+                        verbose=1,
+                        callbacks=callbacks
+                    )
+
+            # Log training loss, of all epochs when training resumed from a checkpoint
+            self.history = checkpoint.history if checkpoint else history.history
+            self.epochs_trained = len(self.history['loss'])
+            self.stop_reason = threshold_stopping.stop_reason if threshold_stopping else None
+            print(f"[train_autoencoder] Training loss values: {self.history['loss']}")
+            print(f"[train_autoencoder] Epochs to converge: {self.epochs_trained}")
             print("[train_autoencoder] Training completed.")
         except Exception as e:
             print(f"[train_autoencoder] Exception occurred during training: {e}")
@@ -137,79 +282,32 @@ class AutoencoderManager:
 
 
     def calculate_dataset_information(self, data, config):
-        try:
-            print("[calculate_dataset_information] Calculating dataset entropy and useful information...")
-
-            # Handle 2D and 3D data shapes
-            normalized_columns = []
-            if len(data.shape) == 3:  # Sliding window data
-                for col in range(data.shape[-1]):
-                    column_data = data[:, :, col].flatten()  # Flatten the column data
-                    min_val, max_val = column_data.min(), column_data.max()
-                    normalized_column = (column_data - min_val) / (max_val - min_val)  # Min-max normalization
-                    normalized_columns.append(normalized_column)
-            elif len(data.shape) == 2:  # Row-by-row data
-                for col in range(data.shape[1]):
-                    column_data = data[:, col]  # No need to flatten, already 1D
-                    min_val, max_val = column_data.min(), column_data.max()
-                    normalized_column = (column_data - min_val) / (max_val - min_val)  # Min-max normalization
-                    normalized_columns.append(normalized_column)
-            else:
-                raise ValueError("[calculate_dataset_information] Unsupported data shape for processing.")
-
-            concatenated_data = np.concatenate(normalized_columns, axis=0)
-            num_samples = concatenated_data.shape[0]  # Correct number of samples is the length of concatenated vector
-
-            # Convert concatenated data to TensorFlow tensor for acceleration
-            concatenated_data_tf = tf.convert_to_tensor(concatenated_data, dtype=tf.float32)
-
-            # Calculate signal-to-noise ratio (SNR) using TensorFlow
-            mean_val = tf.reduce_mean(concatenated_data_tf)
-            std_val = tf.math.reduce_std(concatenated_data_tf)
-            snr = tf.cond(
-                tf.greater(std_val, 0),
-                lambda: (mean_val / std_val) ** 2,
-                lambda: tf.constant(0.0, dtype=tf.float32)
-            )
+        """
+        Log the SNR, channel capacity, total useful information and entropy of the training data.
 
-            # Retrieve dataset periodicity and calculate sampling frequency
-            periodicity = config['dataset_periodicity']
-            periodicity_seconds_map = {
-                "1min": 60,
-                "5min": 5 * 60,
-                "15min": 15 * 60,
-                "1h": 60 * 60,
-                "4h": 4 * 60 * 60,
-                "daily": 24 * 60 * 60
-            }
-            sampling_period_seconds = periodicity_seconds_map.get(periodicity, None)
-
-            if sampling_period_seconds:
-                sampling_frequency = tf.constant(1 / sampling_period_seconds, dtype=tf.float32)
-            else:
-                sampling_frequency = tf.constant(0.0, dtype=tf.float32)
+        Statistics are computed once per dataset (on the 2D series for windowed datasets) and cached
+        by fingerprint, so later interface size candidates reuse them.
 
-            # Calculate Shannon-Hartley channel capacity and total useful information
-            channel_capacity = tf.cond(
-                tf.math.logical_and(tf.greater(snr, 0), tf.greater(sampling_frequency, 0)),
-                lambda: sampling_frequency * tf.math.log(1 + snr) / tf.math.log(2.0),
-                lambda: tf.constant(0.0, dtype=tf.float32)
-            )
-            total_information_bits = channel_capacity * num_samples * sampling_period_seconds
+        Args:
+            data (np.ndarray, WindowedDataset or StreamingWindowedDataset): Training data.
+            config (dict): Configuration dictionary.
 
-            # Calculate entropy using TensorFlow histogram binning
-            bins = 1000  # Increased bin count for better precision
-            histogram = tf.histogram_fixed_width(concatenated_data_tf, [0.0, 1.0], nbins=bins)
-            histogram = tf.cast(histogram, tf.float32)
-            probabilities = histogram / tf.reduce_sum(histogram)
-            entropy = -tf.reduce_sum(probabilities * tf.math.log(probabilities + 1e-10) / tf.math.log(2.0))  # Avoid log(0)
+        Returns:
+            dict: The calculated dataset information.
+        """
+        try:
+            print("[calculate_dataset_information] Calculating dataset entropy and useful information...")
+            cache_dir = None if config.get('no_csv_cache', False) else config.get('csv_cache_dir')
+            statistics = get_dataset_statistics(data, cache_dir)
+            information = information_from_statistics(statistics, config['dataset_periodicity'])
 
             # Log calculated information
-            print(f"[calculate_dataset_information] Calculated SNR: {snr.numpy()}")
-            print(f"[calculate_dataset_information] Sampling frequency: {sampling_frequency.numpy()} Hz")
-            print(f"[calculate_dataset_information] Channel capacity: {channel_capacity.numpy()} bits/second")
-            print(f"[calculate_dataset_information] Total useful information: {total_information_bits.numpy()} bits")
-            print(f"[calculate_dataset_information] Entropy: {entropy.numpy()} bits")
+            print(f"[calculate_dataset_information] Calculated SNR: {information['snr']}")
+            print(f"[calculate_dataset_information] Sampling frequency: {information['sampling_frequency']} Hz")
+            print(f"[calculate_dataset_information] Channel capacity: {information['channel_capacity']} bits/second")
+            print(f"[calculate_dataset_information] Total useful information: {information['total_information_bits']} bits")
+            print(f"[calculate_dataset_information] Entropy: {information['entropy']} bits")
+            return information
         except Exception as e:
             print(f"[calculate_dataset_information] Exception occurred: {e}")
             raise
@@ -221,7 +319,7 @@ class AutoencoderManager:
         Evaluate the autoencoder model on the provided dataset and calculate the MSE and MAE.
 
         Args:
-            data (np.ndarray): Input data to evaluate (original input data).
+            data (np.ndarray, WindowedDataset or StreamingWindowedDataset): Input data to evaluate (original input data).
             dataset_name (str): Name of the dataset (e.g., "Training" or "Validation").
             config (dict): Configuration dictionary.
 
@@ -236,7 +334,10 @@ class AutoencoderManager:
             print(f"[evaluate] Reshaped {dataset_name} data for Conv1D compatibility: {data.shape}")
 
         # Evaluate the autoencoder
-        results = self.autoencoder_model.evaluate(data, data, verbose=1)
+        if is_windowed_dataset(data):
+            results = self.autoencoder_model.evaluate(data.as_tf_dataset(config.get('batch_size', 32)), verbose=1)
+        else:
+            results = self.autoencoder_model.evaluate(data, data, verbose=1)
         mse, mae = results[0], results[1]  # Retrieve MSE (loss) and MAE
 
         print(f"[evaluate] {dataset_name} Evaluation results - MSE: {mse}, MAE: {mae}")
@@ -272,7 +373,7 @@ class AutoencoderManager:
 
         # Perform encoding
         try:
-            encoded_data = self.encoder_model.predict(data)
+            encoded_data = predict(self.encoder_model, data)
             print(f"[encode_data] Encoded data shape: {encoded_data.shape}")
             return encoded_data
         except Exception as e:
@@ -285,7 +386,7 @@ class AutoencoderManager:
    
     def decode_data(self, encoded_data, config):
         print(f"[decode_data] Decoding data with shape: {encoded_data.shape}")
-        decoded_data = self.decoder_model.predict(encoded_data)
+        decoded_data = predict(self.decoder_model, encoded_data)
 
         if not config['use_sliding_windows']:
             # Reshape decoded data for row-by-row processing
@@ -0,0 +1,273 @@
+import glob
+import json
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from app.config import DEFAULT_VALUES
+from app.config_handler import load_config, save_config, remote_save_config
+from app.config_merger import merge_config
+from app.plugin_loader import load_plugin
+
+# app/batch_runner.py
+
+# Dataset cache of a batch worker process and the data settings of its entries, see _init_batch_worker
+_worker_cache = None
+_worker_settings = None
+
+# Settings forced on jobs run in a worker pool: pool workers are daemonic processes and cannot start
+# the worker processes of a parallel interface search
+POOLED_JOB_OVERRIDES = {'search_workers': 1}
+
+# Command line arguments of the batch itself; every other argument given next to --batch_configs
+# applies to each job, replacing the value of its config file
+BATCH_SETTINGS = ('batch_configs', 'batch_workers', 'batch_summary', 'load_config', 'remote_load_config', 'clear_csv_cache')
+
+
+class DatasetCache:
+    """
+    Parsed datasets and windowed views shared by the jobs of a batch, keyed by their data settings.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """
+        Cached value for key, built with build() on the first request.
+        """
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        self._entries[key] = build()
+        return self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def collect_config_files(batch_configs):
+    """
+    Config files of a batch from comma-separated files and directories (every *.json file, sorted).
+    """
+    config_files = []
+    for path in batch_configs.split(','):
+        path = path.strip()
+        if os.path.isdir(path):
+            config_files.extend(sorted(glob.glob(os.path.join(path, '*.json'))))
+        elif path:
+            config_files.append(path)
+    return config_files
+
+
+def data_settings(config_file, overrides=None):
+    """
+    Data files and parsing options of a job, jobs with equal settings share their parsed datasets.
+    """
+    config = dict(DEFAULT_VALUES)
+    config.update(load_config(config_file))
+    config.update(overrides or {})
+    return (
+        os.path.realpath(config['input_file']) if config.get('input_file') else None,
+        os.path.realpath(config['validation_file']) if config.get('validation_file') else None,
+        bool(config.get('headers')),
+        bool(config.get('force_date'))
+    )
+
+
+def run_job(config_file, dataset_cache=None, overrides=None):
+    """
+    Run one config file as a single feature-extractor run would, writing the same debug info and config.
+
+    Args:
+        config_file (str): Configuration JSON of the job.
+        dataset_cache (DatasetCache): Datasets shared with the other jobs of the batch.
+        overrides (dict): Settings that replace the values of the config file (command line arguments
+            of the batch and POOLED_JOB_OVERRIDES).
+    """
+    file_config = load_config(config_file)
+    for key, value in (overrides or {}).items():
+        if key in file_config and file_config[key] != value:
+            print(f"[run_job] {config_file}: {key}={file_config[key]} replaced by {value}.")
+        file_config[key] = value
+    # argv=[]: the batch process's own command line must not leak into the job's configuration
+    config = merge_config(DEFAULT_VALUES, {}, {}, file_config, {}, {}, argv=[])
+    if config.get('serve_encoder') or config.get('batch_configs'):
+        raise ValueError(f"[run_job] {config_file}: serve_encoder and batch_configs cannot be run as batch jobs.")
+
+    if config.get('export_tflite'):
+        from app.tflite_export import export_tflite
+        export_tflite(config)
+    elif config['load_encoder']:
+        from app.data_processor import load_and_evaluate_encoder
+        load_and_evaluate_encoder(config)
+    elif config['load_decoder']:
+        from app.data_processor import load_and_evaluate_decoder
+        load_and_evaluate_decoder(config)
+    else:
+        from app.data_processor import run_autoencoder_pipeline
+        encoder_plugin_class, _ = load_plugin('feature_extractor.encoders', config['encoder_plugin'])
+        decoder_plugin_class, _ = load_plugin('feature_extractor.decoders', config['decoder_plugin'])
+        encoder_plugin = encoder_plugin_class()
+        decoder_plugin = decoder_plugin_class()
+        config = merge_config(DEFAULT_VALUES, encoder_plugin.plugin_params, decoder_plugin.plugin_params, file_config, {}, {}, argv=[])
+        encoder_plugin.set_params(**config)
+        decoder_plugin.set_params(**config)
+        run_autoencoder_pipeline(config, encoder_plugin, decoder_plugin, dataset_cache)
+
+        if config.get('save_config'):
+            save_config(config, config['save_config'])
+            print(f"Configuration saved to {config['save_config']}.")
+        if config.get('remote_save_config'):
+            remote_save_config(config, config['remote_save_config'], config['username'], config['password'])
+            print(f"Remote configuration saved.")
+
+
+def _run_group(jobs, dataset_cache, overrides=None):
+    """
+    Run the jobs of one data settings group, recording each job's outcome instead of stopping the batch.
+    """
+    results = []
+    for index, config_file in jobs:
+        print(f"[batch_runner] Running job {index + 1}: {config_file}")
+        start_time = time.perf_counter()
+        result = {'config_file': config_file, 'status': 'ok', 'error': None, 'worker_pid': os.getpid()}
+        try:
+            run_job(config_file, dataset_cache, overrides)
+        except Exception as e:
+            print(f"[batch_runner] Job {config_file} failed: {e}")
+            result.update(status='failed', error=str(e))
+        result['seconds'] = time.perf_counter() - start_time
+        results.append((index, result))
+    return results
+
+
+def _init_batch_worker(cpu_sets, threads_per_worker):
+    from app.parallel_search import configure_worker
+    global _worker_cache
+    configure_worker(cpu_sets, threads_per_worker)
+    _worker_cache = DatasetCache()
+
+
+def _run_group_task(task):
+    global _worker_settings
+    settings, jobs, overrides = task
+    if settings != _worker_settings:
+        _worker_cache.clear()  # Keep only the datasets of the current data settings in memory
+        _worker_settings = settings
+    return _run_group(jobs, _worker_cache, overrides)
+
+
+def split_groups(groups, num_workers):
+    """
+    Pool tasks of the data settings groups: the largest groups are halved until there is a task per
+    worker, so that a batch of few large groups still uses every worker.
+
+    Args:
+        groups (OrderedDict): Data settings to the (index, config_file) jobs sharing them.
+        num_workers (int): Worker processes.
+
+    Returns:
+        list: (settings, jobs) tasks, the parts of a group next to each other.
+    """
+    tasks = [(settings, jobs) for settings, jobs in groups.items()]
+    while len(tasks) < num_workers:
+        largest = max(range(len(tasks)), key=lambda i: len(tasks[i][1]), default=None)
+        if largest is None or len(tasks[largest][1]) < 2:
+            break
+        settings, jobs = tasks[largest]
+        middle = len(jobs) // 2
+        tasks[largest:largest + 1] = [(settings, jobs[:middle]), (settings, jobs[middle:])]
+    return tasks
+
+
+def run_batch(config_files, num_workers=1, threads_per_worker=None, overrides=None):
+    """
+    Run many config files in this process, or in a pool of warmed worker processes.
+
+    Jobs are grouped by data settings and each group runs in one process, so every group parses its
+    CSV files and builds its windowed views once. With fewer groups than workers, the largest groups
+    are split across workers, each parsing the shared files in its own dataset cache. TensorFlow, the
+    plugin registry and loaded models are initialized once per process. Pooled jobs run their interface
+    search in their worker (search_workers 1).
+
+    Args:
+        config_files (list): Configuration JSON files, one job each.
+        num_workers (int): Worker processes, 1 runs the jobs in this process.
+        threads_per_worker (int): TensorFlow threads per worker, None splits the CPUs evenly.
+        overrides (dict): Settings applied to every job, replacing the values of its config file.
+
+    Returns:
+        list: One result per job in config_files order, with config_file, status, error and seconds.
+    """
+    overrides = dict(overrides or {})
+    groups = OrderedDict()
+    for index, config_file in enumerate(config_files):
+        try:
+            settings = data_settings(config_file, overrides)
+        except (OSError, ValueError):
+            settings = ('unreadable', config_file)  # Reported as a failed job when it runs
+        groups.setdefault(settings, []).append((index, config_file))
+    print(f"[run_batch] {len(config_files)} jobs in {len(groups)} data settings groups, {num_workers} worker(s).")
+
+    results = []
+    if num_workers <= 1:
+        dataset_cache = DatasetCache()
+        for jobs in groups.values():
+            results.extend(_run_group(jobs, dataset_cache, overrides))
+            dataset_cache.clear()  # Keep only one group's datasets in memory
+        print(f"[run_batch] Dataset cache: {dataset_cache.stats()}")
+    else:
+        from app.parallel_search import worker_cpu_sets
+        threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // num_workers)
+        context = multiprocessing.get_context('spawn')  # TensorFlow is not fork-safe
+        cpu_sets = context.Queue()
+        for cores in worker_cpu_sets(num_workers):
+            cpu_sets.put(cores)
+        with context.Pool(num_workers, initializer=_init_batch_worker, initargs=(cpu_sets, threads_per_worker)) as pool:
+            tasks = split_groups(groups, num_workers)
+            print(f"[run_batch] {len(tasks)} tasks for the worker pool, each job runs its interface search in its worker process.")
+            pooled_overrides = dict(overrides, **POOLED_JOB_OVERRIDES)
+            tasks = [(settings, jobs, pooled_overrides) for settings, jobs in tasks]
+            for group_results in pool.imap_unordered(_run_group_task, tasks):
+                results.extend(group_results)
+    return [result for _, result in sorted(results, key=lambda item: item[0])]
+
+
+def run_batch_command(config, cli_args=None):
+    """
+    Run the config files in config['batch_configs'] and print (and optionally save) a summary.
+
+    Command line arguments given next to --batch_configs (e.g. --checkpoint_dir or --precision) apply
+    to every job and replace the values of its config file, except the batch's own BATCH_SETTINGS.
+
+    Args:
+        config (dict): Configuration dictionary with the batch options.
+        cli_args (dict): Arguments given explicitly on the command line, see explicit_cli_args.
+
+    Returns:
+        list: The job results of run_batch.
+    """
+    config_files = collect_config_files(config['batch_configs'])
+    overrides = {key: value for key, value in (cli_args or {}).items() if key not in BATCH_SETTINGS}
+    if overrides:
+        print(f"[run_batch_command] Command line settings applied to every job: {overrides}")
+    start_time = time.perf_counter()
+    results = run_batch(config_files, config.get('batch_workers') or 1, config.get('threads_per_worker'), overrides)
+    total_time = time.perf_counter() - start_time
+
+    print(f"\n[run_batch_command] {len(results)} jobs in {total_time:.1f}s")
+    for result in results:
+        status = result['status'] if result['error'] is None else f"{result['status']}: {result['error']}"
+        print(f"  {result['config_file']:<60}{result['seconds']:>9.1f}s  {status}")
+    if config.get('batch_summary'):
+        with open(config['batch_summary'], 'w') as f:
+            json.dump({'total_seconds': total_time, 'jobs': results}, f, indent=4)
+        print(f"[run_batch_command] Batch summary saved to {config['batch_summary']}")
+    return results
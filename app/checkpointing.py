@@ -0,0 +1,239 @@
+import json
+import os
+import threading
+import time
+import numpy as np
+from keras.callbacks import Callback
+
+# app/checkpointing.py
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(checkpoint_dir, interface_size):
+    """
+    Checkpoint file of one interface size candidate inside the run directory.
+    """
+    return os.path.join(checkpoint_dir, f"interface_{interface_size}", 'checkpoint.npz')
+
+
+def save_checkpoint(file_path, snapshot):
+    """
+    Write a snapshot atomically: a crash during the write leaves the previous checkpoint intact.
+
+    Args:
+        file_path (str): Checkpoint .npz file.
+        snapshot (dict): weights, optimizer and best_weights lists of arrays (best_weights may be None)
+            and a JSON-serializable meta dict.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+    arrays = {'meta': np.array(json.dumps(snapshot['meta']))}
+    for group in ('weights', 'optimizer', 'best_weights'):
+        for i, value in enumerate(snapshot.get(group) or []):
+            arrays[f"{group}_{i}"] = value
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, 'wb') as f:
+        np.savez(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)
+
+
+def load_checkpoint(file_path):
+    """
+    Read a checkpoint written by save_checkpoint.
+
+    Returns:
+        dict: The snapshot, or None if there is no checkpoint at file_path.
+    """
+    if not os.path.exists(file_path):
+        return None
+    with np.load(file_path) as archive:
+        meta = json.loads(str(archive['meta']))
+        snapshot = {'meta': meta}
+        for group in ('weights', 'optimizer', 'best_weights'):
+            snapshot[group] = [archive[f"{group}_{i}"] for i in range(meta['counts'][group])]
+    if meta['counts']['best_weights'] == 0:
+        snapshot['best_weights'] = None
+    return snapshot
+
+
+class _CheckpointWriter:
+    """
+    Background thread writing the latest submitted snapshot, so that disk writes do not stall training.
+
+    A snapshot submitted while the previous one is still pending replaces it, only the newest state matters.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.writes = 0
+        self.write_seconds = 0.0
+        self._pending = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='checkpoint-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot):
+        with self._condition:
+            self._pending = snapshot
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                snapshot, self._pending = self._pending, None
+            start_time = time.perf_counter()
+            try:
+                save_checkpoint(self.file_path, snapshot)
+                self.writes += 1
+                self.write_seconds += time.perf_counter() - start_time
+                print(f"[CheckpointWriter] Saved epoch {snapshot['meta']['epoch']} to {self.file_path}")
+            except Exception as e:
+                print(f"[CheckpointWriter] Failed to save checkpoint {self.file_path}: {e}")
+
+    def close(self):
+        """
+        Write the pending snapshot, if any, and stop the thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+
+def restore_optimizer(model, values):
+    """
+    Create the optimizer's slot variables for the model and assign them the checkpointed values.
+
+    Returns:
+        bool: Whether the optimizer state was restored; False leaves a freshly initialized optimizer.
+    """
+    optimizer = model.optimizer
+    optimizer.build(model.trainable_variables)
+    variables = optimizer.variables
+    if len(variables) != len(values) or any(tuple(v.shape) != value.shape for v, value in zip(variables, values)):
+        print("[restore_optimizer] Checkpointed optimizer state does not match the model's optimizer, it starts fresh.")
+        return False
+    for variable, value in zip(variables, values):
+        variable.assign(value)
+    return True
+
+
+class TrainingCheckpoint(Callback):
+    """
+    Periodically checkpoints the model weights, the optimizer state, the epoch counter, the loss history
+    and the early stopping and threshold stopping states, and restores them when training resumes.
+
+    The snapshot is copied to host memory at the end of an epoch (on the training thread) and written
+    by a background thread. A final checkpoint marked completed is written when training ends; a resumed
+    run continues it up to its own number of epochs unless that training stopped early.
+    """
+
+    def __init__(self, file_path, every_epochs=1, early_stopping=None, resume_from=None, threshold_stopping=None):
+        """
+        Args:
+            file_path (str): Checkpoint .npz file.
+            every_epochs (int): Epochs between checkpoints.
+            early_stopping (EarlyStopping): Early stopping callback whose state is checkpointed, listed
+                before this callback so that its on_train_begin reset happens before the restore.
+            resume_from (dict): Snapshot of load_checkpoint to continue from, None starts from scratch.
+            threshold_stopping (ThresholdStopping): Threshold stopping callback whose validation MAE
+                projection is checkpointed, also listed before this callback.
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.every_epochs = max(1, int(every_epochs))
+        self.early_stopping = early_stopping
+        self.resume_from = resume_from
+        self.threshold_stopping = threshold_stopping
+        self.history = dict(resume_from['meta']['history']) if resume_from else {}
+        self._writer = None
+
+    @property
+    def initial_epoch(self):
+        """
+        Epoch that fit should start from, 0 without a checkpoint to resume.
+        """
+        return self.resume_from['meta']['epoch'] if self.resume_from else 0
+
+    @property
+    def stopped_early(self):
+        """
+        Whether the resumed training already ended before its last epoch (e.g. by early stopping) and
+        should not train again.
+        """
+        return bool(self.resume_from and self.resume_from['meta'].get('stopped_early'))
+
+    def restore(self, model):
+        """
+        Load the checkpointed weights and optimizer state into model (compiled with the same optimizer),
+        and the checkpointed state of the stopping callbacks.
+        """
+        model.set_weights(self.resume_from['weights'])
+        if self.resume_from['optimizer']:
+            restore_optimizer(model, self.resume_from['optimizer'])
+        early_stopping_state = self.resume_from['meta'].get('early_stopping')
+        if self.early_stopping is not None and early_stopping_state:
+            for name, value in early_stopping_state.items():
+                setattr(self.early_stopping, name, value)
+            self.early_stopping.best_weights = self.resume_from['best_weights']
+        threshold_stopping_state = self.resume_from['meta'].get('threshold_stopping')
+        if self.threshold_stopping is not None and threshold_stopping_state:
+            self.threshold_stopping.set_state(threshold_stopping_state)
+        print(f"[TrainingCheckpoint] Resumed from epoch {self.resume_from['meta']['epoch']} of {self.file_path}")
+
+    def on_train_begin(self, logs=None):
+        self._epochs = self.params.get('epochs') if self.params else None
+        if self.resume_from:
+            self.restore(self.model)
+        self._writer = _CheckpointWriter(self.file_path)
+
+    def on_epoch_end(self, epoch, logs=None):
+        for name, value in (logs or {}).items():
+            self.history.setdefault(name, []).append(float(value))
+        if (epoch + 1) % self.every_epochs == 0:
+            self._writer.submit(self.snapshot(epoch + 1))
+
+    def on_train_end(self, logs=None):
+        # The final weights, after any early stopping restore, are what a resumed run gets back
+        self._writer.submit(self.snapshot(len(self.history.get('loss', [])), completed=True,
+                                          stopped_early=bool(self.model.stop_training)))
+        self._writer.close()
+        print(f"[TrainingCheckpoint] {self._writer.writes} checkpoint(s) written in {self._writer.write_seconds:.2f}s in the background")
+
+    def snapshot(self, epoch, completed=False, stopped_early=False):
+        """
+        Host copy of the training state after epoch completed epochs.
+        """
+        best_weights = None
+        early_stopping_state = None
+        if self.early_stopping is not None:
+            early_stopping_state = {
+                'wait': int(self.early_stopping.wait),
+                'best': float(self.early_stopping.best),
+                'best_epoch': int(self.early_stopping.best_epoch),
+                'stopped_epoch': int(self.early_stopping.stopped_epoch)
+            }
+            best_weights = self.early_stopping.best_weights
+        optimizer_values = [variable.numpy() for variable in self.model.optimizer.variables]
+        weights = self.model.get_weights()
+        meta = {
+            'version': CHECKPOINT_VERSION,
+            'epoch': epoch,
+            'epochs': self._epochs,
+            'completed': completed,
+            'stopped_early': stopped_early,
+            'history': self.history,
+            'early_stopping': early_stopping_state,
+            'threshold_stopping': self.threshold_stopping.get_state() if self.threshold_stopping is not None else None,
+            'counts': {'weights': len(weights), 'optimizer': len(optimizer_values), 'best_weights': len(best_weights or [])},
+            'saved_at': time.time()
+        }
+        return {'meta': json.loads(json.dumps(meta)), 'weights': weights, 'optimizer': optimizer_values,
+                'best_weights': [np.array(w) for w in best_weights] if best_weights else None}
@@ -29,5 +29,38 @@ def parse_args():
     parser.add_argument('--quiet_mode', action='store_true', help='Suppress output messages.')
     parser.add_argument('--force_date', action='store_true', help='Include date in the output CSV files.')
     parser.add_argument('--incremental_search', action='store_true', help='Enable incremental search for interface size.')
+    parser.add_argument('--warm_start', action='store_true', help='Initialize each interface size candidate from the previous candidate weights.')
+    parser.add_argument('--search_strategy', type=str, choices=['linear', 'bracket', 'golden'], help='Interface size search strategy: linear, bracket or golden.')
+    parser.add_argument('--search_workers', type=int, help='Number of interface size candidates trained in parallel worker processes.')
+    parser.add_argument('--threads_per_worker', type=int, help='TensorFlow threads per search worker process.')
+    parser.add_argument('--trace_memory', action='store_true', help='Record tracemalloc memory peaks per pipeline stage in the debug info.')
     parser.add_argument('--headers', action='store_true', help='Indicate if the CSV file has headers.')
+    parser.add_argument('--precision', type=str, choices=['float32', 'bfloat16', 'mixed_float16'], help='Precision policy of the models: float32, bfloat16 or mixed_float16.')
+    parser.add_argument('--execution_mode', type=str, choices=['eager', 'graph', 'xla'], help='Training execution mode: eager (for debugging), graph or xla.')
+    parser.add_argument('--csv_cache_dir', type=str, help='Directory of the binary cache of parsed CSV files and dataset statistics (disabled unless set).')
+    parser.add_argument('--csv_cache_max_bytes', type=int, help='Maximum size in bytes of the parsed CSV cache.')
+    parser.add_argument('--no_csv_cache', action='store_true', help='Bypass the parsed CSV cache.')
+    parser.add_argument('--clear_csv_cache', action='store_true', help='Clear the parsed CSV cache before running.')
+    parser.add_argument('--plugin_index_path', type=str, help='JSON file persisting the plugin registry across runs.')
+    parser.add_argument('--serve_encoder', action='store_true', help='Serve the --load_encoder models (comma-separated, optionally name=path) over HTTP.')
+    parser.add_argument('--server_host', type=str, help='Host of the encoding server.')
+    parser.add_argument('--server_port', type=int, help='Port of the encoding server.')
+    parser.add_argument('--server_max_batch_size', type=int, help='Samples per micro-batch of the encoding server.')
+    parser.add_argument('--server_max_latency_ms', type=float, help='Micro-batching latency budget of the encoding server in milliseconds.')
+    parser.add_argument('--batch_configs', type=str, help='Comma-separated config files or directories of JSON configs to run as one batch. Other arguments given with it apply to every job.')
+    parser.add_argument('--batch_workers', type=int, help='Worker processes running the batch jobs.')
+    parser.add_argument('--batch_summary', type=str, help='JSON file with the status and time of every batch job.')
+    parser.add_argument('--model_cache_max_bytes', type=int, help='Memory budget in bytes of the in-process cache of loaded models.')
+    parser.add_argument('--checkpoint_dir', type=str, help='Run directory for training checkpoints, models and the search ledger of each interface size.')
+    parser.add_argument('--checkpoint_every', type=int, help='Epochs between training checkpoints.')
+    parser.add_argument('--resume', action='store_true', help='Skip the interface sizes completed in --checkpoint_dir and continue training from the last checkpoint.')
+    parser.add_argument('--threshold_stopping', action='store_true', help='Stop training once validation MAE meets the threshold, or abandon candidates projected to miss it.')
+    parser.add_argument('--threshold_check_every', type=int, help='Epochs between the validation MAE checks of --threshold_stopping.')
+    parser.add_argument('--threshold_validation_samples', type=int, help='Validation windows evenly sampled per --threshold_stopping check.')
+    parser.add_argument('--export_tflite', action='store_true', help='Export --load_encoder (and --load_decoder) to TFLite and report error, size and latency.')
+    parser.add_argument('--tflite_quantization', type=str, choices=['float32', 'float16', 'int8'], help='TFLite export quantization: float32, float16 or int8.')
+    parser.add_argument('--tflite_output', type=str, help='Output file of the TFLite encoder.')
+    parser.add_argument('--tflite_calibration_samples', type=int, help='Windows of the input file used to calibrate int8 quantization.')
+    parser.add_argument('--tflite_evaluation_samples', type=int, help='Windows of the input file used to compare TFLite and Keras outputs.')
+    parser.add_argument('--stream_chunk_size', type=int, help='Stream CSV files in chunks of this many rows instead of loading them whole.')
     return parser.parse_known_args()
@@ -11,6 +11,7 @@ DEFAULT_VALUES = {
     'encoder_plugin': 'cnn',
     'decoder_plugin': 'cnn',
     'use_sliding_windows': False,
+    'lazy_windows': True,  # Slice sliding windows per batch instead of materializing them
     'window_size': 128, 
     'threshold_error': 0.5,
     'initial_size': 16,
@@ -26,10 +27,43 @@ DEFAULT_VALUES = {
     'quiet_mode': False,
     'force_date': True,
     'incremental_search': True, # if false performs decresing search instead
+    'warm_start': False,  # Initialize each interface size candidate from the previous candidate's weights
+    'search_strategy': 'linear',  # Interface size search: linear, bracket (exponential then binary) or golden (golden-section)
+    'search_workers': 1,  # Candidates trained at once in a process pool, 1 trains them sequentially in this process
+    'threads_per_worker': None,  # TensorFlow threads per search worker, None splits the CPUs evenly between workers
+    'trace_memory': False,  # Record tracemalloc peaks per pipeline stage in the debug info (slower)
     'headers': True,
+    'csv_cache_dir': None,  # Binary cache of parsed CSV files and dataset statistics, None disables it
+    'csv_cache_max_bytes': 4 * 1024 ** 3,  # Least recently used entries are evicted beyond this size
+    'no_csv_cache': False,  # Bypass the parsed CSV cache
+    'clear_csv_cache': False,  # Empty the parsed CSV cache before running
+    'plugin_index_path': None,  # JSON file persisting the plugin registry across runs, None keeps it in memory only
+    'serve_encoder': False,  # Serve the --load_encoder models over HTTP instead of encoding the input file
+    'server_host': '127.0.0.1',
+    'server_port': 8765,
+    'server_max_batch_size': 256,  # Samples per micro-batch before it runs without waiting
+    'server_max_latency_ms': 5.0,  # Longest time a request waits for others to join its micro-batch
+    'batch_configs': None,  # Comma-separated config files or directories of *.json configs run as one batch in this process
+    'batch_workers': 1,  # Worker processes of a batch, 1 runs the jobs sequentially in this process
+    'batch_summary': None,  # JSON file with the status and time of every batch job
+    'model_cache_max_bytes': 2 * 1024 ** 3,  # Memory budget of the loaded models kept in the process for repeated evaluations
+    'checkpoint_dir': None,  # Run directory for training checkpoints, models and the ledger of completed interface sizes, None disables them
+    'checkpoint_every': 1,  # Epochs between training checkpoints, written on a background thread
+    'resume': False,  # Skip the interface sizes completed in checkpoint_dir and continue training from the last checkpoint
+    'threshold_stopping': False,  # Stop training once validation MAE meets threshold_error, or abandon a candidate whose learning curve extrapolates above it
+    'threshold_check_every': 5,  # Epochs between the validation MAE checks of threshold_stopping
+    'threshold_validation_samples': 2000,  # Validation windows evenly sampled per check, None uses all (a met threshold is confirmed on all)
+    'export_tflite': False,  # Convert --load_encoder (and --load_decoder) to TFLite instead of encoding the input file
+    'tflite_quantization': 'float32',  # float32, float16 (weights) or int8 (full integer, calibrated on --input_file)
+    'tflite_output': None,  # TFLite encoder file, None writes <encoder>.<quantization>.tflite next to the encoder
+    'tflite_calibration_samples': 200,  # Windows of --input_file used to calibrate int8 quantization
+    'tflite_evaluation_samples': 1000,  # Windows of --input_file used to compare the TFLite and Keras outputs
+    'stream_chunk_size': None,  # Rows per chunk to stream CSV files instead of loading them, None loads them whole
     'epochs': 200,  # Add epochs here
     'batch_size': 64,  # Add batch_size here
     'learning_rate': 0.001,  # Add learning_rate here
+    'execution_mode': 'graph',  # eager (debugging), graph or xla (jit_compile)
+    'precision': 'float32',  # float32, bfloat16 (CPUs with AVX512_BF16/AMX) or mixed_float16
     'dataset_periodicity': '1h'  # Add dataset_periodicity here, can be 1m, 5m, 15m, 30m, 1h, 4h, daily
 }
 
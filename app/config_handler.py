@@ -2,9 +2,8 @@
 
 import json
 import sys
-import requests
 from app.config import DEFAULT_VALUES
-from app.plugin_loader import load_plugin
+from app.plugin_loader import get_plugin_params
 
 def load_config(file_path):
     with open(file_path, 'r') as f:
@@ -12,9 +11,8 @@ def load_config(file_path):
     return config
 
 def get_plugin_default_params(plugin_name, plugin_type):
-    plugin_class, _ = load_plugin(plugin_type, plugin_name)
-    plugin_instance = plugin_class()
-    return plugin_instance.plugin_params
+    # Read from the plugin registry, without importing or instantiating the plugin
+    return get_plugin_params(plugin_type, plugin_name)
 
 def compose_config(config):
     encoder_plugin_name = config.get('encoder_plugin', DEFAULT_VALUES.get('encoder_plugin'))
@@ -46,6 +44,7 @@ def save_debug_info(debug_info, path='debug_out.json'):
         json.dump(debug_info, f, indent=4)
 
 def remote_save_config(config, url, username, password):
+    import requests  # Imported on use to keep CLI startup fast
     config_to_save = compose_config(config)
     try:
         response = requests.post(
@@ -60,6 +59,7 @@ def remote_save_config(config, url, username, password):
         return False
     
 def remote_load_config(url, username=None, password=None):
+    import requests  # Imported on use to keep CLI startup fast
     try:
         if username and password:
             response = requests.get(url, auth=(username, password))
@@ -73,6 +73,7 @@ def remote_load_config(url, username=None, password=None):
         return None
 
 def remote_log(config, debug_info, url, username, password):
+    import requests  # Imported on use to keep CLI startup fast
     config_to_save = compose_config(config)
     try:
         data = {
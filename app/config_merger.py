@@ -15,7 +15,24 @@ def convert_type(value):
         except ValueError:
             return value
 
-def merge_config(defaults, encoder_plugin_params, decoder_plugin_params, config, cli_args, unknown_args):
+def explicit_cli_args(cli_args, unknown_args, argv=None):
+    """
+    Arguments given explicitly on the command line (argv, sys.argv by default), the ones that step 4
+    of merge_config applies, including a positional input file.
+    """
+    argv = sys.argv if argv is None else argv
+    explicit = {}
+    for key in [arg.lstrip('--') for arg in argv if arg.startswith('--')]:
+        if key in cli_args:
+            explicit[key] = cli_args[key]
+        elif key in unknown_args:
+            explicit[key] = convert_type(unknown_args[key])
+    if len(argv) > 1 and not argv[1].startswith('--'):
+        explicit['input_file'] = argv[1]
+    return explicit
+
+def merge_config(defaults, encoder_plugin_params, decoder_plugin_params, config, cli_args, unknown_args, argv=None):
+    argv = sys.argv if argv is None else argv  # An empty list merges without command line arguments
     
     # Step 1: Start with default values from config.py
     merged_config = defaults.copy()
@@ -40,7 +57,7 @@ def merge_config(defaults, encoder_plugin_params, decoder_plugin_params, config,
     print(f"Actual Step 3 Output: {merged_config}")
 
     # Step 4: Merge with CLI arguments (ensure CLI args always override)
-    cli_keys = [arg.lstrip('--') for arg in sys.argv if arg.startswith('--')]
+    cli_keys = [arg.lstrip('--') for arg in argv if arg.startswith('--')]
     for key in cli_keys:
         if key in cli_args:
             print(f"Step 4 merging from CLI args: {key} = {cli_args[key]}")
@@ -51,8 +68,8 @@ def merge_config(defaults, encoder_plugin_params, decoder_plugin_params, config,
             merged_config[key] = value
     
     # Special handling for csv_file
-    if len(sys.argv) > 1 and not sys.argv[1].startswith('--'):
-        merged_config['input_file'] = sys.argv[1]
+    if len(argv) > 1 and not argv[1].startswith('--'):
+        merged_config['input_file'] = argv[1]
     
     print(f"Actual Step 4 Output: {merged_config}")
     
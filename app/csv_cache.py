@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import numpy as np
+import pandas as pd
+
+# app/csv_cache.py
+
+CACHE_FORMAT_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_fingerprint(file_path, headers, force_date):
+    """
+    Cache key for a parsed CSV: file size, mtime, content hash and the parsing options.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        headers (bool): load_csv headers option.
+        force_date (bool): load_csv force_date option.
+
+    Returns:
+        str: Hex digest identifying the parsed frame.
+    """
+    stat = os.stat(file_path)
+    content_hash = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            content_hash.update(chunk)
+    key = {
+        'version': CACHE_FORMAT_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'content': content_hash.hexdigest(),
+        'headers': bool(headers),
+        'force_date': bool(force_date)
+    }
+    return hashlib.blake2b(json.dumps(key, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def _entry_size(entry_path):
+    return sum(os.path.getsize(os.path.join(entry_path, name)) for name in os.listdir(entry_path))
+
+
+def _cache_entries(cache_dir):
+    """
+    (last use time, size in bytes, path) of every cache entry: parsed frame directories and the
+    cached dataset statistics files. Entries deleted meanwhile by another process are skipped.
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        entry_path = os.path.join(cache_dir, name)
+        meta_path = os.path.join(entry_path, 'meta.json')
+        try:
+            if os.path.isdir(entry_path) and os.path.exists(meta_path):
+                entries.append((os.path.getmtime(meta_path), _entry_size(entry_path), entry_path))
+        except FileNotFoundError:
+            continue
+    statistics_dir = os.path.join(cache_dir, 'dataset_information')
+    try:
+        statistics_files = os.listdir(statistics_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        statistics_files = []
+    for name in statistics_files:
+        if not name.endswith('.json'):
+            continue
+        file_path = os.path.join(statistics_dir, name)
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, file_path))
+    return entries
+
+
+def _remove_entry(entry_path):
+    if os.path.isdir(entry_path):
+        shutil.rmtree(entry_path, ignore_errors=True)
+    else:
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
+
+
+def load_cached_frame(cache_dir, key):
+    """
+    Load a cached frame, or return None on a cache miss.
+
+    Each column is stored as its own binary .npy file, so a hit costs little more than reading the
+    raw column bytes.
+    """
+    entry_path = os.path.join(cache_dir, key)
+    meta_path = os.path.join(entry_path, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        columns = {}
+        for i, name in enumerate(meta['columns']):
+            columns[name] = np.load(os.path.join(entry_path, f'col_{i}.npy'), allow_pickle=False)
+        if meta['index'] == 'range':
+            index = pd.RangeIndex(meta['num_rows'])
+        else:
+            index = pd.Index(np.load(os.path.join(entry_path, 'index.npy'), allow_pickle=False), name=meta['index_name'])
+        data = pd.DataFrame(columns, index=index)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[csv_cache] Ignoring unreadable cache entry {entry_path}: {e}")
+        shutil.rmtree(entry_path, ignore_errors=True)
+        return None
+    # Touch the entry so LRU eviction keeps recently used frames
+    os.utime(meta_path)
+    return data
+
+
+def store_cached_frame(cache_dir, key, data, max_bytes):
+    """
+    Store a parsed frame under key and evict least recently used entries beyond max_bytes.
+
+    Frames whose index or columns cannot be stored without pickling are not cached.
+    """
+    if not all(isinstance(col, str) for col in data.columns) or len(set(data.columns)) != len(data.columns):
+        print("[csv_cache] Frame has non-string or duplicate column names, not caching it.")
+        return
+    if any(data[col].dtype == object for col in data.columns) or data.index.dtype == object:
+        print("[csv_cache] Frame has object columns or index, not caching it.")
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    entry_path = os.path.join(cache_dir, key)
+    tmp_path = f"{entry_path}.tmp{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    try:
+        for i, col in enumerate(data.columns):
+            np.save(os.path.join(tmp_path, f'col_{i}.npy'), data[col].to_numpy(), allow_pickle=False)
+        is_range_index = isinstance(data.index, pd.RangeIndex) and data.index.start == 0 and data.index.step == 1
+        if not is_range_index:
+            np.save(os.path.join(tmp_path, 'index.npy'), data.index.to_numpy(), allow_pickle=False)
+        meta = {
+            'columns': list(data.columns),
+            'index': 'range' if is_range_index else 'array',
+            'index_name': data.index.name,
+            'num_rows': len(data),
+            'created': time.time()
+        }
+        with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+        shutil.rmtree(entry_path, ignore_errors=True)
+        os.replace(tmp_path, entry_path)  # Publish the entry atomically
+    except (OSError, ValueError) as e:
+        print(f"[csv_cache] Failed to cache frame: {e}")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        return
+    evict_cache(cache_dir, max_bytes)
+
+
+def evict_cache(cache_dir, max_bytes):
+    """
+    Delete least recently used entries until the cache directory holds at most max_bytes, counting
+    the parsed frames and the cached dataset statistics.
+    """
+    if max_bytes is None or not os.path.isdir(cache_dir):
+        return
+    try:
+        entries = _cache_entries(cache_dir)
+    except FileNotFoundError:
+        return  # Cleared by another process
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, entry_path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        print(f"[csv_cache] Evicting {entry_path} ({size} bytes)")
+        _remove_entry(entry_path)
+        total_bytes -= size
+
+
+def clear_cache(cache_dir):
+    """
+    Remove the parsed frame entries and the cached dataset statistics of the cache directory, and the
+    temporary directories of interrupted writes. Other files are left in place, the directories are
+    removed once they are empty.
+    """
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return
+    removed = 0
+    for name in os.listdir(cache_dir):
+        entry_path = os.path.join(cache_dir, name)
+        is_entry = os.path.exists(os.path.join(entry_path, 'meta.json'))
+        is_temporary = '.tmp' in name
+        if os.path.isdir(entry_path) and (is_entry or is_temporary):
+            shutil.rmtree(entry_path, ignore_errors=True)
+            removed += 1
+    statistics_dir = os.path.join(cache_dir, 'dataset_information')
+    if os.path.isdir(statistics_dir):
+        for name in os.listdir(statistics_dir):
+            if name.endswith('.json') or '.tmp' in name:
+                try:
+                    os.remove(os.path.join(statistics_dir, name))
+                    removed += 1
+                except (FileNotFoundError, IsADirectoryError):
+                    continue
+        try:
+            os.rmdir(statistics_dir)
+        except OSError:
+            pass  # Holds other files
+    try:
+        os.rmdir(cache_dir)
+    except OSError:
+        pass  # Holds other files
+    print(f"[csv_cache] Cleared {removed} entries from cache directory {cache_dir}")
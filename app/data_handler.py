@@ -1,41 +1,77 @@
+import numpy as np
 import pandas as pd
 from app.reconstruction import unwindow_data
+from app.csv_cache import file_fingerprint, load_cached_frame, store_cached_frame
 
 # app/data_handler.py
 
-def load_csv(file_path, headers=False, force_date=False):
-    try:
-        if headers:
-            if force_date:
-                # Assume the first column is 'date'
-                data = pd.read_csv(file_path, sep=',', parse_dates=[0], dayfirst=True)
-                data.set_index(data.columns[0], inplace=True)
-                data.index.name = 'date'
-                # Convert all other columns to numeric, coercing errors to NaN
-                for col in data.columns:
-                    data[col] = pd.to_numeric(data[col], errors='coerce')
-            else:
-                # Headers present but no date column
-                data = pd.read_csv(file_path, sep=',', dayfirst=True)
-                # Convert all columns to numeric, coercing errors to NaN
-                for col in data.columns:
-                    data[col] = pd.to_numeric(data[col], errors='coerce')
+def load_csv(file_path, headers=False, force_date=False, cache_dir=None, cache_max_bytes=None):
+    """
+    Load a CSV file into a DataFrame with numeric columns.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        headers (bool): Whether the file has a header row.
+        force_date (bool): Whether the first column is a date to use as index.
+        cache_dir (str): Optional directory of the binary parsed-frame cache, None disables caching.
+        cache_max_bytes (int): Size bound of the cache directory, least recently used entries are evicted.
+
+    Returns:
+        pd.DataFrame: Parsed data.
+    """
+    if cache_dir:
+        cache_key = file_fingerprint(file_path, headers, force_date)
+        data = load_cached_frame(cache_dir, cache_key)
+        if data is not None:
+            print(f"Loaded {file_path} from CSV cache {cache_dir}")
+            return data
+    data = parse_csv(file_path, headers=headers, force_date=force_date)
+    if cache_dir:
+        store_cached_frame(cache_dir, cache_key, data, cache_max_bytes)
+    return data
+
+
+
+def _read_csv_options(headers, force_date):
+    """
+    Keyword arguments of pd.read_csv for the headers/force_date combination.
+    """
+    options = {'sep': ',', 'dayfirst': True}
+    if not headers:
+        options['header'] = None
+    if force_date:
+        # The first column is 'date'
+        options['parse_dates'] = [0]
+    return options
+
+
+def _format_frame(data, headers, force_date):
+    """
+    Name the columns, set the date index and convert the feature columns of a freshly read frame.
+    """
+    if headers:
+        if force_date:
+            # Assume the first column is 'date'
+            data.set_index(data.columns[0], inplace=True)
+            data.index.name = 'date'
+    else:
+        if force_date:
+            # No headers but the first column is 'date'
+            data.columns = ['date'] + [f'col_{i}' for i in range(1, len(data.columns))]
+            data.set_index('date', inplace=True)
         else:
-            if force_date:
-                # No headers but the first column is 'date'
-                data = pd.read_csv(file_path, header=None, sep=',', parse_dates=[0], dayfirst=True)
-                data.columns = ['date'] + [f'col_{i}' for i in range(1, len(data.columns))]
-                data.set_index('date', inplace=True)
-                # Convert all other columns to numeric, coercing errors to NaN
-                for col in data.columns:
-                    data[col] = pd.to_numeric(data[col], errors='coerce')
-            else:
-                # No headers and no date column
-                data = pd.read_csv(file_path, header=None, sep=',', dayfirst=True)
-                data.columns = [f'col_{i}' for i in range(len(data.columns))]
-                # Convert all columns to numeric, coercing errors to NaN
-                for col in data.columns:
-                    data[col] = pd.to_numeric(data[col], errors='coerce')
+            # No headers and no date column
+            data.columns = [f'col_{i}' for i in range(len(data.columns))]
+    # Convert all feature columns to numeric, coercing errors to NaN
+    for col in data.columns:
+        data[col] = pd.to_numeric(data[col], errors='coerce')
+    return data
+
+
+def parse_csv(file_path, headers=False, force_date=False):
+    try:
+        data = pd.read_csv(file_path, **_read_csv_options(headers, force_date))
+        data = _format_frame(data, headers, force_date)
     except Exception as e:
         print(f"An error occurred while loading the CSV: {e}")
         raise
@@ -43,6 +79,40 @@ def load_csv(file_path, headers=False, force_date=False):
 
 
 
+def load_csv_chunks(file_path, headers=False, force_date=False, chunk_size=100000, overlap=0, dtype=np.float32):
+    """
+    Stream a CSV file as typed chunks so files larger than memory can be processed.
+
+    Each chunk after the first starts with the last `overlap` rows of the previous one, so with
+    overlap = window_size - 1 every sliding window of the file lies in exactly one chunk.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        headers (bool): Whether the file has a header row.
+        force_date (bool): Whether the first column is a date to use as index.
+        chunk_size (int): Number of new rows read per chunk.
+        overlap (int): Number of trailing rows of the previous chunk prepended to each chunk.
+        dtype (np.dtype): Dtype of the feature columns.
+
+    Yields:
+        pd.DataFrame: Chunk with its date index (if any) and feature columns of the given dtype.
+    """
+    previous_tail = None
+    try:
+        with pd.read_csv(file_path, chunksize=chunk_size, **_read_csv_options(headers, force_date)) as reader:
+            for chunk in reader:
+                chunk = _format_frame(chunk, headers, force_date).astype(dtype)
+                if previous_tail is not None:
+                    chunk = pd.concat([previous_tail, chunk])
+                if overlap > 0:
+                    previous_tail = chunk.iloc[-overlap:]
+                yield chunk
+    except Exception as e:
+        print(f"An error occurred while streaming the CSV: {e}")
+        raise
+
+
+
 # app/data_handler.py
 
 def write_csv(file_path, data, include_date=True, headers=True, force_date=False):
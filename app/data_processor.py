@@ -2,99 +2,245 @@ import tensorflow as tf
 import pandas as pd
 import numpy as np
 import os
+import shutil
 import time
 from app.autoencoder_manager import AutoencoderManager
-from app.data_handler import load_csv, write_csv
+from app.data_handler import load_csv, load_csv_chunks, write_csv
 from app.reconstruction import unwindow_data
 from app.config_handler import save_debug_info, remote_log
+from app.windowing import create_sliding_windows, to_2d_array
+from app.precision import DATA_DTYPE
+from app.windowed_dataset import WindowedDataset, StreamingWindowedDataset
+from app.interface_search import SEARCH_STRATEGIES, candidate_sizes, meets_threshold
+from app.parallel_search import parallel_interface_search
+from app.search_ledger import SearchLedger, ledger_path, candidate_dir
+from app.instrumentation import start_recording, stop_recording, stage
+from app.data_profile import profile_frame, with_profile
+from app.model_cache import load_cached_model
+from app.fast_inference import predict
 from keras.models import Sequential, Model, load_model
 
-def create_sliding_windows(data, window_size):
+# app/data_processor.py
+
+def load_input_csv(file_path, config):
     """
-    Create sliding windows for the entire dataset, returning a 3D array suitable for Conv1D.
-    
+    Load a CSV with the parsing and binary cache options from the configuration.
+
     Args:
-        data (pd.DataFrame): Dataframe containing the time series features.
-        window_size (int): The length of the sliding window.
-    
+        file_path (str): Path to the CSV file.
+        config (dict): Configuration dictionary.
+
     Returns:
-        np.ndarray: Array with shape (num_samples, window_size, num_features).
+        pd.DataFrame: Parsed data with float32 feature columns.
     """
-    data_array = data.to_numpy()  # Convert dataframe to numpy array
-    num_features = data_array.shape[1]  # Number of columns/features
-    num_samples = data_array.shape[0] - window_size + 1  # Calculate the number of sliding windows
-    
-    # Create a 3D array to store the windows
-    windows = np.zeros((num_samples, window_size, num_features))
-    
-    # Slide the window over the data and create the 3D array
-    for i in range(num_samples):
-        windows[i] = data_array[i:i+window_size]  # Slice window_size rows across all columns
-    
-    return windows
+    cache_dir = None if config.get('no_csv_cache', False) else config.get('csv_cache_dir')
+    data = load_csv(
+        file_path=file_path,
+        headers=config.get('headers', False),
+        force_date=config.get('force_date', False),
+        cache_dir=cache_dir,
+        cache_max_bytes=config.get('csv_cache_max_bytes')
+    )
+    # Cast once on the 2D frame so windows and model inputs never go through float64
+    return data.astype(DATA_DTYPE)
 
 
-# app/data_processor.py
+def dataset_key(file_path, config, *settings):
+    """
+    Key of a dataset loaded from file_path: the file's resolved path, size and mtime, its parsing options
+    and any further settings (e.g. windowing) of the view built from it.
+    """
+    real_path = os.path.realpath(file_path)
+    stat = os.stat(real_path)
+    return (real_path, stat.st_size, stat.st_mtime_ns, bool(config.get('headers', False)), bool(config.get('force_date', False))) + settings
+
+
+def _cached(dataset_cache, key, build):
+    return build() if dataset_cache is None else dataset_cache.get(key, build)
+
+
+def _load_profiled(file_path, config, dataset_name, dataset_cache=None):
+    def load():
+        with stage('load_csv', file=file_path):
+            data = load_input_csv(file_path, config)
+        with stage('profile', dataset=dataset_name):
+            profile = profile_frame(data)
+        return data, profile
+    return _cached(dataset_cache, dataset_key(file_path, config), load)
+
 
-def process_data(config):
+def _windowed(data, profile, file_path, config, dataset_name, dataset_cache=None):
+    window_size, lazy_windows = config['window_size'], config.get('lazy_windows', True)
+
+    def build():
+        with stage('windowing', dataset=dataset_name):
+            # Contiguous 2D series shared by the windowed views of every window size
+            series = _cached(dataset_cache, dataset_key(file_path, config, 'series'), lambda: np.ascontiguousarray(to_2d_array(data)))
+            if lazy_windows:
+                # Keep only the 2D series, windows are sliced per batch during training
+                return WindowedDataset(series, window_size, profile=profile)
+            return with_profile(create_sliding_windows(series, window_size), profile)
+    return _cached(dataset_cache, dataset_key(file_path, config, 'windows', window_size, lazy_windows), build)
+
+
+def process_data(config, dataset_cache=None):
     """
     Process the data based on the configuration.
     
     Args:
         config (dict): Configuration dictionary with parameters for processing.
+        dataset_cache (DatasetCache): Cache sharing parsed datasets and windowed views between jobs
+            with the same data settings, None to load them for this run only.
     
     Returns:
         tuple: Processed training and validation datasets.
     """
+    if config.get('stream_chunk_size'):
+        if config['use_sliding_windows']:
+            return stream_data(config)
+        print("Streaming requires sliding windows. Loading data into memory.")
+
     print(f"Loading data from CSV file: {config['input_file']}")
-    data = load_csv(
-        file_path=config['input_file'],
-        headers=config.get('headers', False),
-        force_date=config.get('force_date', False)
-    )
+    data, profile = _load_profiled(config['input_file'], config, 'training', dataset_cache)
     print(f"Data loaded with shape: {data.shape}")
+    print(f"[process_data] Training data profile: {int(profile.nan_count.sum())} NaN values in {profile.num_columns} columns")
 
     if config['use_sliding_windows']:
         window_size = config['window_size']
         print(f"Applying sliding window of size: {window_size}")
 
         # Apply sliding windows to the entire dataset (multi-column)
-        processed_data = create_sliding_windows(data, window_size)
+        processed_data = _windowed(data, profile, config['input_file'], config, 'training', dataset_cache)
         print(f"Windowed data shape: {processed_data.shape}")  # Should be (num_samples, window_size, num_features)
     else:
         print("Skipping sliding windows. Data will be fed row-by-row.")
         # Use data row-by-row as a NumPy array
-        processed_data = data.to_numpy()
+        processed_data = with_profile(data.to_numpy(), profile)
         print(f"Processed data shape: {processed_data.shape}")  # Should be (num_samples, num_features)
 
     print(f"Loading validation data from CSV file: {config['validation_file']}")
-    validation_data = load_csv(
-        file_path=config['validation_file'],
-        headers=config.get('headers', False),
-        force_date=config.get('force_date', False)
-    )
+    validation_data, validation_profile = _load_profiled(config['validation_file'], config, 'validation', dataset_cache)
     print(f"Validation data loaded with shape: {validation_data.shape}")
+    print(f"[process_data] Validation data profile: {int(validation_profile.nan_count.sum())} NaN values in {validation_profile.num_columns} columns")
 
     if config['use_sliding_windows']:
         # Apply sliding windows to the validation dataset
-        windowed_validation_data = create_sliding_windows(validation_data, config['window_size'])
+        windowed_validation_data = _windowed(validation_data, validation_profile, config['validation_file'], config, 'validation', dataset_cache)
         print(f"Windowed validation data shape: {windowed_validation_data.shape}")
     else:
         print("Skipping sliding windows for validation data. Data will be fed row-by-row.")
         # Use validation data row-by-row as a NumPy array
-        windowed_validation_data = validation_data.to_numpy()
+        windowed_validation_data = with_profile(validation_data.to_numpy(), validation_profile)
         print(f"Validation processed shape: {windowed_validation_data.shape}")
 
     return processed_data, windowed_validation_data
 
 
 
-def run_autoencoder_pipeline(config, encoder_plugin, decoder_plugin):
+def stream_data(config):
+    """
+    Open the training and validation files as chunked window streams with constant memory use.
+
+    Args:
+        config (dict): Configuration dictionary with parameters for processing.
+
+    Returns:
+        tuple: Streamed training and validation window datasets.
+    """
+    datasets = []
+    for file_key in ['input_file', 'validation_file']:
+        print(f"Streaming data from CSV file: {config[file_key]} in chunks of {config['stream_chunk_size']} rows")
+        with stage('stream_scan', file=config[file_key]):
+            dataset = StreamingWindowedDataset(
+                config[file_key],
+                config['window_size'],
+                headers=config.get('headers', False),
+                force_date=config.get('force_date', False),
+                chunk_size=config['stream_chunk_size']
+            )
+        print(f"Streamed windowed data shape: {dataset.shape}")
+        datasets.append(dataset)
+    return datasets[0], datasets[1]
+
+
+
+def train_interface_candidate(config, encoder_plugin, decoder_plugin, input_size, interface_size, training_data, validation_data, previous_manager=None):
+    """
+    Build, train and evaluate the autoencoder for one interface size.
+
+    Args:
+        config (dict): Configuration dictionary.
+        encoder_plugin: Encoder plugin instance.
+        decoder_plugin: Decoder plugin instance.
+        input_size (int): Window size, or number of features without sliding windows.
+        interface_size (int): Interface size of the candidate.
+        training_data: Training windows, rows or windowed dataset.
+        validation_data: Validation windows, rows or windowed dataset.
+        previous_manager (AutoencoderManager): Previous candidate, used as warm start if enabled.
+
+    Returns:
+        tuple: The trained AutoencoderManager and the candidate's entry for the debug log.
+    """
+    print(f"Training with interface size: {interface_size}")
+
+    autoencoder_manager = AutoencoderManager(encoder_plugin, decoder_plugin)
+    num_channels = training_data.shape[-1]
+
+    # Build and train the autoencoder
+    with stage('build'):
+        autoencoder_manager.build_autoencoder(input_size, interface_size, config, num_channels)
+    warm_started = config.get('warm_start', False) and previous_manager is not None
+    if warm_started:
+        # Start from the previous candidate's weights instead of a random initialization
+        autoencoder_manager.warm_start_from(previous_manager)
+    with stage('train'):
+        autoencoder_manager.train_autoencoder(training_data, epochs=config['epochs'], batch_size=config['batch_size'], config=config,
+                                               validation_data=validation_data)
+
+    # Evaluate on training data
+    with stage('evaluate', dataset='training'):
+        training_mse, training_mae = autoencoder_manager.evaluate(training_data, "Training", config)
+    print(f"Training Mean Squared Error with interface size {interface_size}: {training_mse}")
+    print(f"Training Mean Absolute Error with interface size {interface_size}: {training_mae}")
+
+    # Evaluate on validation data
+    with stage('evaluate', dataset='validation'):
+        validation_mse, validation_mae = autoencoder_manager.evaluate(validation_data, "Validation", config)
+    print(f"Validation Mean Squared Error with interface size {interface_size}: {validation_mse}")
+    print(f"Validation Mean Absolute Error with interface size {interface_size}: {validation_mae}")
+    print(f"Epochs to converge with interface size {interface_size}: {autoencoder_manager.epochs_trained} (warm start: {warm_started})")
+    candidate = {
+        'interface_size': interface_size,
+        'epochs': autoencoder_manager.epochs_trained,
+        'warm_start': warm_started,
+        'stop_reason': autoencoder_manager.stop_reason,
+        'training_mse': training_mse,
+        'training_mae': training_mae,
+        'validation_mse': validation_mse,
+        'validation_mae': validation_mae,
+        'accepted': meets_threshold(validation_mae, config['threshold_error'], config['incremental_search'])
+    }
+    return autoencoder_manager, candidate
+
+
+def load_ledger_manager(encoder_plugin, decoder_plugin, entry):
+    """
+    Manager holding the saved models of a candidate completed by an earlier run, e.g. as warm start.
+    """
+    autoencoder_manager = AutoencoderManager(encoder_plugin, decoder_plugin)
+    autoencoder_manager.load_encoder(entry['encoder_file'])
+    autoencoder_manager.load_decoder(entry['decoder_file'])
+    return autoencoder_manager
+
+
+def run_autoencoder_pipeline(config, encoder_plugin, decoder_plugin, dataset_cache=None):
     import time
     start_time = time.time()
+    start_recording(config.get('trace_memory', False))
     
     print("Running process_data...")
-    processed_data, validation_data = process_data(config)
+    with stage('process_data'):
+        processed_data, validation_data = process_data(config, dataset_cache)
     print("Processed data received.")
 
     if not config.get('use_sliding_windows', True):
@@ -103,51 +249,90 @@ def run_autoencoder_pipeline(config, encoder_plugin, decoder_plugin):
 
     initial_size = config['initial_size']
     step_size = config['step_size']
-    threshold_error = config['threshold_error']
-    training_batch_size = config['batch_size']
-    epochs = config['epochs']
     incremental_search = config['incremental_search']
     
-    current_size = initial_size
     input_size = config['window_size'] if config['use_sliding_windows'] else processed_data.shape[1]
-
-    while True:
-        print(f"Training with interface size: {current_size}")
-        
-        autoencoder_manager = AutoencoderManager(encoder_plugin, decoder_plugin)
-        num_channels = processed_data.shape[-1]
-
-        # Build and train the autoencoder
-        autoencoder_manager.build_autoencoder(input_size, current_size, config, num_channels)
-        autoencoder_manager.train_autoencoder(processed_data, epochs=epochs, batch_size=training_batch_size, config=config)
-
-        # Evaluate on training data
-        training_mse, training_mae = autoencoder_manager.evaluate(processed_data, "Training", config)
-        print(f"Training Mean Squared Error with interface size {current_size}: {training_mse}")
-        print(f"Training Mean Absolute Error with interface size {current_size}: {training_mae}")
-
-        # Evaluate on validation data
-        validation_mse, validation_mae = autoencoder_manager.evaluate(validation_data, "Validation", config)
-        print(f"Validation Mean Squared Error with interface size {current_size}: {validation_mse}")
-        print(f"Validation Mean Absolute Error with interface size {current_size}: {validation_mae}")
-
-        # Check stopping condition
-        if (incremental_search and validation_mae <= threshold_error) or (not incremental_search and validation_mae >= threshold_error):
-            print(f"Optimal interface size found: {current_size} with Validation MSE: {validation_mse} and Validation MAE: {validation_mae}")
-            break
-        else:
-            if incremental_search:
-                current_size += step_size
-            else:
-                current_size -= step_size
-            if current_size > processed_data.shape[1] or current_size <= 0:
-                print(f"Cannot adjust interface size beyond data dimensions. Stopping.")
-                break
-
+    search_strategy = config.get('search_strategy', 'linear')
+    if search_strategy not in SEARCH_STRATEGIES:
+        raise ValueError(f"[run_autoencoder_pipeline] Unknown search_strategy '{search_strategy}', expected one of {list(SEARCH_STRATEGIES)}")
+    sizes = candidate_sizes(initial_size, step_size, processed_data.shape[1], incremental_search)
+    print(f"[run_autoencoder_pipeline] {search_strategy} search over interface sizes: {sizes}")
     encoder_model_filename = f"{config['save_encoder']}.keras"
     decoder_model_filename = f"{config['save_decoder']}.keras"
-    autoencoder_manager.save_encoder(encoder_model_filename)
-    autoencoder_manager.save_decoder(decoder_model_filename)
+    search_workers = config.get('search_workers') or 1
+
+    # Completed candidates are persisted in the run directory, a resumed search skips them
+    ledger = None
+    if config.get('checkpoint_dir'):
+        ledger = SearchLedger(ledger_path(config['checkpoint_dir']), config, resume=config.get('resume', False),
+                              encoder_plugin=encoder_plugin, decoder_plugin=decoder_plugin)
+        if ledger.stale:
+            config = dict(config, resume=False)  # Candidates train from scratch, not from the old checkpoints
+
+    if search_workers > 1:
+        # Candidates are trained in worker processes, which save their models to disk
+        with stage('parallel_search', workers=search_workers):
+            best_candidate, candidates = parallel_interface_search(
+                config, encoder_plugin, decoder_plugin, input_size, sizes, processed_data, validation_data,
+                search_workers, encoder_model_filename, decoder_model_filename, ledger
+            )
+    else:
+        previous_manager = None
+        candidates = []
+        results = {}
+
+        def is_accepted(index):
+            nonlocal previous_manager
+            # Each size is trained at most once, strategies may probe it again
+            if index not in results:
+                entry = ledger.get(sizes[index]) if ledger else None
+                if entry is not None:
+                    print(f"[run_autoencoder_pipeline] Interface size {sizes[index]} was completed by an earlier run, using its ledger entry.")
+                    manager, candidate = None, entry['candidate']
+                    previous_manager = load_ledger_manager(encoder_plugin, decoder_plugin, entry) if config.get('warm_start') else None
+                else:
+                    with stage('candidate', interface_size=sizes[index]):
+                        manager, candidate = train_interface_candidate(
+                            config, encoder_plugin, decoder_plugin, input_size, sizes[index],
+                            processed_data, validation_data, previous_manager
+                        )
+                    if ledger:
+                        output_dir = candidate_dir(config['checkpoint_dir'], sizes[index])
+                        entry = {'encoder_file': os.path.join(output_dir, f"encoder_{sizes[index]}.keras"),
+                                 'decoder_file': os.path.join(output_dir, f"decoder_{sizes[index]}.keras"),
+                                 'encoder_params': dict(encoder_plugin.params), 'decoder_params': dict(decoder_plugin.params)}
+                        manager.save_encoder(entry['encoder_file'])
+                        manager.save_decoder(entry['decoder_file'])
+                        ledger.record(candidate, entry['encoder_file'], entry['decoder_file'], entry['encoder_params'], entry['decoder_params'])
+                    previous_manager = manager
+                    if not candidate['accepted'] and index != len(sizes) - 1:
+                        manager = None  # Can never be selected, only the warm start keeps a reference
+                candidates.append(candidate)
+                results[index] = (manager, candidate, entry)
+            return results[index][1]['accepted']
+
+        best_index = SEARCH_STRATEGIES[search_strategy](len(sizes), is_accepted)
+        is_accepted(best_index)
+        autoencoder_manager, best_candidate, best_entry = results[best_index]
+        with stage('save'):
+            if autoencoder_manager is None:
+                # Trained by an earlier run of the search, its models are in the run directory
+                shutil.copyfile(best_entry['encoder_file'], encoder_model_filename)
+                shutil.copyfile(best_entry['decoder_file'], decoder_model_filename)
+                encoder_plugin.params.update(best_entry['encoder_params'])
+                decoder_plugin.params.update(best_entry['decoder_params'])
+            else:
+                autoencoder_manager.save_encoder(encoder_model_filename)
+                autoencoder_manager.save_decoder(decoder_model_filename)
+
+    validation_mse = best_candidate['validation_mse']
+    validation_mae = best_candidate['validation_mae']
+    if best_candidate['accepted']:
+        print(f"Optimal interface size found: {best_candidate['interface_size']} with Validation MSE: {validation_mse} and Validation MAE: {validation_mae}")
+    else:
+        print(f"Cannot adjust interface size beyond data dimensions. Stopping.")
+    reused = sum(1 for candidate in candidates if candidate.get('from_ledger'))
+    print(f"[run_autoencoder_pipeline] Trained {len(candidates) - reused} of {len(sizes)} candidate sizes, {reused} reused from the search ledger.")
     print(f"Saved encoder model to {encoder_model_filename}")
     print(f"Saved decoder model to {decoder_model_filename}")
 
@@ -158,7 +343,14 @@ def run_autoencoder_pipeline(config, encoder_plugin, decoder_plugin):
         'encoder': encoder_plugin.get_debug_info(),
         'decoder': decoder_plugin.get_debug_info(),
         'mse': validation_mse,
-        'mae': validation_mae
+        'mae': validation_mae,
+        'candidates': candidates,
+        'data_profile': {
+            name: dataset.profile.to_dict()
+            for name, dataset in [('training', processed_data), ('validation', validation_data)]
+            if getattr(dataset, 'profile', None) is not None
+        },
+        'stages': stop_recording()
     }
 
     if 'save_log' in config and config['save_log']:
@@ -182,15 +374,16 @@ def load_and_evaluate_encoder(config):
     Args:
         config (dict): Configuration dictionary with encoder and data details.
     """
-    model = load_model(config['load_encoder'])
+    # Keras or TFLite model, loaded once per process for repeated evaluations
+    model = load_cached_model(config['load_encoder'], config)
     print(f"Encoder model loaded from {config['load_encoder']}")
 
+    if config.get('stream_chunk_size') and config.get('use_sliding_windows', True):
+        stream_encode(model, config)
+        return
+
     # Load the input data
-    data = load_csv(
-        file_path=config['input_file'],
-        headers=config.get('headers', False),
-        force_date=config.get('force_date', False)
-    )
+    data = load_input_csv(config['input_file'], config)
 
     # Process data based on whether sliding windows are used
     if config.get('use_sliding_windows', True):
@@ -206,10 +399,24 @@ def load_and_evaluate_encoder(config):
 
     # Predict using the encoder
     print(f"Encoding data with shape: {processed_data.shape}")
-    encoded_data = model.predict(processed_data, verbose=1)
+    encoded_data = predict(model, processed_data)
     print(f"Encoded data shape: {encoded_data.shape}")
 
-    # Flatten 3D encoded data to 2D for saving
+    encoded_data_reshaped = flatten_encoded_data(encoded_data)
+
+    # Save the encoded data to CSV
+    if config.get('evaluate_encoder'):
+        print(f"Saving encoded data to {config['evaluate_encoder']}")
+        encoded_df = pd.DataFrame(encoded_data_reshaped)
+        encoded_df.to_csv(config['evaluate_encoder'], index=False)
+        print(f"Encoded data saved to {config['evaluate_encoder']}")
+
+
+
+def flatten_encoded_data(encoded_data):
+    """
+    Flatten 3D encoded data to 2D (num_samples, features) for saving.
+    """
     if len(encoded_data.shape) == 3:
         num_samples, dim1, dim2 = encoded_data.shape
         encoded_data_reshaped = encoded_data.reshape(num_samples, dim1 * dim2)
@@ -218,13 +425,44 @@ def load_and_evaluate_encoder(config):
         encoded_data_reshaped = encoded_data
     else:
         raise ValueError(f"Unexpected encoded_data shape: {encoded_data.shape}")
+    return encoded_data_reshaped
 
-    # Save the encoded data to CSV
-    if config.get('evaluate_encoder'):
-        print(f"Saving encoded data to {config['evaluate_encoder']}")
-        encoded_df = pd.DataFrame(encoded_data_reshaped)
-        encoded_df.to_csv(config['evaluate_encoder'], index=False)
-        print(f"Encoded data saved to {config['evaluate_encoder']}")
+
+
+def stream_encode(model, config):
+    """
+    Encode the input file chunk by chunk, appending each chunk's latent vectors to the output CSV.
+
+    Each chunk carries window_size - 1 rows of the previous one, so the output has exactly one row
+    per sliding window of the file while memory use does not depend on the file length.
+
+    Args:
+        model (keras.Model): Loaded encoder model.
+        config (dict): Configuration dictionary with encoder and data details.
+    """
+    window_size = config['window_size']
+    output_file = config.get('evaluate_encoder')
+    print(f"Streaming {config['input_file']} in chunks of {config['stream_chunk_size']} rows with sliding windows of size: {window_size}")
+    num_encoded = 0
+    for chunk in load_csv_chunks(
+        config['input_file'],
+        headers=config.get('headers', False),
+        force_date=config.get('force_date', False),
+        chunk_size=config['stream_chunk_size'],
+        overlap=window_size - 1
+    ):
+        windows = create_sliding_windows(chunk, window_size)
+        if len(windows) == 0:
+            continue
+        encoded_data = flatten_encoded_data(predict(model, windows))
+        if output_file:
+            # Write the header with the first chunk only, then append
+            pd.DataFrame(encoded_data).to_csv(output_file, index=False, mode='w' if num_encoded == 0 else 'a', header=num_encoded == 0)
+        num_encoded += len(encoded_data)
+        print(f"Encoded {num_encoded} windows", end="\r", flush=True)
+    print(f"Encoded {num_encoded} windows in total")
+    if output_file:
+        print(f"Encoded data saved to {output_file}")
 
 
 
@@ -233,22 +471,18 @@ def load_and_evaluate_encoder(config):
 # app/data_processor.py
 
 def load_and_evaluate_decoder(config):
-    model = load_model(config['load_decoder'])
+    model = load_cached_model(config['load_decoder'], config)
     print(f"Decoder model loaded from {config['load_decoder']}")
 
     # Load the input data with headers and date based on config
-    data = load_csv(
-        file_path=config['input_file'],
-        headers=config.get('headers', False),
-        force_date=config.get('force_date', False)
-    )
+    data = load_input_csv(config['input_file'], config)
 
     # Apply sliding window
     window_size = config['window_size']
     windowed_data = create_sliding_windows(data, window_size)
 
     print(f"Decoding data with shape: {windowed_data.shape}")
-    decoded_data = model.predict(windowed_data)
+    decoded_data = predict(model, windowed_data)
     print(f"Decoded data shape: {decoded_data.shape}")
 
     # Reshape decoded_data from (samples, 32, 8) to (samples, 256)
@@ -0,0 +1,212 @@
+import numpy as np
+from app.windowing import to_2d_array
+
+# app/data_profile.py
+
+PROFILE_BINS = 100
+PROFILE_CHUNK_ROWS = 65536
+
+
+class DataProfile:
+    """
+    Per-column quality profile of a 2D dataset: NaN counts, min/max, mean/variance and histograms.
+
+    Built once after loading a CSV and attached to the dataset, so NaN validation, dataset
+    information and normalization read it instead of scanning the (W times larger) windowed data.
+    Statistics ignore NaN values.
+    """
+
+    def __init__(self, num_rows, nan_count, column_min, column_max, column_mean, column_var, histograms=None, columns=None):
+        self.num_rows = num_rows
+        self.nan_count = nan_count
+        self.column_min = column_min
+        self.column_max = column_max
+        self.column_mean = column_mean
+        self.column_var = column_var
+        self.histograms = histograms  # (num_columns, PROFILE_BINS) counts over [column_min, column_max], or None
+        self.columns = columns if columns is not None else [f"col_{i}" for i in range(len(nan_count))]
+
+    @property
+    def num_columns(self):
+        return len(self.nan_count)
+
+    @property
+    def has_nan(self):
+        return bool(self.nan_count.sum() > 0)
+
+    def normalize(self, values):
+        """
+        Min-max normalize values column-wise with the profiled ranges, constant columns map to 0.
+
+        Args:
+            values (np.ndarray): Array whose last axis is the columns.
+
+        Returns:
+            np.ndarray: Normalized float32 values.
+        """
+        column_min = self.column_min.astype(np.float32)
+        column_range = self.column_max.astype(np.float32) - column_min
+        column_range = np.where(column_range > 0, column_range, np.float32(1.0))
+        return (np.asarray(values, dtype=np.float32) - column_min) / column_range
+
+    def to_dict(self):
+        """
+        JSON-serializable summary for the debug info (without the histograms).
+        """
+        return {
+            'num_rows': int(self.num_rows),
+            'columns': {
+                str(name): {
+                    'nan_count': int(self.nan_count[i]),
+                    'min': float(self.column_min[i]),
+                    'max': float(self.column_max[i]),
+                    'mean': float(self.column_mean[i]),
+                    'var': float(self.column_var[i])
+                }
+                for i, name in enumerate(self.columns)
+            }
+        }
+
+
+class ProfileAccumulator:
+    """
+    Streaming per-column NaN counts, min/max and mean/variance, merged chunk by chunk (Chan et al.).
+    """
+
+    def __init__(self):
+        self.num_rows = 0
+        self.nan_count = None
+        self.count = None
+        self.column_min = None
+        self.column_max = None
+        self.mean = None
+        self.m2 = None
+
+    def update(self, values):
+        """
+        Add a chunk of rows with shape (num_rows, num_columns).
+        """
+        values = np.asarray(values)
+        if values.shape[0] == 0:
+            return
+        nan_mask = np.isnan(values)
+        valid = ~nan_mask
+        count = valid.sum(axis=0)
+        chunk_min = np.where(nan_mask, np.inf, values).min(axis=0)
+        chunk_max = np.where(nan_mask, -np.inf, values).max(axis=0)
+        finite = np.where(nan_mask, 0.0, values).astype(np.float64)
+        chunk_mean = finite.sum(axis=0) / np.maximum(count, 1)
+        chunk_m2 = np.square(np.where(valid, finite - chunk_mean, 0.0)).sum(axis=0)
+
+        self.num_rows += values.shape[0]
+        if self.count is None:
+            self.nan_count = nan_mask.sum(axis=0)
+            self.count, self.column_min, self.column_max = count, chunk_min, chunk_max
+            self.mean, self.m2 = chunk_mean, chunk_m2
+            return
+        self.nan_count = self.nan_count + nan_mask.sum(axis=0)
+        self.column_min = np.minimum(self.column_min, chunk_min)
+        self.column_max = np.maximum(self.column_max, chunk_max)
+        total = self.count + count
+        delta = chunk_mean - self.mean
+        safe_total = np.maximum(total, 1)
+        self.mean = self.mean + delta * count / safe_total
+        self.m2 = self.m2 + chunk_m2 + np.square(delta) * self.count * count / safe_total
+        self.count = total
+
+    def result(self, histograms=None, columns=None):
+        """
+        Returns:
+            DataProfile: Profile of all rows added so far.
+        """
+        if self.count is None:
+            empty = np.zeros(len(columns) if columns is not None else 0)
+            return DataProfile(0, empty.astype(np.int64), empty, empty, empty, empty, histograms, columns)
+        all_nan = self.count == 0
+        return DataProfile(
+            self.num_rows,
+            self.nan_count,
+            np.where(all_nan, np.nan, self.column_min),
+            np.where(all_nan, np.nan, self.column_max),
+            np.where(all_nan, np.nan, self.mean),
+            np.where(all_nan, np.nan, self.m2 / np.maximum(self.count, 1)),
+            histograms,
+            columns
+        )
+
+
+def column_histograms(values, column_min, column_max, bins=PROFILE_BINS, chunk_rows=PROFILE_CHUNK_ROWS):
+    """
+    Histogram of every column over its own [min, max] range, with one bincount per chunk for all columns.
+
+    Args:
+        values (np.ndarray): 2D array (num_rows, num_columns).
+        column_min (np.ndarray): Minimum of each column.
+        column_max (np.ndarray): Maximum of each column.
+        bins (int): Bins per column.
+
+    Returns:
+        np.ndarray: Counts with shape (num_columns, bins), NaN values are not counted.
+    """
+    num_columns = values.shape[1]
+    column_range = np.where(column_max > column_min, column_max - column_min, 1.0)
+    offsets = np.arange(num_columns) * bins
+    histograms = np.zeros(num_columns * bins, dtype=np.int64)
+    for start in range(0, values.shape[0], chunk_rows):
+        chunk = values[start:start + chunk_rows]
+        valid = ~np.isnan(chunk)
+        bin_indices = np.clip(np.floor((chunk - column_min) / column_range * bins), 0, bins - 1)
+        flat_indices = (np.where(valid, bin_indices, 0).astype(np.int64) + offsets)[valid]
+        histograms += np.bincount(flat_indices, minlength=num_columns * bins)
+    return histograms.reshape(num_columns, bins)
+
+
+class ProfiledArray(np.ndarray):
+    """
+    NumPy array (e.g. materialized windows or rows) carrying the profile of the data it was built from.
+
+    Only the array the profile was attached to has it: slices and reshapes of it get None, since the
+    profile does not describe a subset of the data.
+    """
+
+    profile = None
+
+
+def with_profile(array, profile):
+    """
+    View of array with profile attached, without copying the data.
+
+    Args:
+        array (np.ndarray): Array built from the profiled data.
+        profile (DataProfile): Profile of the data.
+
+    Returns:
+        ProfiledArray: The view.
+    """
+    view = array.view(ProfiledArray)
+    view.profile = profile
+    return view
+
+
+def profile_frame(data, bins=PROFILE_BINS, chunk_rows=PROFILE_CHUNK_ROWS):
+    """
+    Profile a loaded 2D frame: one chunked pass for NaN counts, ranges and moments, one for the histograms.
+
+    Args:
+        data (pd.DataFrame or np.ndarray): Data with shape (num_rows, num_columns).
+        bins (int): Histogram bins per column.
+
+    Returns:
+        DataProfile: The profile.
+    """
+    columns = [str(col) for col in data.columns] if hasattr(data, 'columns') else None
+    values = to_2d_array(data)
+    accumulator = ProfileAccumulator()
+    for start in range(0, values.shape[0], chunk_rows):
+        accumulator.update(values[start:start + chunk_rows])
+    profile = accumulator.result(columns=columns)
+    if profile.num_rows:
+        profile.histograms = column_histograms(
+            values, np.nan_to_num(profile.column_min), np.nan_to_num(profile.column_max), bins, chunk_rows
+        )
+    return profile
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from app.windowed_dataset import WindowedDataset, StreamingWindowedDataset
+
+# app/dataset_information.py
+
+INFORMATION_VERSION = 1
+HISTOGRAM_BINS = 1000
+CHUNK_ROWS = 65536
+
+PERIODICITY_SECONDS = {
+    "1min": 60,
+    "5min": 5 * 60,
+    "15min": 15 * 60,
+    "1h": 60 * 60,
+    "4h": 4 * 60 * 60,
+    "daily": 24 * 60 * 60
+}
+
+STATISTICS_CACHE_SIZE = 32  # Datasets whose statistics are kept in memory, least recently used first out
+
+# Statistics already computed in this process, by dataset fingerprint
+_statistics_cache = OrderedDict()
+
+
+def _remember_statistics(key, statistics):
+    _statistics_cache[key] = statistics
+    _statistics_cache.move_to_end(key)
+    while len(_statistics_cache) > STATISTICS_CACHE_SIZE:
+        _statistics_cache.popitem(last=False)
+
+
+def window_row_weights(start, stop, num_rows, window_size):
+    """
+    Number of sliding windows containing each row in [start, stop) of a num_rows series.
+
+    Weighting the 2D series by these counts gives the same statistics as the flattened window tensor,
+    where each row is repeated once per window that contains it.
+    """
+    num_windows = num_rows - window_size + 1
+    if num_windows <= 0:
+        return np.zeros(stop - start)
+    positions = np.arange(start, stop)
+    return np.minimum(np.minimum(positions + 1, num_rows - positions), min(window_size, num_windows)).astype(np.float64)
+
+
+class InformationAccumulator:
+    """
+    Streaming weighted mean, variance and histogram of the min-max normalized columns.
+
+    Chunks of rows are added one at a time with a weight per row, so the columns are never
+    normalized into copies or concatenated.
+    """
+
+    def __init__(self, column_min, column_max, bins=HISTOGRAM_BINS):
+        """
+        Args:
+            column_min (np.ndarray): Minimum of each column over the whole dataset.
+            column_max (np.ndarray): Maximum of each column over the whole dataset.
+            bins (int): Number of histogram bins over [0, 1].
+        """
+        self.column_min = np.asarray(column_min, dtype=np.float32)
+        column_range = np.asarray(column_max, dtype=np.float32) - self.column_min
+        # Constant columns normalize to 0 instead of NaN
+        self.column_range = np.where(column_range > 0, column_range, np.float32(1.0))
+        self.bins = bins
+        self.num_samples = 0.0
+        self.weighted_sum = 0.0
+        self.weighted_sum_squares = 0.0
+        self.histogram = np.zeros(bins)
+
+    def update(self, values, weights=None):
+        """
+        Add a chunk of rows.
+
+        Args:
+            values (np.ndarray): Chunk with shape (num_rows, num_columns).
+            weights (np.ndarray): Weight of each row, 1 if None.
+        """
+        if len(values) == 0:
+            return
+        normalized = (np.asarray(values, dtype=np.float32) - self.column_min) / self.column_range
+        if weights is None:
+            weights = np.ones(len(normalized))
+        row_weights = np.broadcast_to(weights[:, np.newaxis], normalized.shape)
+        self.num_samples += float(weights.sum()) * normalized.shape[1]
+        self.weighted_sum += float(weights @ normalized.sum(axis=1, dtype=np.float64))
+        self.weighted_sum_squares += float(weights @ np.square(normalized, dtype=np.float64).sum(axis=1))
+        # Same binning as tf.histogram_fixed_width over [0, 1], out of range values go to the edge bins
+        bin_indices = np.clip(np.floor(normalized * np.float32(self.bins)), 0, self.bins - 1).astype(np.int64)
+        self.histogram += np.bincount(bin_indices.ravel(), weights=row_weights.ravel(), minlength=self.bins)
+
+    def result(self):
+        """
+        Returns:
+            dict: num_samples, mean, std and entropy (bits) of the accumulated values.
+        """
+        if self.num_samples == 0:
+            return {'num_samples': 0, 'mean': 0.0, 'std': 0.0, 'entropy': 0.0}
+        mean = self.weighted_sum / self.num_samples
+        variance = max(self.weighted_sum_squares / self.num_samples - mean ** 2, 0.0)
+        probabilities = self.histogram / self.histogram.sum()
+        entropy = -np.sum(probabilities * np.log(probabilities + 1e-10) / np.log(2.0))
+        return {
+            'num_samples': int(round(self.num_samples)),
+            'mean': float(mean),
+            'std': float(np.sqrt(variance)),
+            'entropy': float(entropy)
+        }
+
+
+def as_windowed_dataset(data):
+    """
+    WindowedDataset over the 2D series of a sliding window view of create_sliding_windows.
+
+    Window i of such a view starts one row after window i-1, so its series is recovered as a view of
+    the same memory instead of hashing or scanning the num_windows * window_size * num_features values.
+
+    Returns:
+        WindowedDataset: The windowed series, or None if data is not a sliding window view.
+    """
+    if not isinstance(data, np.ndarray) or data.ndim != 3 or data.shape[0] == 0 or data.strides[0] != data.strides[1]:
+        return None
+    num_windows, window_size, num_features = data.shape
+    series = as_strided(data, shape=(num_windows + window_size - 1, num_features),
+                        strides=(data.strides[0], data.strides[2]), writeable=False)
+    return WindowedDataset(series, window_size, profile=getattr(data, 'profile', None))
+
+
+def dataset_fingerprint(data):
+    """
+    Key identifying the values of a dataset and how they are windowed.
+
+    Args:
+        data (np.ndarray, WindowedDataset or StreamingWindowedDataset): The dataset.
+
+    Returns:
+        str: Hex digest.
+    """
+    windowed = as_windowed_dataset(data)
+    if windowed is not None:
+        data = windowed
+    if isinstance(data, (WindowedDataset, StreamingWindowedDataset)):
+        content = data.fingerprint()
+    else:
+        array = np.ascontiguousarray(data)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(array.data)
+        content = f"{digest.hexdigest()}:{array.shape}:{array.dtype.str}"
+    key = f"{INFORMATION_VERSION}:{HISTOGRAM_BINS}:{content}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def compute_dataset_statistics(data, chunk_rows=CHUNK_ROWS):
+    """
+    Statistics of the flattened, min-max normalized columns of a dataset in one pass over its values.
+
+    Windowed datasets are processed on their 2D series, weighting each row by the number of windows
+    that contain it, which reproduces the statistics of the full window tensor without building it.
+
+    Args:
+        data (np.ndarray, WindowedDataset or StreamingWindowedDataset): Rows (2D), windows (3D) or a windowed dataset.
+        chunk_rows (int): Rows (or windows for 3D arrays) per accumulation step.
+
+    Returns:
+        dict: num_samples, mean, std and entropy of the normalized values.
+    """
+    if isinstance(data, StreamingWindowedDataset):
+        accumulator = InformationAccumulator(data.profile.column_min, data.profile.column_max)
+        start = 0
+        for chunk in data.iter_chunks(overlap=0):
+            stop = start + len(chunk)
+            accumulator.update(chunk.to_numpy(), window_row_weights(start, stop, data.num_rows, data.window_size))
+            start = stop
+        return accumulator.result()
+
+    windowed = as_windowed_dataset(data)
+    if windowed is not None:
+        data = windowed
+    if isinstance(data, WindowedDataset):
+        series, window_size = data.series, data.window_size
+    elif data.ndim == 2:
+        series, window_size = data, None
+    elif data.ndim == 3:
+        # Materialized windows: every value of every window counts once
+        accumulator = InformationAccumulator(data.min(axis=(0, 1)), data.max(axis=(0, 1)))
+        window_chunk = max(chunk_rows // max(data.shape[1], 1), 1)
+        for start in range(0, data.shape[0], window_chunk):
+            accumulator.update(data[start:start + window_chunk].reshape(-1, data.shape[2]))
+        return accumulator.result()
+    else:
+        raise ValueError("[compute_dataset_statistics] Unsupported data shape for processing.")
+
+    profile = getattr(data, 'profile', None)
+    if profile is not None:
+        # Ranges from the profile computed after loading, no extra pass over the series
+        accumulator = InformationAccumulator(profile.column_min, profile.column_max)
+    else:
+        accumulator = InformationAccumulator(series.min(axis=0), series.max(axis=0))
+    num_rows = series.shape[0]
+    for start in range(0, num_rows, chunk_rows):
+        stop = min(start + chunk_rows, num_rows)
+        weights = None if window_size is None else window_row_weights(start, stop, num_rows, window_size)
+        accumulator.update(series[start:stop], weights)
+    return accumulator.result()
+
+
+def get_dataset_statistics(data, cache_dir=None):
+    """
+    Dataset statistics from the in-process cache (the STATISTICS_CACHE_SIZE most recently used
+    datasets), the disk cache or computed once.
+
+    Args:
+        data (np.ndarray, WindowedDataset or StreamingWindowedDataset): The dataset.
+        cache_dir (str): Directory persisting the statistics across runs, None to keep them in memory only.
+
+    Returns:
+        dict: num_samples, mean, std and entropy of the normalized values.
+    """
+    key = dataset_fingerprint(data)
+    if key in _statistics_cache:
+        _statistics_cache.move_to_end(key)
+        return _statistics_cache[key]
+    cache_path = os.path.join(cache_dir, 'dataset_information', f"{key}.json") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                statistics = json.load(f)
+            _remember_statistics(key, statistics)
+            return statistics
+        except (OSError, ValueError) as e:
+            print(f"[get_dataset_statistics] Ignoring unreadable cache file {cache_path}: {e}")
+
+    statistics = compute_dataset_statistics(data)
+    _remember_statistics(key, statistics)
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.tmp{os.getpid()}"
+            with open(tmp_path, 'w') as f:
+                json.dump(statistics, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"[get_dataset_statistics] Failed to cache statistics: {e}")
+    return statistics
+
+
+def information_from_statistics(statistics, periodicity):
+    """
+    SNR, Shannon-Hartley channel capacity and total useful information from the dataset statistics.
+
+    Args:
+        statistics (dict): Output of get_dataset_statistics.
+        periodicity (str): Dataset periodicity, one of the PERIODICITY_SECONDS keys.
+
+    Returns:
+        dict: The statistics plus snr, sampling_frequency, channel_capacity and total_information_bits.
+    """
+    mean_val, std_val = statistics['mean'], statistics['std']
+    snr = (mean_val / std_val) ** 2 if std_val > 0 else 0.0
+    sampling_period_seconds = PERIODICITY_SECONDS.get(periodicity)
+    sampling_frequency = 1 / sampling_period_seconds if sampling_period_seconds else 0.0
+    if snr > 0 and sampling_frequency > 0:
+        channel_capacity = sampling_frequency * np.log2(1 + snr)
+    else:
+        channel_capacity = 0.0
+    total_information_bits = channel_capacity * statistics['num_samples'] * (sampling_period_seconds or 0)
+    return dict(
+        statistics,
+        snr=float(snr),
+        sampling_frequency=float(sampling_frequency),
+        channel_capacity=float(channel_capacity),
+        total_information_bits=float(total_information_bits)
+    )
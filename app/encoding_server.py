@@ -0,0 +1,343 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import numpy as np
+from app.windowing import create_sliding_windows
+
+# app/encoding_server.py
+
+LATENCY_WINDOW = 10000  # Most recent request latencies kept for the percentiles
+
+
+class LatencyStats:
+    """
+    Thread-safe request latency percentiles and throughput counters.
+    """
+
+    def __init__(self, latency_window=LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+
+    def record_batch(self, latencies, rows):
+        with self._lock:
+            self._latencies.extend(latencies)
+            self.requests += len(latencies)
+            self.rows += rows
+            self.batches += 1
+
+    def record_error(self, num_requests):
+        with self._lock:
+            self.errors += num_requests
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: Counters, mean batch size, throughput and p50/p99 latency in milliseconds.
+        """
+        with self._lock:
+            latencies = np.array(self._latencies)
+            uptime = time.perf_counter() - self.started
+            return {
+                'requests': self.requests,
+                'rows': self.rows,
+                'batches': self.batches,
+                'errors': self.errors,
+                'mean_batch_requests': self.requests / self.batches if self.batches else 0.0,
+                'uptime_seconds': uptime,
+                'throughput_rows_per_second': self.rows / uptime if uptime > 0 else 0.0,
+                'p50_latency_ms': float(np.percentile(latencies, 50) * 1000) if len(latencies) else None,
+                'p99_latency_ms': float(np.percentile(latencies, 99) * 1000) if len(latencies) else None
+            }
+
+
+class _Request:
+    __slots__ = ('inputs', 'enqueued', 'done', 'result', 'error')
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent encode requests into batches for one model.
+
+    A batch is run when it reaches max_batch_size samples or when its oldest request has waited
+    max_latency_ms, whichever comes first, so a lone request waits at most the latency budget.
+    """
+
+    def __init__(self, predict, max_batch_size=256, max_latency_ms=5.0):
+        """
+        Args:
+            predict (callable): Maps a (batch, ...) array to a (batch, ...) array.
+            max_batch_size (int): Samples per batch before it is run without waiting.
+            max_latency_ms (float): Longest time a request waits for others to join its batch.
+        """
+        self.predict = predict
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.stats = LatencyStats()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, inputs):
+        """
+        Encode inputs with shape (num_samples, ...), blocking until their batch has run.
+        """
+        request = _Request(inputs)
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect_batch(self, first):
+        batch, num_samples = [first], len(first.inputs)
+        deadline = first.enqueued + self.max_latency
+        while num_samples < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if request is None:
+                self._queue.put(None)  # Stop after this batch
+                break
+            batch.append(request)
+            num_samples += len(request.inputs)
+        return batch, num_samples
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, num_samples = self._collect_batch(first)
+            try:
+                outputs = self.predict(np.concatenate([request.inputs for request in batch]))
+                splits = np.cumsum([len(request.inputs) for request in batch])[:-1]
+                for request, result in zip(batch, np.split(outputs, splits)):
+                    request.result = result
+            except Exception as e:
+                self.stats.record_error(len(batch))
+                for request in batch:
+                    request.error = e
+            else:
+                finished = time.perf_counter()
+                self.stats.record_batch([finished - request.enqueued for request in batch], num_samples)
+            for request in batch:
+                request.done.set()
+
+
+class EncodingService:
+    """
+    Resident encoder models, each behind its own micro-batcher.
+    """
+
+    def __init__(self, model_paths, max_batch_size=256, max_latency_ms=5.0):
+        """
+        Args:
+            model_paths (dict): Model name to .keras file path.
+            max_batch_size (int): Samples per micro-batch before it is run without waiting.
+            max_latency_ms (float): Micro-batching latency budget per request.
+        """
+        from app.model_cache import get_model_cache
+
+        self.models = {}
+        self.batchers = {}
+        for name, path in model_paths.items():
+            model = get_model_cache().get(path)
+            print(f"[EncodingService] Loaded encoder '{name}' from {path} with input shape {model.input_shape}")
+            self.models[name] = model
+            self.batchers[name] = MicroBatcher(self._predict_function(model), max_batch_size, max_latency_ms)
+
+    @staticmethod
+    def _predict_function(model):
+        from app.fast_inference import fast_inference
+
+        inference = fast_inference(model)
+
+        def predict(inputs):
+            # Precompiled function instead of model.predict, which has a high per-call overhead for small batches
+            encoded = inference.encode_batch(inputs)
+            return encoded.reshape(len(encoded), -1)
+        return predict
+
+    def model_name(self, name=None):
+        if name is None:
+            if len(self.models) != 1:
+                raise ValueError(f"[EncodingService] Several models are loaded, specify one of {list(self.models)}")
+            return next(iter(self.models))
+        if name not in self.models:
+            raise ValueError(f"[EncodingService] Unknown model '{name}', expected one of {list(self.models)}")
+        return name
+
+    def prepare_inputs(self, name, windows=None, rows=None):
+        """
+        Model inputs from windows (num_windows, window_size, num_features) or from consecutive rows.
+
+        Rows are turned into sliding windows of the model's window size, or fed one row per sample
+        to models trained without sliding windows. Models with 2D inputs (num_samples, input_dim),
+        such as the ANN encoder, take rows of width input_dim as they are.
+        """
+        input_shape = self.models[name].input_shape
+        if len(input_shape) == 2:
+            sample_shape = (input_shape[1],)
+            samples = rows if rows is not None else windows
+            if samples is None:
+                raise ValueError("[EncodingService] Request needs 'windows' or 'rows'.")
+            inputs = np.asarray(samples, dtype=np.float32)
+            if inputs.ndim != 2 or inputs.shape[1:] != sample_shape:
+                raise ValueError(f"[EncodingService] Expected rows of shape (n, {sample_shape[0]}), got {inputs.shape}")
+            return inputs
+        _, input_length, input_channels = input_shape
+        if windows is not None:
+            inputs = np.asarray(windows, dtype=np.float32)
+            if inputs.ndim != 3 or inputs.shape[1:] != (input_length, input_channels):
+                raise ValueError(f"[EncodingService] Expected windows of shape (n, {input_length}, {input_channels}), got {inputs.shape}")
+            return inputs
+        if rows is None:
+            raise ValueError("[EncodingService] Request needs 'windows' or 'rows'.")
+        rows = np.asarray(rows, dtype=np.float32)
+        if rows.ndim != 2:
+            raise ValueError(f"[EncodingService] Expected a 2D list of rows, got shape {rows.shape}")
+        if rows.shape[1] == input_channels:
+            return np.ascontiguousarray(create_sliding_windows(rows, input_length))
+        if rows.shape[1] == input_length and input_channels == 1:
+            return rows[:, :, np.newaxis]
+        raise ValueError(f"[EncodingService] Rows of width {rows.shape[1]} do not match input shape {(input_length, input_channels)}")
+
+    def encode(self, name=None, windows=None, rows=None):
+        """
+        Returns:
+            np.ndarray: Latent vectors with shape (num_samples, latent_size).
+        """
+        name = self.model_name(name)
+        inputs = self.prepare_inputs(name, windows=windows, rows=rows)
+        if len(inputs) == 0:
+            return np.zeros((0, int(np.prod(self.models[name].output_shape[1:]))), dtype=np.float32)
+        return self.batchers[name].submit(inputs)
+
+    def stats(self):
+        return {name: batcher.stats.snapshot() for name, batcher in self.batchers.items()}
+
+    def close(self):
+        for batcher in self.batchers.values():
+            batcher.close()
+
+
+def _make_handler(service):
+    class EncodingRequestHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/stats':
+                self._send_json(200, service.stats())
+            elif self.path == '/models':
+                self._send_json(200, {name: {'input_shape': list(model.input_shape[1:]), 'output_shape': list(model.output_shape[1:])}
+                                      for name, model in service.models.items()})
+            else:
+                self._send_json(404, {'error': f"Unknown path {self.path}"})
+
+        def do_POST(self):
+            if self.path != '/encode':
+                self._send_json(404, {'error': f"Unknown path {self.path}"})
+                return
+            try:
+                request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                encoded = service.encode(request.get('model'), windows=request.get('windows'), rows=request.get('rows'))
+            except ValueError as e:
+                self._send_json(400, {'error': str(e)})
+                return
+            except Exception as e:
+                self._send_json(500, {'error': str(e)})
+                return
+            self._send_json(200, {'encoded': encoded.tolist()})
+
+        def log_message(self, format, *args):
+            pass  # One line per request would dominate the output under load
+
+    return EncodingRequestHandler
+
+
+class EncodingServer(ThreadingHTTPServer):
+    """
+    Local HTTP server for an EncodingService: POST /encode, GET /stats and GET /models.
+
+    POST /encode takes {"model": name (optional with one model), "windows": [...]} or {"rows": [...]}
+    and returns {"encoded": [[...], ...]}.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, service, host='127.0.0.1', port=0):
+        super().__init__((host, port), _make_handler(service))
+        self.service = service
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def server_close(self):
+        super().server_close()
+        self.service.close()
+
+
+def parse_model_paths(load_encoder):
+    """
+    Models to serve from --load_encoder: comma-separated paths or name=path pairs, named by file name by default.
+    """
+    model_paths = {}
+    for item in load_encoder.split(','):
+        name, _, path = item.rpartition('=')
+        path = path.strip()
+        model_paths[name.strip() or os.path.splitext(os.path.basename(path))[0]] = path
+    return model_paths
+
+
+def run_encoding_server(config):
+    """
+    Serve the encoders in config['load_encoder'] until interrupted.
+
+    Args:
+        config (dict): Configuration dictionary with the server options.
+    """
+    service = EncodingService(
+        parse_model_paths(config['load_encoder']),
+        max_batch_size=config.get('server_max_batch_size', 256),
+        max_latency_ms=config.get('server_max_latency_ms', 5.0)
+    )
+    server = EncodingServer(service, config.get('server_host', '127.0.0.1'), config.get('server_port', 8765))
+    print(f"[run_encoding_server] Serving encoders {list(service.models)} at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[run_encoding_server] Stopping.")
+    finally:
+        server.server_close()
@@ -0,0 +1,83 @@
+import numpy as np
+import tensorflow as tf
+
+# app/fast_inference.py
+
+INFERENCE_BATCH_SIZE = 4096  # Larger inputs are run in chunks of this many samples to bound memory
+
+
+class FastInference:
+    """
+    Low-overhead inference for a single-input Keras model.
+
+    The model is traced once into a concrete function with a fixed (None, ...) input signature and
+    training=False, then warmed up, so each call is a graph execution without the per-call setup of
+    model.predict (data adapters, callbacks, progress bar). The concrete function reads the model's
+    variables, so it stays valid after further training.
+    """
+
+    def __init__(self, model, batch_size=INFERENCE_BATCH_SIZE):
+        """
+        Args:
+            model (keras.Model): Model with one input.
+            batch_size (int): Samples per call for inputs larger than this.
+        """
+        if isinstance(model.input_shape, list):
+            raise ValueError(f"[FastInference] Only single-input models are supported, got input shapes {model.input_shape}")
+        self.model = model
+        self.batch_size = batch_size
+        self.input_shape = tuple(model.input_shape[1:])
+        self.dtype = model.inputs[0].dtype.as_numpy_dtype
+        spec = tf.TensorSpec((None,) + self.input_shape, model.inputs[0].dtype)
+        self._function = tf.function(lambda inputs: model(inputs, training=False)).get_concrete_function(spec)
+        self._function(tf.zeros((1,) + tuple(dim or 1 for dim in self.input_shape), model.inputs[0].dtype))
+
+    def encode_batch(self, inputs):
+        """
+        Run the model on a batch.
+
+        Args:
+            inputs (np.ndarray): Samples with shape (num_samples,) + input_shape.
+
+        Returns:
+            np.ndarray: Model outputs for every sample.
+        """
+        inputs = np.asarray(inputs, dtype=self.dtype)
+        if len(inputs) <= self.batch_size:
+            return self._function(tf.constant(inputs)).numpy()
+        return np.concatenate([
+            self._function(tf.constant(inputs[start:start + self.batch_size])).numpy()
+            for start in range(0, len(inputs), self.batch_size)
+        ])
+
+    def encode_one(self, sample):
+        """
+        Run the model on one sample with shape input_shape, returning its output without the batch dimension.
+        """
+        return self.encode_batch(np.asarray(sample, dtype=self.dtype)[np.newaxis])[0]
+
+    # Decoder models use the same calls
+    decode_batch = encode_batch
+    decode_one = encode_one
+
+
+def fast_inference(model):
+    """
+    FastInference wrapper of a model, built on first use and reused while the model exists.
+    """
+    # Kept on the model itself, so the wrapper lives and dies with it
+    wrapper = getattr(model, '_fast_inference', None)
+    if wrapper is None:
+        wrapper = FastInference(model)
+        model._fast_inference = wrapper
+    return wrapper
+
+
+def predict(model, inputs):
+    """
+    Outputs of a model on a batch, through its FastInference wrapper, or model.predict for multi-input
+    models and for models that are not Keras models (e.g. TFLite interpreters).
+    """
+    if isinstance(model.input_shape, list) or not hasattr(model, 'inputs'):
+        return model.predict(inputs, verbose=0)
+    return fast_inference(model).encode_batch(inputs)
@@ -0,0 +1,126 @@
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# app/instrumentation.py
+
+# Recording started by start_recording, stages are no-ops while it is None
+_recording = None
+
+
+def _max_rss_kb():
+    """
+    Peak resident set size of this process so far in KB (ru_maxrss is in bytes on macOS), or None if unknown.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss // 1024 if sys.platform == 'darwin' else max_rss
+
+
+def start_recording(trace_memory=False):
+    """
+    Start recording pipeline stages in this process.
+
+    Args:
+        trace_memory (bool): Also record the tracemalloc peak of Python allocations per stage (slower).
+    """
+    global _recording
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _recording = {'trace_memory': trace_memory, 'root': {'stages': []}, 'stack': []}
+    _recording['stack'].append(_recording['root'])
+
+
+def stop_recording():
+    """
+    Stop recording and return the recorded stages.
+
+    Returns:
+        list: Top-level stages, each with its nested stages.
+    """
+    global _recording
+    if _recording is None:
+        return []
+    if _recording['trace_memory'] and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    stages = _recording['root']['stages']
+    _recording = None
+    return stages
+
+
+def _reset_traced_peak(recording):
+    """
+    Reset the tracemalloc peak to the current traced memory.
+    """
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+        return
+    # Python < 3.9 has no reset_peak: restart tracing and carry the memory traced so far as an offset
+    current, _ = tracemalloc.get_traced_memory()
+    recording['traced_offset'] = recording.get('traced_offset', 0) + current
+    tracemalloc.stop()
+    tracemalloc.start()
+
+
+def _traced_memory(recording):
+    """
+    Current and peak traced memory in bytes, including the offset of tracing restarts.
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    offset = recording.get('traced_offset', 0)
+    return current + offset, peak + offset
+
+
+@contextmanager
+def stage(name, **details):
+    """
+    Record wall time, CPU time and memory deltas of the enclosed block as a nested pipeline stage.
+
+    Each stage entry has: name, any extra details (e.g. interface_size), wall_time and cpu_time in
+    seconds, max_rss_delta_kb (growth of the process high-water mark), tracemalloc_peak_kb when
+    memory tracing is enabled, and the stages nested inside it.
+
+    Args:
+        name (str): Stage name, e.g. 'load_csv' or 'train'.
+        **details: JSON-serializable values stored with the stage.
+    """
+    recording = _recording
+    if recording is None:
+        yield
+        return
+
+    entry = {'name': name, **details}
+    recording['stack'][-1]['stages'].append(entry)
+    frame = {'stages': [], 'child_peak': 0}
+    recording['stack'].append(frame)
+    trace_memory = recording['trace_memory'] and tracemalloc.is_tracing()
+    if trace_memory:
+        traced_start, _ = _traced_memory(recording)
+        _reset_traced_peak(recording)
+    max_rss_start = _max_rss_kb()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry['wall_time'] = time.perf_counter() - wall_start
+        entry['cpu_time'] = time.process_time() - cpu_start
+        if max_rss_start is not None:
+            entry['max_rss_delta_kb'] = _max_rss_kb() - max_rss_start
+        recording['stack'].pop()
+        if trace_memory:
+            # Nested stages reset the tracemalloc peak, so combine it with theirs
+            _, traced_peak = _traced_memory(recording)
+            traced_peak = max(traced_peak, frame['child_peak'])
+            entry['tracemalloc_peak_kb'] = max(traced_peak - traced_start, 0) // 1024
+            parent = recording['stack'][-1]
+            parent['child_peak'] = max(parent.get('child_peak', 0), traced_peak)
+        if frame['stages']:
+            entry['stages'] = frame['stages']
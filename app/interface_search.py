@@ -0,0 +1,163 @@
+# app/interface_search.py
+
+GOLDEN_RATIO_SPLIT = 0.381966  # 1 - 1/phi, the golden-section probe position
+
+
+def meets_threshold(validation_mae, threshold_error, incremental_search):
+    """
+    Acceptance test of a candidate: MAE at or below the threshold for incremental search, at or above it otherwise.
+    """
+    if incremental_search:
+        return bool(validation_mae <= threshold_error)
+    return bool(validation_mae >= threshold_error)
+
+
+def candidate_sizes(initial_size, step_size, max_size, incremental_search):
+    """
+    Interface sizes on the search grid, in search order.
+
+    The initial size is always a candidate, then sizes move by step_size (up for incremental
+    search, down otherwise) while they stay within 1..max_size.
+
+    Args:
+        initial_size (int): First interface size.
+        step_size (int): Grid step between candidates.
+        max_size (int): Largest allowed interface size.
+        incremental_search (bool): Search upwards if True, downwards otherwise.
+
+    Returns:
+        list: Candidate interface sizes.
+    """
+    step = step_size if incremental_search else -step_size
+    sizes = [initial_size]
+    while 0 < sizes[-1] + step <= max_size and step != 0:
+        sizes.append(sizes[-1] + step)
+    return sizes
+
+
+def linear_search(num_candidates, is_accepted):
+    """
+    Walk the candidates in order until one is accepted (the original search).
+
+    Args:
+        num_candidates (int): Number of candidates on the grid.
+        is_accepted (callable): Trains candidate index i and returns whether it meets the threshold.
+
+    Returns:
+        int: Index of the first accepted candidate, or the last candidate if none is accepted.
+    """
+    for index in range(num_candidates):
+        if is_accepted(index):
+            return index
+    return num_candidates - 1
+
+
+def _narrow(lower, upper, is_accepted, split):
+    """
+    Shrink (lower, upper) until adjacent, where lower is known rejected and upper known accepted.
+    """
+    while upper - lower > 1:
+        probe = lower + min(max(1, round((upper - lower) * split)), upper - lower - 1)
+        if is_accepted(probe):
+            upper = probe
+        else:
+            lower = probe
+    return upper
+
+
+def bracket_search(num_candidates, is_accepted):
+    """
+    Exponential bracketing (candidates 0, 1, 2, 4, 8, ...) followed by binary search in the bracket.
+
+    Assumes acceptance is monotone along the grid, and finds the same candidate as the linear
+    search with O(log n) trainings.
+
+    Args:
+        num_candidates (int): Number of candidates on the grid.
+        is_accepted (callable): Trains candidate index i and returns whether it meets the threshold.
+
+    Returns:
+        int: Index of the first accepted candidate, or the last candidate if none is accepted.
+    """
+    if is_accepted(0):
+        return 0
+    lower, offset = 0, 1
+    while True:
+        probe = min(offset, num_candidates - 1)
+        if probe == lower:
+            return num_candidates - 1  # Grid exhausted without acceptance
+        if is_accepted(probe):
+            return _narrow(lower, probe, is_accepted, 0.5)
+        lower, offset = probe, offset * 2
+
+
+def golden_section_search(num_candidates, is_accepted):
+    """
+    Golden-section narrowing over the whole grid, probing at the golden ratio split of the open interval.
+
+    The split is biased towards the smaller end of the interval, so smaller and cheaper models
+    are trained more often than with plain bisection.
+
+    Args:
+        num_candidates (int): Number of candidates on the grid.
+        is_accepted (callable): Trains candidate index i and returns whether it meets the threshold.
+
+    Returns:
+        int: Index of the first accepted candidate, or the last candidate if none is accepted.
+    """
+    # -1 is a virtual rejected candidate and num_candidates a virtual accepted one
+    first_accepted = _narrow(-1, num_candidates, is_accepted, GOLDEN_RATIO_SPLIT)
+    return min(first_accepted, num_candidates - 1)
+
+
+def _batch_probes(strategy, lower, upper, num_candidates, batch_size, bracketed):
+    """
+    Next candidate indices to train together, strictly between lower (rejected) and upper (accepted).
+    """
+    if strategy == 'linear':
+        return list(range(lower + 1, min(lower + 1 + batch_size, upper)))
+    if strategy == 'bracket' and not bracketed:
+        exponential = sorted({0} | {min(2 ** j, num_candidates - 1) for j in range(num_candidates.bit_length() + 1)})
+        return [index for index in exponential if index > lower][:batch_size]
+    gap = upper - lower
+    if batch_size == 1:
+        split = GOLDEN_RATIO_SPLIT if strategy == 'golden' else 0.5
+        return [lower + min(max(1, round(gap * split)), gap - 1)]
+    # K-section: batch_size evenly spaced probes split the interval into batch_size + 1 parts
+    return sorted({lower + min(max(1, round(gap * (i + 1) / (batch_size + 1))), gap - 1) for i in range(batch_size)})
+
+
+def batched_search(num_candidates, are_accepted, batch_size, strategy='linear'):
+    """
+    Run a search strategy training up to batch_size candidates at once, for parallel evaluation.
+
+    With batch_size 1 it probes the same candidates as the sequential strategy. Larger batches trade
+    extra trainings for fewer rounds: linear trains the next batch_size sizes, bracket the next
+    batch_size exponential probes, and binary/golden narrowing becomes K-section.
+
+    Args:
+        num_candidates (int): Number of candidates on the grid.
+        are_accepted (callable): Trains a list of candidate indices and returns their acceptance flags.
+        batch_size (int): Maximum number of candidates trained per round.
+        strategy (str): One of the SEARCH_STRATEGIES keys.
+
+    Returns:
+        int: Index of the first accepted candidate, or the last candidate if none is accepted.
+    """
+    if strategy not in SEARCH_STRATEGIES:
+        raise ValueError(f"[batched_search] Unknown strategy '{strategy}', expected one of {list(SEARCH_STRATEGIES)}")
+    # -1 is a virtual rejected candidate and num_candidates a virtual accepted one
+    lower, upper = -1, num_candidates
+    while upper - lower > 1:
+        probes = _batch_probes(strategy, lower, upper, num_candidates, batch_size, upper < num_candidates)
+        accepted = are_accepted(probes)
+        upper = min([index for index, ok in zip(probes, accepted) if ok] + [upper])
+        lower = max([index for index, ok in zip(probes, accepted) if not ok and index < upper] + [lower])
+    return min(upper, num_candidates - 1)
+
+
+SEARCH_STRATEGIES = {
+    'linear': linear_search,
+    'bracket': bracket_search,
+    'golden': golden_section_search
+}
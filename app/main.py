@@ -2,13 +2,11 @@
 
 import sys
 import json
-import pandas as pd
 from app.config_handler import load_config, save_config, remote_load_config, remote_save_config, remote_log
 from app.cli import parse_args
-from app.data_processor import process_data, run_autoencoder_pipeline, load_and_evaluate_encoder, load_and_evaluate_decoder
 from app.config import DEFAULT_VALUES
-from app.plugin_loader import load_plugin
-from config_merger import merge_config, process_unknown_args
+from app.plugin_loader import load_plugin, set_plugin_index_path
+from config_merger import merge_config, process_unknown_args, explicit_cli_args
 
 def main():
     print("Parsing initial arguments...")
@@ -34,11 +32,34 @@ def main():
     unknown_args_dict = process_unknown_args(unknown_args)
     config = merge_config(default_config, {}, {}, file_config, cli_args, unknown_args_dict)
         
+    if config.get('plugin_index_path'):
+        set_plugin_index_path(config['plugin_index_path'])
 
-    if config['load_encoder']:
+    if config.get('clear_csv_cache'):
+        from app.csv_cache import clear_cache
+        print("Clearing parsed CSV cache...")
+        clear_cache(config['csv_cache_dir'])
+
+
+    # TensorFlow and Keras are imported by app.data_processor, only once a command needs them
+    if config.get('batch_configs'):
+        from app.batch_runner import run_batch_command
+        print("Running batch of configurations...")
+        run_batch_command(config, explicit_cli_args(cli_args, unknown_args_dict))
+    elif config.get('serve_encoder'):
+        from app.encoding_server import run_encoding_server
+        print("Starting encoding server...")
+        run_encoding_server(config)
+    elif config.get('export_tflite'):
+        from app.tflite_export import export_tflite
+        print("Exporting models to TFLite...")
+        export_tflite(config)
+    elif config['load_encoder']:
+        from app.data_processor import load_and_evaluate_encoder
         print("Loading and evaluating encoder...")
         load_and_evaluate_encoder(config)
     elif config['load_decoder']:
+        from app.data_processor import load_and_evaluate_decoder
         print("Loading and evaluating decoder...")
         load_and_evaluate_decoder(config)
     else:
@@ -60,6 +81,7 @@ def main():
         encoder_plugin.set_params(**config)
         decoder_plugin.set_params(**config)
 
+        from app.data_processor import run_autoencoder_pipeline
         print("Processing and running autoencoder pipeline...")
         run_autoencoder_pipeline(config, encoder_plugin, decoder_plugin)
 
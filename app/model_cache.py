@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# app/model_cache.py
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+# Process-wide cache used by the load_and_evaluate functions, see get_model_cache
+_model_cache = None
+
+
+def model_key(file_path, compile=False):
+    """
+    Cache key of a saved model: resolved path, mtime, size and whether it is compiled.
+
+    A model rewritten at the same path gets a new key, so stale models are never returned.
+    """
+    real_path = os.path.realpath(file_path)
+    stat = os.stat(real_path)
+    return (real_path, stat.st_mtime_ns, stat.st_size, bool(compile))
+
+
+def model_memory_bytes(model):
+    """
+    Approximate resident size of a loaded model: its weights, or the flatbuffer of a TFLite model.
+    """
+    if hasattr(model, 'interpreter'):
+        return model.size_bytes
+    return sum(int(weight.shape.num_elements()) * weight.dtype.size for weight in model.weights)
+
+
+def _load(file_path, compile):
+    if file_path.endswith('.tflite'):
+        from app.tflite_export import TFLiteModel
+        return TFLiteModel(model_path=file_path)
+    from keras.models import load_model
+    return load_model(file_path, compile=compile)
+
+
+class ModelCache:
+    """
+    In-process LRU cache of loaded Keras and TFLite models with a memory budget.
+
+    Entries are keyed by model_key, so several models stay resident at once and a model file that
+    changes on disk is reloaded. Least recently used models are evicted beyond max_bytes, except the
+    one just requested.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes (int): Memory budget of the resident models, None for no limit.
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (model, size in bytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def total_bytes(self):
+        return sum(size for _, size in self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, file_path):
+        return any(key[0] == os.path.realpath(file_path) for key in self._entries)
+
+    def get(self, file_path, compile=False):
+        """
+        Loaded model for file_path, from the cache or loaded once.
+
+        Args:
+            file_path (str): .keras, .h5 or .tflite file.
+            compile (bool): Whether Keras models are compiled, only needed for evaluate or training.
+
+        Returns:
+            keras.Model or TFLiteModel: The model, shared with later callers of the same file.
+        """
+        key = model_key(file_path, compile)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            start_time = time.perf_counter()
+            model = _load(file_path, compile)
+            size = model_memory_bytes(model)
+            print(f"[ModelCache] Loaded {file_path} ({size / 1024 ** 2:.1f}MB) in {time.perf_counter() - start_time:.2f}s")
+            # Older versions of the same file can no longer be requested
+            for stale_key in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                del self._entries[stale_key]
+            self._entries[key] = (model, size)
+            self._evict()
+            return model
+
+    def preload(self, file_paths, compile=False):
+        """
+        Load several models so that they are resident together, e.g. for a batch of evaluation jobs.
+
+        Returns:
+            list: The models, in the order of file_paths.
+        """
+        return [self.get(file_path, compile) for file_path in file_paths]
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        total_bytes = self.total_bytes
+        while total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, (_, size) = self._entries.popitem(last=False)
+            print(f"[ModelCache] Evicting {key[0]} ({size / 1024 ** 2:.1f}MB)")
+            total_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns:
+            dict: Resident models, their total size and the hit, miss and eviction counts.
+        """
+        with self._lock:
+            return {
+                'models': [key[0] for key in self._entries],
+                'total_bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+def get_model_cache(max_bytes=None):
+    """
+    Process-wide model cache, created on first use. A max_bytes argument updates its budget.
+    """
+    global _model_cache
+    if _model_cache is None:
+        _model_cache = ModelCache(DEFAULT_MAX_BYTES)
+    if max_bytes is not None:
+        _model_cache.max_bytes = max_bytes
+    return _model_cache
+
+
+def load_cached_model(file_path, config=None, compile=False):
+    """
+    Load a model through the process-wide cache, with the budget from config['model_cache_max_bytes'].
+    """
+    return get_model_cache((config or {}).get('model_cache_max_bytes')).get(file_path, compile)
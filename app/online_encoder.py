@@ -0,0 +1,149 @@
+import numpy as np
+from app.fast_inference import fast_inference
+
+# app/online_encoder.py
+
+
+class RingWindow:
+    """
+    Last window_size rows of a stream in a double-length ring buffer.
+
+    Every row is written twice, at its slot and window_size slots later, so the current window
+    (oldest to newest) is always one contiguous slice and appending a row is O(num_features).
+    """
+
+    def __init__(self, window_size, num_features, dtype=np.float32):
+        self.window_size = window_size
+        self._buffer = np.zeros((2 * window_size, num_features), dtype=dtype)
+        self._next = 0
+        self.count = 0
+
+    @property
+    def ready(self):
+        """Whether window_size rows have been appended."""
+        return self.count >= self.window_size
+
+    def append(self, row):
+        self._buffer[self._next] = row
+        self._buffer[self._next + self.window_size] = row
+        self._next = (self._next + 1) % self.window_size
+        self.count += 1
+
+    def window(self):
+        """View of the current window, oldest row first (not a copy, it changes on the next append)."""
+        return self._buffer[self._next:self._next + self.window_size]
+
+
+class OnlineEncoder:
+    """
+    Incremental encoder for live streams: each new row yields the latent vector of the newest window.
+
+    Each stream keeps only its last window_size rows, so a tick costs one forward pass instead of
+    re-windowing history, and the ticks of many streams are encoded together in one batch.
+    """
+
+    def __init__(self, model, use_sliding_windows=True):
+        """
+        Args:
+            model (keras.Model or str): Encoder model or path to a .keras file.
+            use_sliding_windows (bool): Whether the encoder takes windows (window_size, num_features) or
+                single rows (num_features, 1). Encoders with 2D inputs (num_samples, num_features), such
+                as the ANN encoder, always take single rows.
+        """
+        if isinstance(model, str):
+            from app.model_cache import get_model_cache
+            model = get_model_cache().get(model)
+        self.model = model
+        self.use_sliding_windows = use_sliding_windows
+        self.flat_input = len(model.input_shape) == 2  # Rows fed as (num_samples, num_features)
+        if self.flat_input:
+            self.window_size, self.num_features = 1, model.input_shape[1]
+        elif use_sliding_windows:
+            _, self.window_size, self.num_features = model.input_shape
+        else:
+            self.window_size, self.num_features = 1, model.input_shape[1]
+        self._streams = {}
+        self._inference = fast_inference(model)
+
+    @property
+    def streams(self):
+        return list(self._streams)
+
+    def _stream(self, stream_id):
+        if stream_id not in self._streams:
+            self._streams[stream_id] = RingWindow(self.window_size, self.num_features)
+        return self._streams[stream_id]
+
+    def reset(self, stream_id):
+        """Forget the history of a stream."""
+        self._streams.pop(stream_id, None)
+
+    def warm_up(self, stream_id, rows):
+        """
+        Fill a stream's window from history rows without encoding them.
+
+        Args:
+            stream_id: Stream identifier.
+            rows (np.ndarray): History rows with shape (num_rows, num_features), oldest first.
+        """
+        stream = self._stream(stream_id)
+        for row in np.asarray(rows, dtype=np.float32)[-self.window_size:]:
+            stream.append(row)
+
+    def _encode(self, windows):
+        if self.flat_input:
+            windows = windows.reshape(len(windows), self.num_features)
+        elif not self.use_sliding_windows:
+            windows = windows.reshape(len(windows), self.num_features, 1)
+        encoded = self._inference.encode_batch(windows)
+        return encoded.reshape(len(encoded), -1)
+
+    def push(self, stream_id, row):
+        """
+        Append a row to a stream and encode its newest window.
+
+        Args:
+            stream_id: Stream identifier, new streams are created on their first row.
+            row (array-like): New row with num_features values.
+
+        Returns:
+            np.ndarray: Latent vector, or None while the stream has fewer than window_size rows.
+        """
+        return self.push_many({stream_id: row})[stream_id]
+
+    def push_many(self, rows_by_stream):
+        """
+        Append one row to each of several streams and encode all their newest windows in one forward pass.
+
+        Args:
+            rows_by_stream (dict): Stream identifier to new row.
+
+        Returns:
+            dict: Stream identifier to latent vector, None for streams still warming up.
+
+        Raises:
+            ValueError: If a row does not have num_features values; no stream is changed then.
+        """
+        # Validate every row before appending any, so a rejected tick leaves all streams unchanged
+        rows = {}
+        for stream_id, row in rows_by_stream.items():
+            row = np.asarray(row, dtype=np.float32).reshape(-1)
+            if row.shape[0] != self.num_features:
+                raise ValueError(f"[OnlineEncoder] Expected a row of {self.num_features} values for stream {stream_id}, got {row.shape[0]}")
+            rows[stream_id] = row
+
+        ready = []
+        for stream_id, row in rows.items():
+            stream = self._stream(stream_id)
+            stream.append(row)
+            if stream.ready:
+                ready.append(stream_id)
+
+        results = {stream_id: None for stream_id in rows_by_stream}
+        if ready:
+            batch = np.empty((len(ready), self.window_size, self.num_features), dtype=np.float32)
+            for i, stream_id in enumerate(ready):
+                batch[i] = self._streams[stream_id].window()
+            for stream_id, encoded in zip(ready, self._encode(batch)):
+                results[stream_id] = encoded
+        return results
@@ -0,0 +1,214 @@
+import os
+import queue
+import shutil
+import tempfile
+import multiprocessing
+import numpy as np
+from app.interface_search import batched_search
+from app.windowed_dataset import WindowedDataset
+from app.data_profile import with_profile
+from app.dataset_information import as_windowed_dataset
+from app.instrumentation import start_recording, stop_recording, stage
+from app.search_ledger import candidate_dir
+
+# app/parallel_search.py
+
+# Per-process state of the search workers, set once by the pool initializer
+_worker_state = {}
+
+
+def worker_cpu_sets(num_workers):
+    """
+    Split the CPUs available to this process into num_workers disjoint sets of contiguous cores.
+
+    Args:
+        num_workers (int): Number of worker processes.
+
+    Returns:
+        list: One list of CPU ids per worker (empty lists if affinity is not supported).
+    """
+    if not hasattr(os, 'sched_getaffinity'):
+        return [[] for _ in range(num_workers)]
+    cpus = sorted(os.sched_getaffinity(0))
+    return [[int(cpu) for cpu in cores] for cores in np.array_split(np.array(cpus), num_workers)]
+
+
+def share_dataset(data, directory, name):
+    """
+    Save a dataset once so that every worker can memory-map it instead of re-parsing the CSV files.
+
+    Arrays and the 2D series of windowed datasets are written as .npy files, streaming datasets
+    are passed as is since they only hold the file path and re-read the CSV in chunks. Sliding
+    window views are written as their 2D series too (window_size times smaller than the windows)
+    and opened as WindowedDataset. Workers gather their training batches from the memory map
+    (see WindowedDataset.as_tf_dataset), so the series stays shared in the page cache.
+
+    Args:
+        data: Windows, rows, WindowedDataset or StreamingWindowedDataset.
+        directory (str): Directory for the shared files.
+        name (str): File name prefix.
+
+    Returns:
+        tuple: Picklable description of the dataset for open_shared_dataset.
+    """
+    windowed = as_windowed_dataset(data)
+    if windowed is not None:
+        data = windowed  # Share the series of a window view, not the materialized windows
+    if isinstance(data, WindowedDataset):
+        file_path = os.path.join(directory, f"{name}.npy")
+        np.save(file_path, data.series)
+        return ('windowed', file_path, data.window_size, data.profile)
+    if isinstance(data, np.ndarray):
+        file_path = os.path.join(directory, f"{name}.npy")
+        np.save(file_path, data)
+        return ('array', file_path, getattr(data, 'profile', None))
+    return ('object', data)
+
+
+def open_shared_dataset(spec):
+    """
+    Open a dataset saved by share_dataset, memory-mapped read-only.
+    """
+    kind = spec[0]
+    if kind == 'windowed':
+        return WindowedDataset(np.load(spec[1], mmap_mode='r'), spec[2], profile=spec[3])
+    if kind == 'array':
+        array = np.load(spec[1], mmap_mode='r')
+        return array if spec[2] is None else with_profile(array, spec[2])
+    return spec[1]
+
+
+def configure_worker(cpu_sets, threads_per_worker):
+    """
+    Pin a spawned worker process to the next CPU set of the queue and bound its TensorFlow thread pools.
+    """
+    try:
+        cores = cpu_sets.get_nowait()
+    except queue.Empty:
+        cores = []  # Replacement of a dead worker, its CPU set was already taken
+    if cores and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cores)
+    import tensorflow as tf
+    # Must run before the first TensorFlow op of the process
+    tf.config.threading.set_intra_op_parallelism_threads(threads_per_worker)
+    tf.config.threading.set_inter_op_parallelism_threads(min(2, threads_per_worker))
+
+
+def _init_worker(cpu_sets, threads_per_worker, training_spec, validation_spec):
+    """
+    Pin the worker to its CPU set, bound the TensorFlow thread pools and open the shared datasets.
+    """
+    configure_worker(cpu_sets, threads_per_worker)
+    _worker_state['training_data'] = open_shared_dataset(training_spec)
+    _worker_state['validation_data'] = open_shared_dataset(validation_spec)
+
+
+def _train_candidate_task(task):
+    """
+    Train one interface size in a worker and save its models to the candidate directory.
+    """
+    from app.data_processor import train_interface_candidate
+
+    (config, encoder_class, encoder_params, decoder_class, decoder_params,
+     input_size, interface_size, output_dir) = task
+    encoder_plugin = encoder_class()
+    encoder_plugin.set_params(**encoder_params)
+    decoder_plugin = decoder_class()
+    decoder_plugin.set_params(**decoder_params)
+
+    # Stages are recorded per candidate in the worker and returned with its log entry
+    os.makedirs(output_dir, exist_ok=True)
+    start_recording(config.get('trace_memory', False))
+    with stage('candidate', interface_size=interface_size, worker_pid=os.getpid()):
+        manager, candidate = train_interface_candidate(
+            config, encoder_plugin, decoder_plugin, input_size, interface_size,
+            _worker_state['training_data'], _worker_state['validation_data']
+        )
+        encoder_file = os.path.join(output_dir, f"encoder_{interface_size}.keras")
+        decoder_file = os.path.join(output_dir, f"decoder_{interface_size}.keras")
+        with stage('save'):
+            manager.save_encoder(encoder_file)
+            manager.save_decoder(decoder_file)
+    candidate['stages'] = stop_recording()
+    return candidate, encoder_file, decoder_file, encoder_plugin.params, decoder_plugin.params
+
+
+def parallel_interface_search(config, encoder_plugin, decoder_plugin, input_size, sizes, training_data, validation_data,
+                              num_workers, encoder_model_filename, decoder_model_filename, ledger=None):
+    """
+    Interface size search training num_workers candidates at once in a process pool.
+
+    Workers are spawned processes pinned to disjoint CPU sets with bounded TensorFlow thread
+    pools, and memory-map the preprocessed datasets written once by the parent. Warm start is
+    not used since the candidates of a round are trained concurrently.
+
+    Args:
+        config (dict): Configuration dictionary.
+        encoder_plugin: Encoder plugin instance, only its class and parameters are sent to workers.
+        decoder_plugin: Decoder plugin instance, only its class and parameters are sent to workers.
+        input_size (int): Window size, or number of features without sliding windows.
+        sizes (list): Candidate interface sizes in search order.
+        training_data: Training windows, rows or windowed dataset.
+        validation_data: Validation windows, rows or windowed dataset.
+        num_workers (int): Number of worker processes and candidates trained per round.
+        encoder_model_filename (str): Where to save the selected encoder.
+        decoder_model_filename (str): Where to save the selected decoder.
+        ledger (SearchLedger): Completed candidates, skipped and extended with the new ones; their models
+            are saved in the run directory instead of the temporary one.
+
+    Returns:
+        tuple: The selected candidate's log entry and the log entries of all trained candidates.
+    """
+    search_strategy = config.get('search_strategy', 'linear')
+    threads_per_worker = config.get('threads_per_worker') or max(1, (os.cpu_count() or 1) // num_workers)
+    if config.get('warm_start', False):
+        print("[parallel_interface_search] Warm start is not used when candidates are trained in parallel.")
+    worker_config = dict(config, warm_start=False)
+    print(f"[parallel_interface_search] {num_workers} workers with {threads_per_worker} threads each.")
+
+    candidates = []
+    results = {}
+    context = multiprocessing.get_context('spawn')  # TensorFlow is not fork-safe
+    with tempfile.TemporaryDirectory(prefix='interface_search_') as work_dir:
+        training_spec = share_dataset(training_data, work_dir, 'training')
+        validation_spec = share_dataset(validation_data, work_dir, 'validation')
+        cpu_sets = context.Queue()
+        for cores in worker_cpu_sets(num_workers):
+            cpu_sets.put(cores)
+
+        with context.Pool(num_workers, initializer=_init_worker,
+                          initargs=(cpu_sets, threads_per_worker, training_spec, validation_spec)) as pool:
+
+            def are_accepted(indices):
+                pending = []
+                for index in indices:
+                    entry = ledger.get(sizes[index]) if ledger and index not in results else None
+                    if entry is not None:
+                        print(f"[parallel_interface_search] Interface size {sizes[index]} was completed by an earlier run, using its ledger entry.")
+                        results[index] = (entry['candidate'], entry['encoder_file'], entry['decoder_file'],
+                                          entry['encoder_params'], entry['decoder_params'])
+                        candidates.append(entry['candidate'])
+                    elif index not in results and index not in pending:
+                        pending.append(index)
+                tasks = [
+                    (worker_config, type(encoder_plugin), encoder_plugin.params, type(decoder_plugin), decoder_plugin.params,
+                     input_size, sizes[index], candidate_dir(config['checkpoint_dir'], sizes[index]) if ledger else work_dir)
+                    for index in pending
+                ]
+                for index, result in zip(pending, pool.map(_train_candidate_task, tasks, chunksize=1)):
+                    results[index] = result
+                    candidates.append(result[0])
+                    if ledger:
+                        ledger.record(*result)
+                return [results[index][0]['accepted'] for index in indices]
+
+            best_index = batched_search(len(sizes), are_accepted, num_workers, search_strategy)
+            are_accepted([best_index])
+
+        best_candidate, encoder_file, decoder_file, encoder_params, decoder_params = results[best_index]
+        shutil.copyfile(encoder_file, encoder_model_filename)
+        shutil.copyfile(decoder_file, decoder_model_filename)
+    # Keep the parameters set by the selected candidate's configure_size for the debug info
+    encoder_plugin.params.update(encoder_params)
+    decoder_plugin.params.update(decoder_params)
+    return best_candidate, candidates
@@ -1,17 +1,145 @@
+import ast
+import hashlib
+import json
+import os
+import sys
+import importlib.util
 from importlib.metadata import entry_points, EntryPoint
 
+PLUGIN_GROUPS = ('feature_extractor.encoders', 'feature_extractor.decoders')
+
+# Registry of the plugin groups, built once per process (or read from the disk index)
+_registry = None
+# Optional JSON file persisting the registry across processes, see set_plugin_index_path
+_index_path = None
+# Loaded plugin classes by (group, name)
+_plugin_classes = {}
+
+
+def set_plugin_index_path(path):
+    """
+    Persist the plugin registry to path (None disables it). The index is rebuilt whenever the set of
+    installed distributions changes.
+    """
+    global _index_path, _registry
+    _index_path = path
+    _registry = None
+
+
+def clear_plugin_registry():
+    """
+    Forget the in-process registry and loaded classes, e.g. after installing plugins at runtime.
+    """
+    global _registry
+    _registry = None
+    _plugin_classes.clear()
+
+
+def _distributions_key():
+    """
+    Hash of the Python path and the metadata directories installed on it, without reading them.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sys.path:
+        digest.update(f"path:{path}\n".encode())
+        if not os.path.isdir(path):
+            continue
+        try:
+            entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(('.dist-info', '.egg-info')):
+                digest.update(f"{entry.name}:{entry.stat().st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _group_entry_points(group):
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, 'select'):
+        return all_entry_points.select(group=group)
+    return all_entry_points.get(group, [])  # Python < 3.10
+
+
+def _read_index(key):
+    if not _index_path or not os.path.exists(_index_path):
+        return None
+    try:
+        with open(_index_path, 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[plugin_loader] Ignoring unreadable plugin index {_index_path}: {e}")
+        return None
+    return index if index.get('key') == key else None
+
+
+def _write_index(index):
+    if not _index_path:
+        return
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(_index_path)), exist_ok=True)
+        tmp_path = f"{_index_path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, _index_path)
+    except OSError as e:
+        print(f"[plugin_loader] Failed to write plugin index {_index_path}: {e}")
+
+
+def plugin_registry():
+    """
+    Entry points of the plugin groups, enumerated once per process.
+
+    Returns:
+        dict: {'key': ..., 'groups': {group: {name: 'module:attr'}}, 'params': {'module:attr': {...}}}.
+    """
+    global _registry
+    if _registry is None:
+        key = _distributions_key() if _index_path else None
+        _registry = _read_index(key) if key else None
+        if _registry is None:
+            _registry = {
+                'key': key,
+                'groups': {group: {ep.name: ep.value for ep in _group_entry_points(group)} for group in PLUGIN_GROUPS},
+                'params': {}
+            }
+            _write_index(_registry)
+    return _registry
+
+
+def _group_plugins(plugin_group):
+    registry = plugin_registry()
+    if plugin_group not in registry['groups']:
+        # Groups other than the encoder/decoder ones are added on first use
+        registry['groups'][plugin_group] = {ep.name: ep.value for ep in _group_entry_points(plugin_group)}
+    return registry['groups'][plugin_group]
+
+
+def list_plugins(plugin_group):
+    """
+    Names of the plugins installed in a group.
+    """
+    return sorted(_group_plugins(plugin_group))
+
+
+def _entry_point_value(plugin_group, plugin_name):
+    value = _group_plugins(plugin_group).get(plugin_name)
+    if value is None:
+        print(f"Failed to find plugin {plugin_name} in group {plugin_group}")
+        raise ImportError(f"Plugin {plugin_name} not found in group {plugin_group}.")
+    return value
+
+
 def load_plugin(plugin_group, plugin_name):
     print(f"Attempting to load plugin: {plugin_name} from group: {plugin_group}")
+    value = _entry_point_value(plugin_group, plugin_name)
     try:
-        group_entries = entry_points().get(plugin_group, [])
-        entry_point = next(ep for ep in group_entries if ep.name == plugin_name)
-        plugin_class = entry_point.load()
+        if (plugin_group, plugin_name) not in _plugin_classes:
+            _plugin_classes[(plugin_group, plugin_name)] = EntryPoint(name=plugin_name, value=value, group=plugin_group).load()
+        plugin_class = _plugin_classes[(plugin_group, plugin_name)]
         required_params = list(plugin_class.plugin_params.keys())
         print(f"Successfully loaded plugin: {plugin_name} with params: {plugin_class.plugin_params}")
         return plugin_class, required_params
-    except StopIteration:
-        print(f"Failed to find plugin {plugin_name} in group {plugin_group}")
-        raise ImportError(f"Plugin {plugin_name} not found in group {plugin_group}.")
     except Exception as e:
         print(f"Failed to load plugin {plugin_name} from group {plugin_group}, Error: {e}")
         raise
@@ -21,17 +149,67 @@ def load_encoder_decoder_plugins(encoder_name, decoder_name):
     decoder_plugin, decoder_params = load_plugin('feature_extractor.decoders', decoder_name)
     return encoder_plugin, encoder_params, decoder_plugin, decoder_params
 
+
+def read_plugin_params(entry_point_value):
+    """
+    Read a plugin class's plugin_params literal from its source file without importing the module.
+
+    Args:
+        entry_point_value (str): Entry point value, 'module:Class'.
+
+    Returns:
+        tuple: (params dict, source file path), or (None, None) if it is not a plain literal.
+    """
+    module_name, _, class_name = entry_point_value.partition(':')
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None, None
+    if spec is None or not spec.origin or not spec.origin.endswith('.py'):
+        return None, None
+    with open(spec.origin, 'r') as f:
+        tree = ast.parse(f.read(), filename=spec.origin)
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            for statement in node.body:
+                if isinstance(statement, ast.Assign) and any(
+                        isinstance(target, ast.Name) and target.id == 'plugin_params' for target in statement.targets):
+                    try:
+                        return ast.literal_eval(statement.value), spec.origin
+                    except ValueError:
+                        return None, None
+    return None, None
+
+
+def _json_round_trips(params):
+    try:
+        return json.loads(json.dumps(params)) == params
+    except (TypeError, ValueError):
+        return False
+
+
 def get_plugin_params(plugin_group, plugin_name):
     print(f"Getting plugin parameters for: {plugin_name} from group: {plugin_group}")
+    value = _entry_point_value(plugin_group, plugin_name)
+    cached_params = plugin_registry()['params']
+    cached = cached_params.get(value)
+    if cached and os.path.exists(cached['source']) and os.stat(cached['source']).st_mtime_ns == cached['mtime_ns']:
+        return dict(cached['params'])
     try:
-        group_entries = entry_points().get(plugin_group, [])
-        entry_point = next(ep for ep in group_entries if ep.name == plugin_name)
-        plugin_class = entry_point.load()
-        print(f"Retrieved plugin params: {plugin_class.plugin_params}")
-        return plugin_class.plugin_params
-    except StopIteration:
-        print(f"Failed to find plugin {plugin_name} in group {plugin_group}")
-        raise ImportError(f"Plugin {plugin_name} not found in group {plugin_group}.")
+        if (plugin_group, plugin_name) in _plugin_classes:
+            plugin_class = _plugin_classes[(plugin_group, plugin_name)]
+            params = plugin_class.plugin_params
+            source = getattr(sys.modules.get(plugin_class.__module__), '__file__', None)
+        else:
+            # Parse the source so that reading defaults does not import TensorFlow
+            params, source = read_plugin_params(value)
+            if params is None:
+                params = load_plugin(plugin_group, plugin_name)[0].plugin_params
+        print(f"Retrieved plugin params: {params}")
     except Exception as e:
         print(f"Failed to get plugin params for {plugin_name} from group {plugin_group}, Error: {e}")
         raise ImportError(f"Failed to get plugin params for {plugin_name} from group {plugin_group}, Error: {e}")
+    if source and _json_round_trips(params):
+        cached_params[value] = {'params': params, 'source': source, 'mtime_ns': os.stat(source).st_mtime_ns}
+        _write_index(plugin_registry())
+    return dict(params)
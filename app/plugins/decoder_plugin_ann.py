@@ -4,6 +4,7 @@ from keras.layers import Dense, Dropout,Input, LeakyReLU,BatchNormalization
 from keras.optimizers import Adam
 from tensorflow.keras.initializers import GlorotUniform, HeNormal
 from keras.regularizers import l2
+from app.fast_inference import predict
 
 class Plugin:
     """
@@ -98,7 +99,7 @@ class Plugin:
         # Debugging message
         print(f"Decoding data with shape: {encoded_data.shape}")
         encoded_data = encoded_data.reshape((encoded_data.shape[0], -1))  # Flatten the data
-        decoded_data = self.model.predict(encoded_data)
+        decoded_data = predict(self.model, encoded_data)
         print(f"Decoded data shape: {decoded_data.shape}")
         return decoded_data
 
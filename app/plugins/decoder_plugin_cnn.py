@@ -11,6 +11,7 @@ from keras.callbacks import EarlyStopping
 from keras.layers import BatchNormalization, MaxPooling1D, Cropping1D, LeakyReLU,Input
 import math
 from tensorflow.keras.layers import ZeroPadding1D
+from app.fast_inference import predict
 
 class Plugin:
     plugin_params = {
@@ -143,7 +144,7 @@ class Plugin:
 
     def decode(self, encoded_data, use_sliding_windows, original_feature_size):
         print(f"[decode] Decoding data with shape: {encoded_data.shape}")
-        decoded_data = self.model.predict(encoded_data)
+        decoded_data = predict(self.model, encoded_data)
 
         if not use_sliding_windows:
             # Reshape to match the original feature size if not using sliding windows
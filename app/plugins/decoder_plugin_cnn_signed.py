@@ -8,6 +8,7 @@ from keras.regularizers import l2
 from keras.callbacks import EarlyStopping
 from keras.layers import BatchNormalization, MaxPooling1D, Cropping1D, LeakyReLU,Input
 import math
+from app.fast_inference import predict
 
 class Plugin:
     plugin_params = {
@@ -141,7 +142,7 @@ class Plugin:
 
     def decode(self, encoded_data):
         encoded_data = encoded_data.reshape((encoded_data.shape[0], -1))
-        decoded_data = self.model.predict(encoded_data)
+        decoded_data = predict(self.model, encoded_data)
         decoded_data = decoded_data.reshape((decoded_data.shape[0], -1))
         return decoded_data
 
@@ -5,6 +5,7 @@ from keras.optimizers import Adam
 from tensorflow.keras.initializers import GlorotUniform, HeNormal
 from keras.regularizers import l2
 from keras.callbacks import EarlyStopping
+from app.fast_inference import predict
 
 
 class Plugin:
@@ -211,7 +212,7 @@ class Plugin:
             raise ValueError("[decode] Decoder model is not configured.")
 
         print(f"[decode] Decoding data with shape={encoded_data.shape}")
-        decoded_data = self.model.predict(encoded_data)
+        decoded_data = predict(self.model, encoded_data)
         print(f"[decode] Decoded data shape={decoded_data.shape}")
 
         # If univariate => (batch_size, time_steps, 1), we can squeeze last dimension
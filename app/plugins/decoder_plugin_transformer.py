@@ -4,6 +4,7 @@ from keras.layers import Input, Dense, Flatten, Reshape, GlobalAveragePooling1D,
 from keras.optimizers import Adam
 from keras_multi_head import MultiHeadAttention
 from tensorflow.keras.initializers import GlorotUniform, HeNormal
+from app.fast_inference import predict
 
 class Plugin:
     plugin_params = {
@@ -96,7 +97,7 @@ class Plugin:
 
     def decode(self, encoded_data):
         print(f"Decoding data with shape: {encoded_data.shape}")
-        decoded_data = self.model.predict(encoded_data)
+        decoded_data = predict(self.model, encoded_data)
         print(f"Decoded data shape: {decoded_data.shape}")
         return decoded_data
 
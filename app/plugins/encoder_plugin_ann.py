@@ -4,6 +4,7 @@ from keras.layers import Dense, Input, Dropout, LeakyReLU, BatchNormalization
 from keras.optimizers import Adam
 from tensorflow.keras.initializers import GlorotUniform, HeNormal
 from keras.regularizers import l2
+from app.fast_inference import predict
 
 class Plugin:
     """
@@ -100,7 +101,7 @@ class Plugin:
 
     def encode(self, data):
         print(f"Encoding data with shape: {data.shape}")
-        encoded_data = self.encoder_model.predict(data)
+        encoded_data = predict(self.encoder_model, data)
         print(f"Encoded data shape: {encoded_data.shape}")
         return encoded_data
 
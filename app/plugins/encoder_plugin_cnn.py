@@ -8,6 +8,7 @@ from keras.regularizers import l2
 from keras.callbacks import EarlyStopping
 from keras.layers import BatchNormalization, LeakyReLU, Reshape
 from tensorflow.keras.losses import Huber
+from app.fast_inference import predict
 
 class Plugin:
     """
@@ -147,7 +148,7 @@ class Plugin:
 
     def encode(self, data):
         print(f"Encoding data with shape: {data.shape}")
-        encoded_data = self.encoder_model.predict(data)
+        encoded_data = predict(self.encoder_model, data)
         print(f"Encoded data shape: {encoded_data.shape}")
         return encoded_data
 
@@ -7,6 +7,7 @@ from tensorflow.keras.initializers import GlorotUniform, HeNormal
 from keras.regularizers import l2
 from keras.callbacks import EarlyStopping
 from keras.layers import BatchNormalization, LeakyReLU, Reshape
+from app.fast_inference import predict
 
 class Plugin:
     """
@@ -135,7 +136,7 @@ class Plugin:
 
     def encode(self, data):
         print(f"Encoding data with shape: {data.shape}")
-        encoded_data = self.encoder_model.predict(data)
+        encoded_data = predict(self.encoder_model, data)
         print(f"Encoded data shape: {encoded_data.shape}")
         return encoded_data
 
@@ -5,6 +5,7 @@ from tensorflow.keras.initializers import GlorotUniform, HeNormal
 from keras.regularizers import l2
 from keras.callbacks import EarlyStopping
 import numpy as np
+from app.fast_inference import predict
 
 
 class Plugin:
@@ -179,7 +180,7 @@ class Plugin:
             raise ValueError("[encode] Encoder model is not configured.")
         print(f"[encode] Encoding data with shape: {data.shape}")
 
-        encoded_data = self.encoder_model.predict(data, verbose=1)
+        encoded_data = predict(self.encoder_model, data)
         print(f"[encode] Encoded output shape: {encoded_data.shape}")
         return encoded_data
 
@@ -4,6 +4,7 @@ from keras.layers import Input, Dense, Flatten, GlobalAveragePooling1D, LayerNor
 from keras.optimizers import Adam
 from keras_multi_head import MultiHeadAttention
 from tensorflow.keras.initializers import GlorotUniform, HeNormal
+from app.fast_inference import predict
 
 class Plugin:
     """
@@ -103,7 +104,7 @@ class Plugin:
 
     def encode(self, data):
         print(f"Encoding data with shape: {data.shape}")
-        encoded_data = self.encoder_model.predict(data)
+        encoded_data = predict(self.encoder_model, data)
         print(f"Encoded data shape: {encoded_data.shape}")
         return encoded_data
 
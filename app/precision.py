@@ -0,0 +1,62 @@
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.mixed_precision import set_global_policy
+
+# app/precision.py
+
+# Keras dtype policy for each precision option
+PRECISION_POLICIES = {
+    'float32': 'float32',
+    'bfloat16': 'mixed_bfloat16',
+    'mixed_float16': 'mixed_float16'
+}
+
+# Dtype of the NumPy data path. Mixed policies keep float32 inputs and variables and cast inside the layers.
+DATA_DTYPE = np.float32
+
+
+def cpu_supports_bfloat16():
+    """
+    Whether the CPU has native bfloat16 instructions (AVX512_BF16 or AMX_BF16), Linux only.
+    """
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return 'avx512_bf16' in flags or 'amx_bf16' in flags
+
+
+def resolve_precision_policy(precision):
+    """
+    Return the Keras policy name for a precision option, falling back to float32 if bfloat16 is not supported.
+
+    Args:
+        precision (str): One of the PRECISION_POLICIES keys.
+
+    Returns:
+        str: Keras dtype policy name.
+    """
+    if precision not in PRECISION_POLICIES:
+        raise ValueError(f"[precision] Unknown precision '{precision}', expected one of {list(PRECISION_POLICIES)}")
+    if precision == 'bfloat16' and not cpu_supports_bfloat16():
+        if not tf.config.list_physical_devices('GPU'):
+            print("[precision] bfloat16 is not supported by this CPU, using float32 instead.")
+            return PRECISION_POLICIES['float32']
+    return PRECISION_POLICIES[precision]
+
+
+def apply_precision_policy(precision):
+    """
+    Set the Keras global dtype policy for the models built next.
+
+    Args:
+        precision (str): One of the PRECISION_POLICIES keys.
+
+    Returns:
+        str: The Keras policy name that was applied.
+    """
+    policy = resolve_precision_policy(precision)
+    set_global_policy(policy)
+    print(f"[precision] Using dtype policy: {policy}")
+    return policy
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+from app.interface_search import meets_threshold
+from app.csv_cache import file_fingerprint
+
+# app/search_ledger.py
+
+LEDGER_VERSION = 1
+
+# Settings that change the training result of a candidate; a ledger written with other values is not reused.
+# The threshold and the search grid are not included: acceptance is re-evaluated from the stored metrics.
+# The threshold stopping options are, since they decide when a candidate's training ends.
+SEARCH_SETTINGS = (
+    'input_file', 'validation_file', 'headers', 'force_date', 'encoder_plugin', 'decoder_plugin',
+    'use_sliding_windows', 'window_size', 'epochs', 'batch_size', 'learning_rate', 'precision', 'warm_start',
+    'threshold_stopping', 'threshold_check_every', 'threshold_validation_samples'
+)
+
+# Data files identified by their contents as well, a file rewritten under the same path starts a new search
+DATA_FILE_SETTINGS = ('input_file', 'validation_file')
+
+
+def ledger_path(checkpoint_dir):
+    return os.path.join(checkpoint_dir, 'search_ledger.json')
+
+
+def candidate_dir(checkpoint_dir, interface_size):
+    """
+    Directory of one interface size candidate in the run directory, shared with its training checkpoint.
+    """
+    return os.path.join(checkpoint_dir, f"interface_{interface_size}")
+
+
+def _data_fingerprint(file_path, config):
+    """
+    csv_cache fingerprint of a data file with the parsing options of config, None if there is no such file.
+    """
+    if not file_path or not os.path.exists(file_path):
+        return None
+    return file_fingerprint(file_path, bool(config.get('headers', False)), bool(config.get('force_date', False)))
+
+
+def architecture_params(plugin):
+    """
+    Current values of a plugin's own parameters (the keys of its plugin_params, e.g. intermediate_layers
+    or dropout_rate), without the sizes configure_size sets for each candidate.
+    """
+    if plugin is None:
+        return None
+    defaults = getattr(plugin, 'plugin_params', {})
+    return _json_params({name: plugin.params.get(name, value) for name, value in defaults.items()})
+
+
+def search_settings(config, encoder_plugin=None, decoder_plugin=None):
+    settings = {key: config.get(key) for key in SEARCH_SETTINGS}
+    for key in DATA_FILE_SETTINGS:
+        settings[f"{key}_fingerprint"] = _data_fingerprint(config.get(key), config)
+    settings['encoder_params'] = architecture_params(encoder_plugin)
+    settings['decoder_params'] = architecture_params(decoder_plugin)
+    return json.loads(json.dumps(settings, default=str))
+
+
+def _json_params(params):
+    """
+    Plugin parameters that survive a JSON round trip, the others are left out of the ledger.
+    """
+    kept = {}
+    for name, value in (params or {}).items():
+        try:
+            kept[name] = json.loads(json.dumps(value))
+        except (TypeError, ValueError):
+            continue
+    return kept
+
+
+class SearchLedger:
+    """
+    Completed interface size candidates of a search, with their metrics and saved models, persisted
+    after every candidate so that a restarted search skips them.
+    """
+
+    def __init__(self, file_path, config, resume=False, encoder_plugin=None, decoder_plugin=None):
+        """
+        Args:
+            file_path (str): Ledger JSON file.
+            config (dict): Configuration of the search, see SEARCH_SETTINGS.
+            resume (bool): Reuse the candidates of an existing ledger, otherwise it is overwritten.
+            encoder_plugin, decoder_plugin: Plugins of the search, whose architecture parameters are
+                part of the settings.
+        """
+        self.file_path = file_path
+        self.settings = search_settings(config, encoder_plugin, decoder_plugin)
+        self.threshold_error = config['threshold_error']
+        self.incremental_search = config['incremental_search']
+        self.entries = {}
+        self.stale = False  # Whether an existing ledger was discarded, its training checkpoints are stale as well
+        if resume and os.path.exists(file_path):
+            with open(file_path, 'r') as f:
+                stored = json.load(f)
+            if stored.get('settings') != self.settings:
+                changed = sorted(key for key in self.settings if stored.get('settings', {}).get(key) != self.settings[key])
+                print(f"[SearchLedger] {file_path} was written with other settings ({', '.join(changed)}), starting a new search.")
+                self.stale = True
+            else:
+                self.entries = stored['candidates']
+                print(f"[SearchLedger] Resuming with {len(self.entries)} completed candidate(s): {sorted(int(size) for size in self.entries)}")
+
+    def get(self, interface_size):
+        """
+        Completed candidate of interface_size, or None if it was not completed or its models are missing.
+
+        Returns:
+            dict: candidate (log entry, with acceptance re-evaluated against the current threshold),
+                encoder_file, decoder_file, encoder_params and decoder_params.
+        """
+        entry = self.entries.get(str(interface_size))
+        if entry is None or not all(os.path.exists(entry[key]) for key in ('encoder_file', 'decoder_file')):
+            return None
+        candidate = dict(entry['candidate'], from_ledger=True)
+        candidate['accepted'] = meets_threshold(candidate['validation_mae'], self.threshold_error, self.incremental_search)
+        return dict(entry, candidate=candidate)
+
+    def record(self, candidate, encoder_file, decoder_file, encoder_params=None, decoder_params=None):
+        """
+        Add a completed candidate and rewrite the ledger.
+        """
+        self.entries[str(candidate['interface_size'])] = {
+            'candidate': {name: value for name, value in candidate.items() if name != 'stages'},
+            'encoder_file': os.path.abspath(encoder_file),
+            'decoder_file': os.path.abspath(decoder_file),
+            'encoder_params': _json_params(encoder_params),
+            'decoder_params': _json_params(decoder_params),
+            'completed_at': time.time()
+        }
+        self.save()
+
+    def save(self):
+        """
+        Write the ledger atomically, a crash during the write leaves the previous version intact.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'version': LEDGER_VERSION, 'settings': self.settings, 'candidates': self.entries}, f, indent=4)
+        os.replace(temp_path, self.file_path)
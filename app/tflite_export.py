@@ -0,0 +1,242 @@
+import json
+import os
+import time
+import numpy as np
+import tensorflow as tf
+from app.windowing import create_sliding_windows
+from app.fast_inference import fast_inference
+from app.model_cache import load_cached_model
+
+# app/tflite_export.py
+
+QUANTIZATIONS = ('float32', 'float16', 'int8')
+LATENCY_CALLS = 100  # Batch-of-one calls timed per model in the export report
+
+
+def tflite_path(model_path, quantization):
+    """
+    Default TFLite file for a saved Keras model, e.g. encoder.keras -> encoder.int8.tflite.
+    """
+    return f"{os.path.splitext(model_path)[0]}.{quantization}.tflite"
+
+
+def sample_evenly(samples, num_samples):
+    """
+    Up to num_samples samples spread evenly over the whole array.
+    """
+    if len(samples) <= num_samples:
+        return np.asarray(samples, dtype=np.float32)
+    return np.asarray(samples[np.linspace(0, len(samples) - 1, num_samples).astype(int)], dtype=np.float32)
+
+
+def convert_to_tflite(model, quantization='float32', representative_data=None):
+    """
+    Convert a Keras model to a TFLite flatbuffer.
+
+    Args:
+        model (keras.Model): Model to convert.
+        quantization (str): 'float32', 'float16' (float16 weights) or 'int8' (full integer, int8 inputs and outputs).
+        representative_data (np.ndarray): Calibration inputs for 'int8', with the model's input shape.
+
+    Returns:
+        bytes: The TFLite model.
+    """
+    if quantization not in QUANTIZATIONS:
+        raise ValueError(f"[convert_to_tflite] Unknown quantization '{quantization}', expected one of {QUANTIZATIONS}")
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if quantization == 'float16':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == 'int8':
+        if representative_data is None or len(representative_data) == 0:
+            raise ValueError("[convert_to_tflite] int8 quantization needs representative data for calibration.")
+
+        def representative_dataset():
+            for sample in representative_data:
+                yield [np.asarray(sample, dtype=np.float32)[np.newaxis]]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    return converter.convert()
+
+
+class TFLiteModel:
+    """
+    TFLite interpreter with the predict interface of a Keras model, for float and int8 models.
+
+    Float inputs are quantized to and outputs dequantized from int8 with the tensors' quantization
+    parameters, so callers always exchange float32 arrays.
+    """
+
+    def __init__(self, model_path=None, model_content=None, num_threads=None):
+        """
+        Args:
+            model_path (str): .tflite file.
+            model_content (bytes): TFLite flatbuffer, instead of model_path.
+            num_threads (int): Interpreter threads, None for the TFLite default.
+        """
+        self.interpreter = tf.lite.Interpreter(model_path=model_path, model_content=model_content, num_threads=num_threads)
+        self.size_bytes = len(model_content) if model_content is not None else os.path.getsize(model_path)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self.input_shape = (None,) + tuple(int(dim) for dim in self._input['shape'][1:])
+        self.output_shape = (None,) + tuple(int(dim) for dim in self._output['shape'][1:])
+        self._batch_size = int(self._input['shape'][0])
+
+    def _resize(self, batch_size):
+        if batch_size != self._batch_size:
+            self.interpreter.resize_tensor_input(self._input['index'], (batch_size,) + self.input_shape[1:])
+            self.interpreter.allocate_tensors()
+            self._input = self.interpreter.get_input_details()[0]
+            self._output = self.interpreter.get_output_details()[0]
+            self._batch_size = batch_size
+
+    def predict(self, inputs, verbose=0):
+        """
+        Run the model on a batch of float inputs.
+
+        Args:
+            inputs (np.ndarray): Inputs with shape (num_samples,) + input_shape[1:].
+            verbose: Accepted for compatibility with keras Model.predict.
+
+        Returns:
+            np.ndarray: Float32 outputs.
+        """
+        inputs = np.asarray(inputs, dtype=np.float32)
+        self._resize(len(inputs))
+        scale, zero_point = self._input['quantization']
+        if self._input['dtype'] == np.int8:
+            inputs = np.clip(np.round(inputs / scale + zero_point), -128, 127).astype(np.int8)
+        self.interpreter.set_tensor(self._input['index'], inputs)
+        self.interpreter.invoke()
+        outputs = self.interpreter.get_tensor(self._output['index'])
+        scale, zero_point = self._output['quantization']
+        if self._output['dtype'] == np.int8:
+            return (outputs.astype(np.float32) - zero_point) * scale
+        return outputs.astype(np.float32, copy=False)
+
+
+def _mean_latency(predict, sample, calls=LATENCY_CALLS):
+    predict(sample)
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        predict(sample)
+    return (time.perf_counter() - start_time) / calls
+
+
+def compare_models(keras_model, tflite_model, inputs):
+    """
+    Output error and batch-of-one latency of a TFLite model against its Keras model.
+
+    Returns:
+        dict: max_abs_error, mean_abs_error, keras_latency_ms and tflite_latency_ms.
+    """
+    keras_outputs = fast_inference(keras_model).encode_batch(inputs)
+    tflite_outputs = tflite_model.predict(inputs)
+    errors = np.abs(keras_outputs.reshape(len(inputs), -1) - tflite_outputs.reshape(len(inputs), -1))
+    return {
+        'max_abs_error': float(errors.max()),
+        'mean_abs_error': float(errors.mean()),
+        'keras_latency_ms': _mean_latency(fast_inference(keras_model).encode_batch, inputs[:1]) * 1000,
+        'tflite_latency_ms': _mean_latency(tflite_model.predict, inputs[:1]) * 1000
+    }
+
+
+def export_model(keras_model, model_path, output_path, quantization, representative_data, evaluation_data):
+    """
+    Convert one model, write it to output_path and compare it with the Keras model.
+
+    Returns:
+        tuple: (TFLiteModel, report dict with the file sizes, errors and latencies).
+    """
+    content = convert_to_tflite(keras_model, quantization, representative_data)
+    with open(output_path, 'wb') as f:
+        f.write(content)
+    tflite_model = TFLiteModel(model_content=content)
+    report = {
+        'keras_file': model_path,
+        'tflite_file': output_path,
+        'quantization': quantization,
+        'keras_size_bytes': os.path.getsize(model_path),
+        'tflite_size_bytes': len(content)
+    }
+    report.update(compare_models(keras_model, tflite_model, evaluation_data))
+    print(f"[export_model] {model_path} -> {output_path} ({quantization}): "
+          f"{report['keras_size_bytes'] / 1024:.1f}KB -> {report['tflite_size_bytes'] / 1024:.1f}KB, "
+          f"max abs error {report['max_abs_error']:.6f}, "
+          f"latency {report['keras_latency_ms']:.3f}ms -> {report['tflite_latency_ms']:.3f}ms")
+    return tflite_model, report
+
+
+def model_inputs(data, model):
+    """
+    Encoder inputs of a 2D dataset: one row per sample for encoders of shape (num_columns,), such as the
+    ANN encoder, or (num_columns, 1), trained without sliding windows, otherwise sliding windows of the
+    encoder's window size.
+    """
+    if len(model.input_shape) == 2:
+        if model.input_shape[1] != data.shape[1]:
+            raise ValueError(f"[model_inputs] Encoder input width {model.input_shape[1]} does not match the {data.shape[1]} data columns")
+        return np.asarray(data, dtype=np.float32)
+    _, input_length, input_channels = model.input_shape
+    if input_length == data.shape[1] and input_channels == 1:
+        return np.expand_dims(np.asarray(data, dtype=np.float32), axis=-1)
+    return create_sliding_windows(data, input_length)
+
+
+def export_tflite(config):
+    """
+    Export the encoder in config['load_encoder'] (and the decoder in config['load_decoder'], if any) to TFLite.
+
+    Int8 calibration and the error checks use evenly spaced windows of config['input_file']. With a
+    decoder, the reconstruction MAE of the TFLite encoder-decoder pair is compared with the Keras pair.
+
+    Args:
+        config (dict): Configuration dictionary with the model, data and export options.
+
+    Returns:
+        dict: Export report, also written to config['save_log'] if set.
+    """
+    from app.data_processor import load_input_csv
+
+    quantization = config.get('tflite_quantization', 'float32')
+    data = load_input_csv(config['input_file'], config)
+    encoder = load_cached_model(config['load_encoder'], config)
+    inputs = model_inputs(data, encoder)
+    representative_data = sample_evenly(inputs, config.get('tflite_calibration_samples', 200))
+    evaluation_data = sample_evenly(inputs, config.get('tflite_evaluation_samples', 1000))
+    print(f"[export_tflite] Exporting with {quantization} quantization, calibrating on {len(representative_data)} windows")
+
+    report = {}
+    encoder_path = config.get('tflite_output') or tflite_path(config['load_encoder'], quantization)
+    tflite_encoder, report['encoder'] = export_model(
+        encoder, config['load_encoder'], encoder_path, quantization, representative_data, evaluation_data
+    )
+
+    if config.get('load_decoder'):
+        decoder = load_cached_model(config['load_decoder'], config)
+        latents = fast_inference(encoder).encode_batch(evaluation_data)
+        decoder_path = tflite_path(config['load_decoder'], quantization)
+        tflite_decoder, report['decoder'] = export_model(
+            decoder, config['load_decoder'], decoder_path, quantization,
+            fast_inference(encoder).encode_batch(representative_data), latents
+        )
+        targets = evaluation_data.reshape(len(evaluation_data), -1)
+        keras_reconstruction = fast_inference(decoder).encode_batch(latents).reshape(len(targets), -1)
+        tflite_reconstruction = tflite_decoder.predict(tflite_encoder.predict(evaluation_data)).reshape(len(targets), -1)
+        report['reconstruction'] = {
+            'keras_mae': float(np.mean(np.abs(keras_reconstruction - targets))),
+            'tflite_mae': float(np.mean(np.abs(tflite_reconstruction - targets)))
+        }
+        print(f"[export_tflite] Reconstruction MAE: Keras {report['reconstruction']['keras_mae']:.6f}, "
+              f"TFLite {report['reconstruction']['tflite_mae']:.6f}")
+
+    if config.get('save_log'):
+        with open(config['save_log'], 'w') as f:
+            json.dump(report, f, indent=4)
+        print(f"[export_tflite] Export report saved to {config['save_log']}")
+    return report
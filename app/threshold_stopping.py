@@ -0,0 +1,158 @@
+import math
+import numpy as np
+from keras.callbacks import Callback
+from app.fast_inference import predict
+from app.windowed_dataset import WindowedDataset, StreamingWindowedDataset
+
+# app/threshold_stopping.py
+
+MIN_EVALUATIONS = 3  # Validation MAE checks needed before the learning curve is extrapolated
+ABANDON_PATIENCE = 2  # Consecutive checks that must project a miss before a candidate is abandoned
+MAX_IMPROVEMENT_RATIO = 0.9  # Upper bound of the ratio of consecutive improvements used to extrapolate
+
+
+def _validation_batches(data, max_samples, batch_size):
+    """
+    Batches of validation samples, up to max_samples spread evenly over the dataset (the leading
+    windows for streaming datasets, which cannot be indexed).
+    """
+    if isinstance(data, StreamingWindowedDataset):
+        dataset = data.as_tf_dataset(batch_size, with_targets=False)
+        if max_samples:
+            dataset = dataset.take(math.ceil(max_samples / batch_size))
+        for batch in dataset:
+            yield batch.numpy()
+        return
+    samples = data.windows() if isinstance(data, WindowedDataset) else data
+    if max_samples and len(samples) > max_samples:
+        # Fancy indexing copies only the sampled windows out of the strided view
+        samples = samples[np.linspace(0, len(samples) - 1, max_samples).astype(int)]
+    for start in range(0, len(samples), batch_size):
+        yield np.asarray(samples[start:start + batch_size], dtype=np.float32)
+
+
+def validation_mae(model, data, max_samples=None, batch_size=4096):
+    """
+    Reconstruction MAE of an autoencoder, the same quantity as the 'mae' metric of evaluate.
+
+    Args:
+        model (keras.Model): Autoencoder.
+        data: Validation windows, rows with a channel axis, or windowed dataset.
+        max_samples (int): Samples evaluated, None evaluates all of them.
+        batch_size (int): Samples per inference batch.
+
+    Returns:
+        float: Mean absolute reconstruction error.
+    """
+    total_error = 0.0
+    count = 0
+    for batch in _validation_batches(data, max_samples, batch_size):
+        reconstructed = np.asarray(predict(model, batch), dtype=np.float32)
+        total_error += float(np.abs(reconstructed - batch).sum())
+        count += batch.size
+    return total_error / max(count, 1)
+
+
+def projected_best_mae(maes, remaining_evaluations, max_ratio=MAX_IMPROVEMENT_RATIO):
+    """
+    Lowest MAE a learning curve is expected to reach within remaining_evaluations more checks.
+
+    Improvements between checks are assumed to shrink geometrically, with the ratio of the last two
+    improvements capped at max_ratio. An irregular curve (one of them is not an improvement) gets the
+    optimistic max_ratio, so that noise does not abandon a candidate that is still learning.
+
+    Args:
+        maes (list): Validation MAE of every check so far.
+        remaining_evaluations (int): Checks left in the epoch budget.
+
+    Returns:
+        float: Projected MAE, or None with fewer than MIN_EVALUATIONS checks.
+    """
+    if len(maes) < MIN_EVALUATIONS:
+        return None
+    older, newer = maes[-3] - maes[-2], maes[-2] - maes[-1]
+    gain = newer if newer > 0 else max(older, 0.0)  # Latest improvement
+    if gain == 0.0 or remaining_evaluations <= 0:
+        return min(maes)
+    ratio = min(newer / older, max_ratio) if older > 0 and newer > 0 else max_ratio
+    return min(maes) - gain * ratio * (1 - ratio ** remaining_evaluations) / (1 - ratio)
+
+
+class ThresholdStopping(Callback):
+    """
+    Stops training once the validation MAE meets the search threshold, or abandons the candidate when
+    its validation learning curve extrapolates to miss the threshold within the epoch budget.
+
+    The MAE is checked every every_epochs epochs on an evenly spaced validation subsample; a threshold
+    met on the subsample is confirmed on the whole validation set before training stops, so the
+    candidate's acceptance test gives the same result as after a full fit. Only used for incremental
+    search, where candidates are accepted at or below the threshold.
+    """
+
+    def __init__(self, validation_data, threshold_error, every_epochs=5, max_samples=None, batch_size=4096):
+        """
+        Args:
+            validation_data: Validation windows, rows with a channel axis, or windowed dataset.
+            threshold_error (float): Validation MAE that accepts the candidate.
+            every_epochs (int): Epochs between checks.
+            max_samples (int): Validation samples per check, None uses all of them.
+            batch_size (int): Samples per inference batch.
+        """
+        super().__init__()
+        self.validation_data = validation_data
+        self.threshold_error = threshold_error
+        self.every_epochs = max(1, int(every_epochs))
+        self.max_samples = max_samples if max_samples and max_samples < len(validation_data) else None
+        self.batch_size = batch_size
+        self.evaluations = []
+        self.stop_reason = None
+        self.stopped_epoch = None
+        self._misses = 0
+
+    def on_train_begin(self, logs=None):
+        self.evaluations = []
+        self.stop_reason = None
+        self.stopped_epoch = None
+        self._misses = 0
+
+    def get_state(self):
+        """
+        JSON-serializable projection state, saved in training checkpoints.
+        """
+        return {'evaluations': [dict(entry) for entry in self.evaluations], 'misses': self._misses,
+                'stop_reason': self.stop_reason, 'stopped_epoch': self.stopped_epoch}
+
+    def set_state(self, state):
+        """
+        Continue from the state of get_state, so that a resumed training stops where an uninterrupted one would.
+        """
+        self.evaluations = [dict(entry) for entry in state['evaluations']]
+        self._misses = state['misses']
+        self.stop_reason = state['stop_reason']
+        self.stopped_epoch = state['stopped_epoch']
+
+    def on_epoch_end(self, epoch, logs=None):
+        if (epoch + 1) % self.every_epochs != 0:
+            return
+        mae = validation_mae(self.model, self.validation_data, self.max_samples, self.batch_size)
+        self.evaluations.append({'epoch': epoch + 1, 'validation_mae': mae})
+        if mae <= self.threshold_error:
+            if self.max_samples is not None:
+                mae = validation_mae(self.model, self.validation_data, None, self.batch_size)
+                self.evaluations[-1]['full_validation_mae'] = mae
+            if mae <= self.threshold_error:
+                self._stop(epoch, 'threshold_met', mae)
+                return
+
+        remaining_evaluations = (self.params['epochs'] - (epoch + 1)) // self.every_epochs
+        projected = projected_best_mae([entry['validation_mae'] for entry in self.evaluations], remaining_evaluations)
+        self._misses = self._misses + 1 if projected is not None and projected > self.threshold_error else 0
+        if self._misses >= ABANDON_PATIENCE:
+            self._stop(epoch, 'abandoned', mae, projected)
+
+    def _stop(self, epoch, reason, mae, projected=None):
+        self.model.stop_training = True
+        self.stop_reason = reason
+        self.stopped_epoch = epoch + 1
+        detail = f", projected best {projected:.6f}" if projected is not None else ""
+        print(f"[ThresholdStopping] Epoch {epoch + 1}: validation MAE {mae:.6f} vs threshold {self.threshold_error}{detail}, {reason.replace('_', ' ')}.")
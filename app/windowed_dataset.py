@@ -0,0 +1,223 @@
+import hashlib
+import numpy as np
+import tensorflow as tf
+from app.windowing import to_2d_array, create_sliding_windows
+from app.data_handler import load_csv_chunks
+from app.csv_cache import file_fingerprint
+from app.data_profile import ProfileAccumulator
+
+# app/windowed_dataset.py
+
+class WindowedDataset:
+    """
+    Sliding-window dataset that keeps only the 2D series in memory and slices windows per batch.
+
+    Windows are addressed by their start index, so shuffling permutes indices instead of data
+    and peak memory is O(num_rows * num_features + batch_size * window_size * num_features).
+    """
+
+    def __init__(self, data, window_size, profile=None):
+        """
+        Args:
+            data (pd.DataFrame or np.ndarray): Time series features with shape (num_rows, num_features).
+            window_size (int): The length of the sliding window.
+            profile (DataProfile): Profile of the data computed after loading, if available.
+        """
+        if window_size <= 0:
+            raise ValueError(f"[WindowedDataset] window_size must be positive, got: {window_size}")
+        self.series = np.ascontiguousarray(to_2d_array(data))
+        self.window_size = window_size
+        self.profile = profile
+        self._fingerprint = None
+
+    @property
+    def num_windows(self):
+        return max(self.series.shape[0] - self.window_size + 1, 0)
+
+    @property
+    def shape(self):
+        """Shape of the equivalent materialized window tensor: (num_windows, window_size, num_features)."""
+        return (self.num_windows, self.window_size, self.series.shape[1])
+
+    @property
+    def dtype(self):
+        return self.series.dtype
+
+    def __len__(self):
+        return self.num_windows
+
+    def fingerprint(self):
+        """
+        Content hash of the series and window size, computed once since the series is not modified.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(self.series.data)
+            self._fingerprint = f"windowed:{digest.hexdigest()}:{self.series.shape}:{self.series.dtype.str}:{self.window_size}"
+        return self._fingerprint
+
+    def windows(self, materialize=False):
+        """
+        Return all windows as a read-only strided view (or a contiguous copy if materialize is True).
+        """
+        return create_sliding_windows(self.series, self.window_size, materialize=materialize)
+
+    def as_tf_dataset(self, batch_size, shuffle=False, seed=None, with_targets=True):
+        """
+        Build a tf.data pipeline yielding batches of windows gathered from the 2D series.
+
+        Windows are gathered from the NumPy series per batch, so the series is never copied into the
+        graph: only the series (which may be a read-only memory map) and the prefetched batches are held.
+
+        Args:
+            batch_size (int): Number of windows per batch.
+            shuffle (bool): Shuffle window indices, reshuffled on every epoch.
+            seed (int): Optional shuffle seed.
+            with_targets (bool): Yield (windows, windows) pairs for autoencoder fit/evaluate.
+
+        Returns:
+            tf.data.Dataset: Dataset of (batch_size, window_size, num_features) batches, prefetched.
+        """
+        series = self.series
+        offsets = np.arange(self.window_size)
+        window_shape = (None, self.window_size, series.shape[1])
+
+        def gather_batch(indices):
+            # Fancy indexing copies only this batch's windows out of the series
+            return series[indices[:, np.newaxis] + offsets]
+
+        def gather_windows(indices):
+            windows = tf.numpy_function(gather_batch, [indices], tf.as_dtype(series.dtype), stateful=False)
+            windows.set_shape(window_shape)
+            if with_targets:
+                return windows, windows
+            return windows
+
+        dataset = tf.data.Dataset.range(self.num_windows)
+        if shuffle:
+            # Only the int64 index buffer is shuffled, never the windows themselves
+            dataset = dataset.shuffle(max(self.num_windows, 1), seed=seed, reshuffle_each_iteration=True)
+        dataset = dataset.batch(batch_size)
+        dataset = dataset.map(gather_windows, num_parallel_calls=tf.data.AUTOTUNE)
+        # Overlap slicing of the next batch with the current training step
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+
+class StreamingWindowedDataset:
+    """
+    Sliding-window dataset streamed from a CSV file in chunks, for files larger than memory.
+
+    Only one chunk (plus window_size - 1 overlap rows) is held at a time, so memory stays constant
+    regardless of file length. Shuffling is done within each chunk.
+    """
+
+    def __init__(self, file_path, window_size, headers=False, force_date=False, chunk_size=100000):
+        """
+        Args:
+            file_path (str): Path to the CSV file.
+            window_size (int): The length of the sliding window.
+            headers (bool): Whether the file has a header row.
+            force_date (bool): Whether the first column is a date to use as index.
+            chunk_size (int): Number of rows read per chunk.
+        """
+        if window_size <= 0:
+            raise ValueError(f"[StreamingWindowedDataset] window_size must be positive, got: {window_size}")
+        self.file_path = file_path
+        self.window_size = window_size
+        self.headers = headers
+        self.force_date = force_date
+        self.chunk_size = chunk_size
+
+        # One streaming pass for the row count, feature count and the data profile (without histograms)
+        self.num_features = 0
+        columns = None
+        accumulator = ProfileAccumulator()
+        for chunk in self.iter_chunks(overlap=0):
+            self.num_features = chunk.shape[1]
+            columns = [str(col) for col in chunk.columns]
+            accumulator.update(chunk.to_numpy())
+        self.profile = accumulator.result(columns=columns)
+        self.num_rows = self.profile.num_rows
+        self._fingerprint = None
+
+    @property
+    def num_windows(self):
+        return max(self.num_rows - self.window_size + 1, 0)
+
+    @property
+    def has_nan(self):
+        return self.profile.has_nan
+
+    @property
+    def shape(self):
+        """Shape of the equivalent materialized window tensor: (num_windows, window_size, num_features)."""
+        return (self.num_windows, self.window_size, self.num_features)
+
+    @property
+    def dtype(self):
+        return np.dtype(np.float32)
+
+    def __len__(self):
+        return self.num_windows
+
+    def fingerprint(self):
+        """
+        Fingerprint of the source file, its parsing options and the window size.
+        """
+        if self._fingerprint is None:
+            file_key = file_fingerprint(self.file_path, self.headers, self.force_date)
+            self._fingerprint = f"streaming:{file_key}:{self.window_size}"
+        return self._fingerprint
+
+    def iter_chunks(self, overlap=None):
+        """
+        Yield float32 chunks of the file, each carrying `overlap` rows of the previous one (window_size - 1 by default).
+        """
+        if overlap is None:
+            overlap = self.window_size - 1
+        return load_csv_chunks(
+            self.file_path,
+            headers=self.headers,
+            force_date=self.force_date,
+            chunk_size=self.chunk_size,
+            overlap=overlap
+        )
+
+    def iter_window_batches(self, batch_size, shuffle=False, rng=None):
+        """
+        Yield batches of windows, each batch taken from the strided window view of one chunk.
+        """
+        for chunk in self.iter_chunks():
+            windows = create_sliding_windows(chunk, self.window_size)
+            order = rng.permutation(len(windows)) if shuffle else np.arange(len(windows))
+            for start in range(0, len(order), batch_size):
+                yield windows[order[start:start + batch_size]]
+
+    def as_tf_dataset(self, batch_size, shuffle=False, seed=None, with_targets=True):
+        """
+        Build a tf.data pipeline streaming batches of windows from the CSV file, re-read on every epoch.
+
+        Args:
+            batch_size (int): Number of windows per batch.
+            shuffle (bool): Shuffle windows within each chunk, differently on every epoch.
+            seed (int): Optional shuffle seed.
+            with_targets (bool): Yield (windows, windows) pairs for autoencoder fit/evaluate.
+
+        Returns:
+            tf.data.Dataset: Dataset of (batch_size, window_size, num_features) batches, prefetched.
+        """
+        rng = np.random.default_rng(seed)
+        dataset = tf.data.Dataset.from_generator(
+            lambda: self.iter_window_batches(batch_size, shuffle=shuffle, rng=rng),
+            output_signature=tf.TensorSpec(shape=(None, self.window_size, self.num_features), dtype=tf.float32)
+        )
+        if with_targets:
+            dataset = dataset.map(lambda windows: (windows, windows))
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
+
+def is_windowed_dataset(data):
+    """
+    Whether data is a lazy window dataset (in-memory or streamed) rather than an array.
+    """
+    return isinstance(data, (WindowedDataset, StreamingWindowedDataset))
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import as_strided
+
+# app/windowing.py
+
+def to_2d_array(data):
+    """
+    Return the 2D (num_rows, num_features) NumPy array backing a dataframe or array.
+    """
+    if isinstance(data, pd.DataFrame):
+        data_array = data.to_numpy()
+    else:
+        data_array = np.asarray(data)
+    if data_array.ndim == 1:
+        data_array = data_array.reshape(-1, 1)  # Single channel series
+    if data_array.ndim != 2:
+        raise ValueError(f"[to_2d_array] Expected 2D data, got shape: {data_array.shape}")
+    return data_array
+
+
+def create_sliding_windows(data, window_size, materialize=False):
+    """
+    Create sliding windows for the entire dataset, returning a 3D array suitable for Conv1D.
+
+    By default the windows are a read-only strided view over the 2D source array: window i
+    shares memory with rows i..i+window_size-1, so no per-window copy is made and memory use
+    stays O(num_rows * num_features) instead of O(num_rows * window_size * num_features).
+
+    Args:
+        data (pd.DataFrame or np.ndarray): Time series features with shape (num_rows, num_features).
+        window_size (int): The length of the sliding window.
+        materialize (bool): If True, return a contiguous, writable copy of the windows instead of a view.
+
+    Returns:
+        np.ndarray: Array with shape (num_samples, window_size, num_features).
+    """
+    if window_size <= 0:
+        raise ValueError(f"[create_sliding_windows] window_size must be positive, got: {window_size}")
+
+    data_array = np.ascontiguousarray(to_2d_array(data))  # Single copy at most, only if the frame is not contiguous
+    num_rows, num_features = data_array.shape
+    num_samples = max(num_rows - window_size + 1, 0)  # Calculate the number of sliding windows
+
+    row_stride, feature_stride = data_array.strides
+    windows = as_strided(
+        data_array,
+        shape=(num_samples, window_size, num_features),
+        strides=(row_stride, row_stride, feature_stride),
+        writeable=False
+    )
+
+    if materialize:
+        return np.array(windows)  # Contiguous, writable copy
+    return windows
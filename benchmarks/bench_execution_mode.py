@@ -0,0 +1,81 @@
+"""
+Benchmark of autoencoder training step time for each execution mode (eager, graph, xla) on CPU.
+
+Usage:
+    python -m benchmarks.bench_execution_mode --pairs cnn:cnn,lstm:lstm --window_size 32 --num_channels 4
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault('CUDA_VISIBLE_DEVICES', '-1')  # CPU only
+
+import numpy as np
+from app.autoencoder_manager import AutoencoderManager, EXECUTION_MODES
+from app.plugin_loader import load_plugin
+
+
+def time_training_steps(encoder_name, decoder_name, execution_mode, data, interface_size, steps, warmup_steps):
+    """
+    Build the autoencoder for one plugin pair and mode and return the mean train_on_batch step time in seconds.
+    """
+    encoder_plugin_class, _ = load_plugin('feature_extractor.encoders', encoder_name)
+    decoder_plugin_class, _ = load_plugin('feature_extractor.decoders', decoder_name)
+    config = {
+        'use_sliding_windows': True,
+        'learning_rate': 0.001,
+        'execution_mode': execution_mode
+    }
+    manager = AutoencoderManager(encoder_plugin_class(), decoder_plugin_class())
+    manager.build_autoencoder(data.shape[1], interface_size, config, data.shape[2])
+    model = manager.autoencoder_model
+
+    # The first steps include tracing (and XLA compilation), exclude them
+    for _ in range(warmup_steps):
+        model.train_on_batch(data, data)
+    start_time = time.perf_counter()
+    for _ in range(steps):
+        model.train_on_batch(data, data)
+    return (time.perf_counter() - start_time) / steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark training step time per execution mode.")
+    parser.add_argument('--pairs', type=str, default='cnn:cnn,lstm:lstm', help='Comma-separated encoder:decoder plugin pairs.')
+    parser.add_argument('--modes', type=str, default=','.join(EXECUTION_MODES), help='Comma-separated execution modes.')
+    parser.add_argument('--batch_size', type=int, default=64, help='Windows per training step.')
+    parser.add_argument('--window_size', type=int, default=32, help='Sliding window size.')
+    parser.add_argument('--num_channels', type=int, default=4, help='Number of input channels.')
+    parser.add_argument('--interface_size', type=int, default=8, help='Encoder/decoder interface size.')
+    parser.add_argument('--steps', type=int, default=50, help='Timed training steps.')
+    parser.add_argument('--warmup_steps', type=int, default=3, help='Untimed training steps before timing.')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = rng.random((args.batch_size, args.window_size, args.num_channels), dtype=np.float32)
+    modes = args.modes.split(',')
+
+    results = {}
+    for pair in args.pairs.split(','):
+        encoder_name, decoder_name = pair.split(':')
+        for mode in modes:
+            try:
+                results[(pair, mode)] = time_training_steps(
+                    encoder_name, decoder_name, mode, data, args.interface_size, args.steps, args.warmup_steps
+                )
+            except Exception as e:
+                print(f"[bench_execution_mode] {pair} in {mode} mode failed: {e}")
+                results[(pair, mode)] = None
+
+    print(f"\nMean training step time (batch={args.batch_size}, window={args.window_size}, channels={args.num_channels})")
+    print(f"{'pair':<20}" + "".join(f"{mode:>12}" for mode in modes))
+    for pair in args.pairs.split(','):
+        row = f"{pair:<20}"
+        for mode in modes:
+            step_time = results[(pair, mode)]
+            row += f"{'failed':>12}" if step_time is None else f"{step_time * 1000:>10.2f}ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark of small-batch inference latency: model.predict against the FastInference concrete functions.
+
+Builds the encoder and decoder of each plugin pair and times both paths at each batch size.
+
+Usage:
+    python -m benchmarks.bench_inference --pairs cnn:cnn,ann:ann --batch_sizes 1,8,64
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault('CUDA_VISIBLE_DEVICES', '-1')  # CPU only
+
+import numpy as np
+from app.autoencoder_manager import AutoencoderManager
+from app.fast_inference import FastInference
+from app.plugin_loader import load_plugin
+
+
+def time_calls(function, inputs, calls, warmup_calls=3):
+    """
+    Mean wall time of function(inputs) in seconds, excluding the warm-up calls.
+    """
+    for _ in range(warmup_calls):
+        function(inputs)
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        function(inputs)
+    return (time.perf_counter() - start_time) / calls
+
+
+def build_models(encoder_name, decoder_name, window_size, num_channels, interface_size):
+    encoder_plugin_class, _ = load_plugin('feature_extractor.encoders', encoder_name)
+    decoder_plugin_class, _ = load_plugin('feature_extractor.decoders', decoder_name)
+    config = {'use_sliding_windows': True, 'learning_rate': 0.001}
+    manager = AutoencoderManager(encoder_plugin_class(), decoder_plugin_class())
+    manager.build_autoencoder(window_size, interface_size, config, num_channels)
+    return {'encoder': manager.encoder_model, 'decoder': manager.decoder_model}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark model.predict against FastInference latency.")
+    parser.add_argument('--pairs', type=str, default='cnn:cnn,ann:ann,lstm:lstm,transformer:transformer', help='Comma-separated encoder:decoder plugin pairs.')
+    parser.add_argument('--batch_sizes', type=str, default='1,8,64', help='Comma-separated batch sizes.')
+    parser.add_argument('--window_size', type=int, default=32, help='Sliding window size.')
+    parser.add_argument('--num_channels', type=int, default=4, help='Number of input channels.')
+    parser.add_argument('--interface_size', type=int, default=8, help='Encoder/decoder interface size.')
+    parser.add_argument('--calls', type=int, default=100, help='Timed calls per measurement.')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    batch_sizes = [int(size) for size in args.batch_sizes.split(',')]
+    rows = []
+    for pair in args.pairs.split(','):
+        encoder_name, decoder_name = pair.split(':')
+        try:
+            models = build_models(encoder_name, decoder_name, args.window_size, args.num_channels, args.interface_size)
+        except Exception as e:
+            print(f"[bench_inference] Building {pair} failed: {e}")
+            continue
+        for role, model in models.items():
+            fast = FastInference(model)
+            for batch_size in batch_sizes:
+                shape = (batch_size,) + tuple(dim or 1 for dim in model.input_shape[1:])
+                inputs = rng.random(shape, dtype=np.float32)
+                predict_time = time_calls(lambda x: model.predict(x, verbose=0), inputs, args.calls)
+                fast_time = time_calls(fast.encode_batch, inputs, args.calls)
+                rows.append((f"{pair} {role}", batch_size, predict_time, fast_time))
+
+    print(f"\nMean latency per call over {args.calls} calls (window={args.window_size}, channels={args.num_channels})")
+    print(f"{'model':<28}{'batch':>7}{'predict':>12}{'fast':>12}{'speedup':>10}")
+    for name, batch_size, predict_time, fast_time in rows:
+        print(f"{name:<28}{batch_size:>7}{predict_time * 1000:>10.3f}ms{fast_time * 1000:>10.3f}ms{predict_time / fast_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
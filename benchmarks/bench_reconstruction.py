@@ -0,0 +1,109 @@
+"""
+Benchmark of reconstruction.unwindow_data against the original per-row implementation.
+
+The legacy implementation takes hours at 100k rows, so by default it is timed on the first
+--legacy_rows rows and its time at --rows is extrapolated linearly. Its cost grows at least
+linearly (quadratically once the full-length row additions dominate), so the reported speedup
+is a lower bound. Pass --legacy_rows equal to --rows to time it on the full input.
+
+Usage:
+    python -m benchmarks.bench_reconstruction --rows 100000 --window_size 8
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from app.reconstruction import unwindow_data, overlap_counts
+
+
+def legacy_unwindow_data(windowed_df):
+    """
+    The original unwindow_data, verbatim, kept as the baseline (O(num_rows^2) per column).
+
+    Its averaging assigns through chained indexing (output_dataset.iloc[row][col] /= ...), which
+    is a no-op under pandas Copy-on-Write: with pandas >= 3 it returns the undivided overlap sums.
+    Its progress counter divides by num_rows // 100, so it needs at least 100 rows.
+    """
+    window_size = windowed_df.shape[1]  # Total number of values across all channels
+    num_rows = len(windowed_df)
+    
+    # Calculate the total rows for the output, assuming the same logic as before
+    total_rows_out = num_rows + window_size - 1
+
+    # Create a DataFrame to hold the unwindowed data for each channel (each column)
+    output_dataset = pd.DataFrame(0, index=range(total_rows_out), columns=windowed_df.columns)
+    print(f"[unwindow_data] Un-windowing output data for {len(windowed_df.columns)} columns")
+
+    percen_val = num_rows // 100
+    count = 0
+    
+    # Process each column (each channel) independently
+    for col in windowed_df.columns:
+        print(f"[unwindow_data] Processing column: {col}")
+        for row in range(num_rows):
+            if count == percen_val:
+                print(f"{row // percen_val}% done", end="\r", flush=True)
+                count = 0
+            count += 1
+            
+            # Create an extended row (sliding window) and add it to the output dataset
+            extended_row = np.zeros(total_rows_out)
+            extended_row[row:row + window_size] = windowed_df.iloc[row][col]
+            output_dataset[col] += extended_row
+
+        # Calculate the averages as done in the original version
+        print(f"[unwindow_data] Calculating averages in the first segment for {col}")
+        for row in range(window_size - 1):
+            output_dataset.iloc[row][col] /= (row + 1)
+        
+        print(f"[unwindow_data] Calculating averages in the second segment for {col}")
+        for row in range(window_size - 1, total_rows_out - window_size):
+            output_dataset.iloc[row][col] /= window_size
+        
+        print(f"[unwindow_data] Calculating averages in the last segment for {col}")
+        for row in range(total_rows_out - window_size, total_rows_out):
+            output_dataset.iloc[row][col] /= (total_rows_out - row)
+
+    print("[unwindow_data] Unwindowing completed for all columns.")
+    
+    return output_dataset
+
+
+def time_call(function, *args):
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark unwindow_data against the legacy implementation.")
+    parser.add_argument('--rows', type=int, default=100000, help='Number of windowed rows.')
+    parser.add_argument('--window_size', type=int, default=8, help='Number of columns (window size).')
+    parser.add_argument('--legacy_rows', type=int, default=10000, help='Rows used to time the legacy implementation.')
+    parser.add_argument('--skip_legacy', action='store_true', help='Only time the vectorized implementation.')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    windowed_df = pd.DataFrame(rng.random((args.rows, args.window_size)))
+    print(f"Un-windowing {args.rows} rows x {args.window_size} columns")
+
+    result, vectorized_time = time_call(unwindow_data, windowed_df)
+    print(f"vectorized unwindow_data: {vectorized_time:.4f} s")
+
+    if not args.skip_legacy:
+        legacy_rows = min(args.legacy_rows, args.rows)
+        subset_df = windowed_df.iloc[:legacy_rows]
+        expected, legacy_time = time_call(legacy_unwindow_data, subset_df)
+        subset_result = unwindow_data(subset_df)
+        print(f"legacy unwindow_data on {legacy_rows} rows: {legacy_time:.4f} s")
+        # The legacy code only divides the overlap sums without Copy-on-Write, compare with both outputs
+        sums = subset_result.to_numpy() * overlap_counts(len(subset_df), args.window_size)[:, np.newaxis]
+        print(f"max abs difference:       {np.abs(subset_result.to_numpy() - expected.to_numpy()).max()} (averaged), "
+              f"{np.abs(sums - expected.to_numpy()).max()} (undivided sums)")
+        legacy_estimate = legacy_time * args.rows / legacy_rows
+        label = "measured" if legacy_rows == args.rows else "linear extrapolation, lower bound"
+        print(f"legacy unwindow_data on {args.rows} rows ({label}): {legacy_estimate:.1f} s")
+        print(f"speedup at {args.rows} rows: {legacy_estimate / vectorized_time:.0f}x{'' if legacy_rows == args.rows else ' (at least)'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark of CLI startup time, as a guard against heavy imports creeping back into the startup path.
+
+Times `app/main.py --help` in fresh interpreters and checks which heavy modules `import app.main`
+loads. Exits with status 1 if the median time exceeds --max_seconds or a heavy module is imported.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 10 --max_seconds 1.0
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ['tensorflow', 'keras', 'requests', 'pandas']
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def startup_environment():
+    """
+    Environment of the feature-extractor.sh wrapper: the repository and app/ on the Python path.
+    """
+    env = dict(os.environ)
+    python_path = [REPO_ROOT, os.path.join(REPO_ROOT, 'app')]
+    if env.get('PYTHONPATH'):
+        python_path.append(env['PYTHONPATH'])
+    env['PYTHONPATH'] = os.pathsep.join(python_path)
+    return env
+
+
+def imported_heavy_modules():
+    """
+    Heavy modules loaded by `import app.main` in a fresh interpreter.
+    """
+    code = f"import sys, app.main; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, '-c', code], env=startup_environment(), capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return [name for name in output.split(',') if name]
+
+
+def time_help(runs):
+    """
+    Wall time of each `main.py --help` run in seconds.
+    """
+    times = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.join(REPO_ROOT, 'app', 'main.py'), '--help'],
+            env=startup_environment(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+        )
+        times.append(time.perf_counter() - start_time)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time.")
+    parser.add_argument('--runs', type=int, default=10, help='Number of timed --help runs.')
+    parser.add_argument('--max_seconds', type=float, default=1.0, help='Fail if the median startup time exceeds this.')
+    args = parser.parse_args()
+
+    heavy_modules = imported_heavy_modules()
+    times = time_help(args.runs)
+    median_time = statistics.median(times)
+    print(f"main.py --help over {args.runs} runs: median {median_time * 1000:.1f}ms, min {min(times) * 1000:.1f}ms, max {max(times) * 1000:.1f}ms")
+    print(f"Heavy modules imported at startup: {heavy_modules or 'none'}")
+
+    failed = False
+    if heavy_modules:
+        print(f"[bench_startup] FAIL: {heavy_modules} imported by app.main")
+        failed = True
+    if median_time > args.max_seconds:
+        print(f"[bench_startup] FAIL: median startup time above {args.max_seconds}s")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
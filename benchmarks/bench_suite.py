@@ -0,0 +1,266 @@
+"""
+Benchmark suite for the data path and training step throughput, with stored results and regression checks.
+
+`run` sweeps rows, window sizes and channel counts over synthetic data and times create_sliding_windows,
+unwindow_data, load_csv (parsed and from the binary cache) and write_csv, plus the training step of
+each installed encoder/decoder plugin pair (or the --pairs given). Each measurement records the median
+and minimum time over --repeats runs, and the peak memory of one extra traced run (tracemalloc and
+process high-water mark growth).
+`compare` flags the measurements of a run that are slower or use more memory than a stored baseline,
+and exits with status 1 if there is any regression.
+
+Usage:
+    python -m benchmarks.bench_suite run --rows 10000,100000,1000000 --output results.json
+    python -m benchmarks.bench_suite run --rows 10000000 --window_sizes 32 --channels 8 --pairs none
+    python -m benchmarks.bench_suite compare baseline.json results.json --time_threshold 0.2 --min_memory_kb 512
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from app.windowing import create_sliding_windows
+from app.reconstruction import unwindow_data
+from app.data_handler import load_csv, write_csv
+from app.instrumentation import start_recording, stop_recording, stage
+from benchmarks.synthetic import synthetic_series, synthetic_frame
+
+RESULTS_VERSION = 1
+KEY_FIELDS = ('benchmark', 'rows', 'window_size', 'channels', 'pair', 'batch_size')
+
+
+def measure(function, repeats):
+    """
+    Time function over repeats runs, then record its memory use in one traced run.
+
+    Returns:
+        dict: median_seconds, min_seconds, tracemalloc_peak_kb and max_rss_delta_kb.
+    """
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start_time)
+    # Tracing slows allocations down, so memory is measured apart from the timed runs
+    start_recording(trace_memory=True)
+    with stage('benchmark'):
+        function()
+    entry = stop_recording()[0]
+    return {
+        'median_seconds': statistics.median(times),
+        'min_seconds': min(times),
+        'tracemalloc_peak_kb': entry.get('tracemalloc_peak_kb'),
+        'max_rss_delta_kb': entry.get('max_rss_delta_kb')
+    }
+
+
+def result_key(result):
+    return '|'.join(f"{field}={result.get(field)}" for field in KEY_FIELDS)
+
+
+def data_path_benchmarks(rows, window_size, channels, repeats, work_dir):
+    """
+    Measurements of the data path functions on one synthetic series.
+    """
+    series = synthetic_series(rows, channels)
+    frame = synthetic_frame(rows, channels)
+    windowed_frame = pd.DataFrame(series[:, 0].repeat(window_size).reshape(rows, window_size))
+    csv_path = os.path.join(work_dir, f"synthetic_{rows}_{channels}.csv")
+    output_path = os.path.join(work_dir, 'output.csv')
+    cache_dir = os.path.join(work_dir, 'csv_cache')
+    write_csv(csv_path, frame, include_date=False)
+    load_csv(csv_path, headers=True, cache_dir=cache_dir)  # Populates the binary cache for the cached measurement
+
+    benchmarks = {
+        'create_sliding_windows': lambda: create_sliding_windows(series, window_size),
+        'create_sliding_windows_materialized': lambda: create_sliding_windows(series, window_size, materialize=True),
+        'unwindow_data': lambda: unwindow_data(windowed_frame),
+        'load_csv': lambda: load_csv(csv_path, headers=True),
+        'load_csv_cached': lambda: load_csv(csv_path, headers=True, cache_dir=cache_dir),
+        'write_csv': lambda: write_csv(output_path, frame, include_date=False)
+    }
+    results = []
+    for name, function in benchmarks.items():
+        result = {'benchmark': name, 'rows': rows, 'window_size': window_size, 'channels': channels}
+        result.update(measure(function, repeats))
+        print(f"[bench_suite] {result_key(result)}: {result['median_seconds'] * 1000:.2f}ms, "
+              f"peak {result['tracemalloc_peak_kb']}KB")
+        results.append(result)
+    return results
+
+
+def training_step_benchmark(pair, window_size, channels, batch_size, interface_size, steps):
+    """
+    Mean train_on_batch time of one plugin pair, excluding the tracing steps.
+    """
+    from app.autoencoder_manager import AutoencoderManager
+    from app.plugin_loader import load_plugin
+
+    encoder_name, decoder_name = pair.split(':')
+    encoder_plugin_class, _ = load_plugin('feature_extractor.encoders', encoder_name)
+    decoder_plugin_class, _ = load_plugin('feature_extractor.decoders', decoder_name)
+    manager = AutoencoderManager(encoder_plugin_class(), decoder_plugin_class())
+    config = {'use_sliding_windows': True, 'learning_rate': 0.001}
+    manager.build_autoencoder(window_size, interface_size, config, channels)
+    model = manager.autoencoder_model
+    batch = create_sliding_windows(synthetic_series(batch_size + window_size - 1, channels), window_size, materialize=True)
+    for _ in range(3):
+        model.train_on_batch(batch, batch)
+
+    result = {'benchmark': 'train_step', 'window_size': window_size, 'channels': channels, 'pair': pair, 'batch_size': batch_size}
+    result.update(measure(lambda: [model.train_on_batch(batch, batch) for _ in range(steps)], 1))
+    result['median_seconds'] /= steps
+    result['min_seconds'] /= steps
+    print(f"[bench_suite] {result_key(result)}: {result['median_seconds'] * 1000:.2f}ms per step")
+    return result
+
+
+def environment():
+    info = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__
+    }
+    if 'tensorflow' in sys.modules:
+        info['tensorflow'] = sys.modules['tensorflow'].__version__
+    return info
+
+
+def installed_pairs():
+    """
+    encoder:decoder pairs of the installed plugins with the same name in both groups, without aliases
+    (e.g. 'default') of a pair already listed.
+    """
+    from app.plugin_loader import plugin_registry
+
+    groups = plugin_registry()['groups']
+    encoders, decoders = groups['feature_extractor.encoders'], groups['feature_extractor.decoders']
+    pairs, seen = [], set()
+    for name in sorted(set(encoders) & set(decoders)):
+        if (encoders[name], decoders[name]) not in seen:
+            seen.add((encoders[name], decoders[name]))
+            pairs.append(f"{name}:{name}")
+    return pairs
+
+
+def run_suite(args):
+    rows_list = [int(value) for value in args.rows.split(',')]
+    window_sizes = [int(value) for value in args.window_sizes.split(',')]
+    channels_list = [int(value) for value in args.channels.split(',')]
+    if args.pairs is None:
+        pairs = installed_pairs()
+        print(f"[bench_suite] Training step pairs: {', '.join(pairs)}")
+    else:
+        pairs = [] if args.pairs == 'none' else args.pairs.split(',')
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='bench_suite_') as work_dir:
+        for rows in rows_list:
+            for window_size in window_sizes:
+                for channels in channels_list:
+                    results.extend(data_path_benchmarks(rows, window_size, channels, args.repeats, work_dir))
+    for pair in pairs:
+        for window_size in window_sizes:
+            for channels in channels_list:
+                try:
+                    results.append(training_step_benchmark(pair, window_size, channels, args.batch_size, args.interface_size, args.steps))
+                except Exception as e:
+                    print(f"[bench_suite] Training step of {pair} failed: {e}")
+
+    report = {'version': RESULTS_VERSION, 'created': time.time(), 'environment': environment(), 'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"[bench_suite] {len(results)} results saved to {args.output}")
+
+
+def compare_results(baseline, current, time_threshold=0.2, memory_threshold=0.2, min_seconds=0.005, min_memory_kb=1024):
+    """
+    Measurements of current that regressed against baseline.
+
+    A time regression is a median time above baseline * (1 + time_threshold) by more than min_seconds;
+    a memory regression is a tracemalloc peak above baseline * (1 + memory_threshold) by more than
+    min_memory_kb. The absolute margins keep timer noise on very fast functions from being flagged.
+
+    Args:
+        baseline (dict): Stored results of a previous run.
+        current (dict): Results of this run.
+
+    Returns:
+        list: One dict per regression with the key, the metric, both values and the ratio.
+    """
+    baseline_results = {result_key(result): result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        key = result_key(result)
+        reference = baseline_results.get(key)
+        if reference is None:
+            continue
+        checks = [
+            ('median_seconds', time_threshold, min_seconds),
+            ('tracemalloc_peak_kb', memory_threshold, min_memory_kb)
+        ]
+        for metric, threshold, margin in checks:
+            before, after = reference.get(metric), result.get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + threshold) and after - before > margin:
+                regressions.append({'key': key, 'metric': metric, 'baseline': before, 'current': after,
+                                    'ratio': after / before if before else float('inf')})
+    return regressions
+
+
+def compare_command(args):
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    with open(args.current, 'r') as f:
+        current = json.load(f)
+    regressions = compare_results(baseline, current, args.time_threshold, args.memory_threshold, args.min_seconds, args.min_memory_kb)
+    matched = len({result_key(result) for result in baseline['results']} & {result_key(result) for result in current['results']})
+    print(f"[bench_suite] Compared {matched} measurements against {args.baseline}")
+    for regression in regressions:
+        print(f"[bench_suite] REGRESSION {regression['key']} {regression['metric']}: "
+              f"{regression['baseline']:.6g} -> {regression['current']:.6g} ({regression['ratio']:.2f}x)")
+    if not regressions:
+        print("[bench_suite] No regressions.")
+    sys.exit(1 if regressions else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite for the data path and training step throughput.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks and save the results as JSON.')
+    run_parser.add_argument('--rows', type=str, default='10000,100000,1000000', help='Comma-separated row counts (up to 10M).')
+    run_parser.add_argument('--window_sizes', type=str, default='32', help='Comma-separated window sizes.')
+    run_parser.add_argument('--channels', type=str, default='8', help='Comma-separated channel counts.')
+    run_parser.add_argument('--pairs', type=str, default=None, help="Comma-separated encoder:decoder pairs for the training step (default: every installed pair), 'none' to skip it.")
+    run_parser.add_argument('--batch_size', type=int, default=64, help='Windows per training step.')
+    run_parser.add_argument('--interface_size', type=int, default=8, help='Encoder/decoder interface size.')
+    run_parser.add_argument('--steps', type=int, default=20, help='Timed training steps.')
+    run_parser.add_argument('--repeats', type=int, default=3, help='Timed runs per data path measurement.')
+    run_parser.add_argument('--output', type=str, default='bench_results.json', help='JSON file for the results.')
+
+    compare_parser = subparsers.add_parser('compare', help='Flag regressions of a run against a stored baseline.')
+    compare_parser.add_argument('baseline', type=str, help='Results JSON of the baseline run.')
+    compare_parser.add_argument('current', type=str, help='Results JSON of the run to check.')
+    compare_parser.add_argument('--time_threshold', type=float, default=0.2, help='Allowed relative slowdown of the median time.')
+    compare_parser.add_argument('--min_seconds', type=float, default=0.005, help='Slowdowns smaller than this many seconds are never flagged.')
+    compare_parser.add_argument('--memory_threshold', type=float, default=0.2, help='Allowed relative growth of the peak memory.')
+    compare_parser.add_argument('--min_memory_kb', type=float, default=1024, help='Peak memory growth smaller than this many KB is never flagged.')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run_suite(args)
+    else:
+        compare_command(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Synthetic multi-channel time series for the benchmarks, so that no real data is needed.
+
+Each channel is a random walk plus a daily-like seasonal cycle and noise, with channel-specific
+scales, which gives the value ranges and autocorrelation of price-like features.
+"""
+import numpy as np
+import pandas as pd
+
+
+def synthetic_series(num_rows, num_channels, seed=0, period=24):
+    """
+    Synthetic series with shape (num_rows, num_channels), float32.
+
+    Args:
+        num_rows (int): Number of rows (time steps).
+        num_channels (int): Number of channels.
+        seed (int): Random seed, equal seeds give equal series.
+        period (int): Rows per seasonal cycle.
+
+    Returns:
+        np.ndarray: The series.
+    """
+    rng = np.random.default_rng(seed)
+    scales = rng.uniform(0.5, 2.0, num_channels).astype(np.float32)
+    phases = rng.uniform(0, 2 * np.pi, num_channels).astype(np.float32)
+    series = np.empty((num_rows, num_channels), dtype=np.float32)
+    time_steps = np.arange(num_rows, dtype=np.float32)[:, np.newaxis]
+    # Generated in blocks of rows to bound the float64 temporaries of 10M-row series
+    block_rows = 1 << 20
+    level = np.zeros(num_channels, dtype=np.float32)
+    for start in range(0, num_rows, block_rows):
+        stop = min(start + block_rows, num_rows)
+        walk = level + np.cumsum(rng.normal(0, 0.01, (stop - start, num_channels)), axis=0, dtype=np.float32)
+        level = walk[-1]
+        seasonal = np.sin(2 * np.pi * time_steps[start:stop] / period + phases)
+        noise = rng.normal(0, 0.05, (stop - start, num_channels)).astype(np.float32)
+        series[start:stop] = scales * (walk + 0.1 * seasonal) + noise
+    return series
+
+
+def synthetic_frame(num_rows, num_channels, seed=0, with_dates=False):
+    """
+    Synthetic series as a DataFrame with columns channel_0..channel_n, optionally indexed by hourly dates.
+    """
+    frame = pd.DataFrame(synthetic_series(num_rows, num_channels, seed), columns=[f"channel_{i}" for i in range(num_channels)])
+    if with_dates:
+        frame.index = pd.date_range('2000-01-01', periods=num_rows, freq='h', name='date')
+    return frame
+
+
+def write_synthetic_csv(file_path, num_rows, num_channels, seed=0, with_dates=False):
+    """
+    Write a synthetic series to a CSV file with a header row, as load_csv(headers=True) expects.
+    """
+    synthetic_frame(num_rows, num_channels, seed, with_dates).to_csv(file_path, index=with_dates)
+    return file_path
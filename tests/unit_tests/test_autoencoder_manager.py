@@ -0,0 +1,36 @@
+import pytest
+import numpy as np
+from keras.models import Model
+from keras.layers import Dense, Input, BatchNormalization
+from app.autoencoder_manager import transfer_weights
+
+def build_model(hidden_size, output_size):
+    inputs = Input(shape=(6,))
+    x = Dense(hidden_size)(inputs)
+    x = BatchNormalization()(x)
+    outputs = Dense(output_size)(x)
+    return Model(inputs=inputs, outputs=outputs)
+
+def test_transfer_weights_same_shapes():
+    source, target = build_model(8, 4), build_model(8, 4)
+    counts = transfer_weights(source, target)
+    assert counts == {'copied': 8, 'partial': 0, 'reinitialized': 0}
+    for source_weight, target_weight in zip(source.get_weights(), target.get_weights()):
+        np.testing.assert_array_equal(source_weight, target_weight)
+
+def test_transfer_weights_partial_copy():
+    source, target = build_model(8, 4), build_model(8, 6)
+    last_kernel_before = target.layers[-1].get_weights()[0].copy()
+    counts = transfer_weights(source, target)
+    assert counts == {'copied': 6, 'partial': 2, 'reinitialized': 0}
+    source_kernel, target_kernel = source.layers[-1].get_weights()[0], target.layers[-1].get_weights()[0]
+    np.testing.assert_array_equal(target_kernel[:, :4], source_kernel)
+    np.testing.assert_array_equal(target_kernel[:, 4:], last_kernel_before[:, 4:])
+
+def test_transfer_weights_missing_layers_reinitialized():
+    inputs = Input(shape=(6,))
+    source = Model(inputs=inputs, outputs=Dense(4)(inputs))
+    target = build_model(8, 4)
+    counts = transfer_weights(source, target)
+    # First Dense is partially copied, second Dense and BatchNormalization have no counterpart
+    assert counts == {'copied': 0, 'partial': 2, 'reinitialized': 6}
@@ -0,0 +1,105 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from collections import OrderedDict
+from app.batch_runner import DatasetCache, collect_config_files, run_batch, run_batch_command, run_job, split_groups
+from app.config_merger import explicit_cli_args
+from app.data_processor import process_data
+
+@pytest.fixture
+def data_files(tmp_path):
+    rng = np.random.default_rng(0)
+    for name in ['train', 'val']:
+        pd.DataFrame(rng.random((40, 3)), columns=['a', 'b', 'c']).to_csv(tmp_path / f'{name}.csv', index=False)
+    return str(tmp_path / 'train.csv'), str(tmp_path / 'val.csv')
+
+def write_config(path, **config):
+    with open(path, 'w') as f:
+        json.dump(config, f)
+    return str(path)
+
+def test_datasets_are_shared_between_matching_jobs(data_files):
+    input_file, validation_file = data_files
+    config = {'input_file': input_file, 'validation_file': validation_file, 'headers': True, 'no_csv_cache': True,
+              'use_sliding_windows': True, 'window_size': 4}
+    cache = DatasetCache()
+    first = process_data(config, cache)
+    second = process_data(dict(config), cache)
+    assert first[0] is second[0] and first[1] is second[1]
+    third = process_data(dict(config, window_size=8), cache)
+    assert np.shares_memory(third[0].series, first[0].series)  # Same parsed frame, new windowed view
+    assert third[0].shape[1] == 8
+    assert cache.stats() == {'entries': 8, 'hits': 8, 'misses': 8}
+
+def test_collect_config_files(tmp_path):
+    jobs_dir = tmp_path / 'jobs'
+    jobs_dir.mkdir()
+    for name in ['b.json', 'a.json', 'notes.txt']:
+        (jobs_dir / name).write_text('{}')
+    extra = write_config(tmp_path / 'extra.json')
+    assert collect_config_files(f"{jobs_dir},{extra}") == [str(jobs_dir / 'a.json'), str(jobs_dir / 'b.json'), extra]
+
+def test_jobs_run_grouped_by_data_settings_with_failures_recorded(tmp_path, data_files):
+    input_file, validation_file = data_files
+    config_files = [
+        write_config(tmp_path / 'job0.json', input_file=input_file, validation_file=validation_file, window_size=4),
+        write_config(tmp_path / 'job1.json', input_file=validation_file, validation_file=validation_file),
+        write_config(tmp_path / 'job2.json', input_file=input_file, validation_file=validation_file, window_size=8),
+        str(tmp_path / 'missing.json')
+    ]
+    calls = []
+
+    def fake_run_job(config_file, dataset_cache, overrides=None):
+        calls.append((config_file, id(dataset_cache)))
+        if config_file.endswith('missing.json'):
+            raise FileNotFoundError(config_file)
+
+    with patch('app.batch_runner.run_job', side_effect=fake_run_job):
+        results = run_batch(config_files)
+    # Jobs sharing data files run back to back, results keep the input order
+    assert [call[0] for call in calls] == [config_files[0], config_files[2], config_files[1], config_files[3]]
+    assert [result['config_file'] for result in results] == config_files
+    assert [result['status'] for result in results] == ['ok', 'ok', 'ok', 'failed']
+
+def test_batch_summary_is_saved(tmp_path):
+    config_file = write_config(tmp_path / 'job.json')
+    with patch('app.batch_runner.run_job'):
+        run_batch_command({'batch_configs': config_file, 'batch_summary': str(tmp_path / 'summary.json')})
+    with open(tmp_path / 'summary.json') as f:
+        summary = json.load(f)
+    assert summary['jobs'][0]['config_file'] == config_file and summary['jobs'][0]['status'] == 'ok'
+
+def test_large_groups_are_split_across_workers():
+    groups = OrderedDict([('a', [(i, f'a{i}.json') for i in range(5)]), ('b', [(5, 'b.json')])])
+    tasks = split_groups(groups, 4)
+    assert [(settings, [index for index, _ in jobs]) for settings, jobs in tasks] == [
+        ('a', [0, 1]), ('a', [2]), ('a', [3, 4]), ('b', [5])
+    ]
+    assert len(split_groups(groups, 10)) == 6  # One job per task at most
+    assert split_groups(groups, 1) == list(groups.items())
+
+def test_pooled_jobs_run_their_search_in_process(tmp_path):
+    config_file = write_config(tmp_path / 'job.json', search_workers=4, encoder_plugin='ann', decoder_plugin='ann')
+    with patch('app.data_processor.run_autoencoder_pipeline') as pipeline:
+        run_job(config_file, overrides={'search_workers': 1})
+    assert pipeline.call_args[0][0]['search_workers'] == 1
+
+def test_cli_arguments_apply_to_every_job_without_argv_leaking(tmp_path, monkeypatch):
+    config_file = write_config(tmp_path / 'job.json', input_file='job.csv', precision='float32', encoder_plugin='ann', decoder_plugin='ann')
+    # The batch process's own command line is never merged into a job's configuration
+    monkeypatch.setattr('sys.argv', ['main.py', 'other.csv', '--window_size', '99'])
+    with patch('app.data_processor.run_autoencoder_pipeline') as pipeline:
+        run_batch_command({'batch_configs': config_file, 'batch_workers': 1},
+                          {'batch_configs': config_file, 'precision': 'mixed_float16', 'checkpoint_dir': str(tmp_path)})
+    job_config = pipeline.call_args[0][0]
+    assert job_config['precision'] == 'mixed_float16' and job_config['checkpoint_dir'] == str(tmp_path)
+    assert job_config['input_file'] == 'job.csv' and job_config['window_size'] != 99
+
+def test_explicit_cli_args():
+    argv = ['main.py', 'data.csv', '--batch_configs', 'jobs', '--precision', 'float16', '--layers', '3']
+    cli_args = {'batch_configs': 'jobs', 'precision': 'float16', 'checkpoint_dir': None}
+    assert explicit_cli_args(cli_args, {'layers': '3'}, argv) == {
+        'batch_configs': 'jobs', 'precision': 'float16', 'layers': 3, 'input_file': 'data.csv'
+    }
@@ -0,0 +1,41 @@
+import numpy as np
+from benchmarks.synthetic import synthetic_series, synthetic_frame
+from benchmarks.bench_suite import measure, compare_results, installed_pairs, result_key
+
+def test_synthetic_series_is_deterministic():
+    series = synthetic_series(5000, 4, seed=1)
+    assert series.shape == (5000, 4) and series.dtype == np.float32
+    np.testing.assert_array_equal(series, synthetic_series(5000, 4, seed=1))
+    assert not np.array_equal(series, synthetic_series(5000, 4, seed=2))
+    assert np.isfinite(series).all() and (series.std(axis=0) > 0).all()
+    assert list(synthetic_frame(10, 2).columns) == ['channel_0', 'channel_1']
+
+def test_measure_records_time_and_memory():
+    result = measure(lambda: np.ones(1 << 20), repeats=2)
+    assert result['min_seconds'] <= result['median_seconds']
+    assert result['tracemalloc_peak_kb'] >= 8 * 1024 - 64
+
+def test_compare_flags_only_significant_regressions():
+    def results(**seconds):
+        return {'results': [{'benchmark': name, 'rows': 10, 'median_seconds': value, 'tracemalloc_peak_kb': 4096}
+                            for name, value in seconds.items()]}
+    baseline = results(slower=1.0, noisy=0.001, same=1.0, removed=1.0)
+    current = results(slower=1.5, noisy=0.002, same=1.1, added=5.0)
+    current['results'][0]['tracemalloc_peak_kb'] = 8192
+    regressions = compare_results(baseline, current)
+    assert [(r['key'].split('|')[0], r['metric']) for r in regressions] == [
+        ('benchmark=slower', 'median_seconds'), ('benchmark=slower', 'tracemalloc_peak_kb')
+    ]
+
+def test_training_steps_of_other_batch_sizes_are_not_compared():
+    result = {'benchmark': 'train_step', 'window_size': 32, 'channels': 8, 'pair': 'cnn:cnn', 'batch_size': 64}
+    assert result_key(result) != result_key(dict(result, batch_size=128))
+    baseline = {'results': [dict(result, median_seconds=1.0, tracemalloc_peak_kb=1000)]}
+    current = {'results': [dict(result, median_seconds=1.0, tracemalloc_peak_kb=1600)]}
+    assert compare_results(baseline, current) == []
+    assert [r['metric'] for r in compare_results(baseline, current, min_memory_kb=256)] == ['tracemalloc_peak_kb']
+
+def test_installed_pairs_skip_aliases():
+    pairs = installed_pairs()
+    assert 'cnn:cnn' in pairs and 'default:default' not in pairs
+    assert len(pairs) == len(set(pairs))
@@ -0,0 +1,108 @@
+import numpy as np
+from keras.models import Sequential
+from keras.layers import Input, Dense
+from keras.optimizers import Adam
+from keras.callbacks import EarlyStopping, LambdaCallback
+from app.checkpointing import TrainingCheckpoint, checkpoint_path, load_checkpoint, save_checkpoint
+from app.threshold_stopping import ThresholdStopping
+
+def build_model():
+    model = Sequential([Input(shape=(6,)), Dense(3, activation='tanh'), Dense(6)])
+    model.compile(optimizer=Adam(learning_rate=0.01), loss='mse')
+    return model
+
+def training_data():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(64, 6)).astype(np.float32)
+
+def fit(model, epochs, callbacks, initial_epoch=0):
+    data = training_data()
+    return model.fit(data, data, epochs=epochs, initial_epoch=initial_epoch, batch_size=16,
+                     shuffle=False, verbose=0, callbacks=callbacks)
+
+def test_resumed_training_matches_uninterrupted_training(tmp_path):
+    file_path = checkpoint_path(str(tmp_path), 4)
+    reference = build_model()
+    initial_weights = reference.get_weights()
+    fit(reference, 6, [])
+
+    interrupted = build_model()
+    interrupted.set_weights(initial_weights)
+    fit(interrupted, 3, [TrainingCheckpoint(file_path, every_epochs=1)])
+    snapshot = load_checkpoint(file_path)
+    assert snapshot['meta']['epoch'] == 3 and len(snapshot['meta']['history']['loss']) == 3
+
+    # A fresh process: new weights and an optimizer without state, both replaced by the checkpoint
+    resumed = build_model()
+    checkpoint = TrainingCheckpoint(file_path, every_epochs=2, resume_from=snapshot)
+    assert checkpoint.initial_epoch == 3
+    fit(resumed, 6, [checkpoint], initial_epoch=checkpoint.initial_epoch)
+
+    assert int(resumed.optimizer.iterations.numpy()) == int(reference.optimizer.iterations.numpy())
+    for resumed_weight, reference_weight in zip(resumed.get_weights(), reference.get_weights()):
+        np.testing.assert_allclose(resumed_weight, reference_weight, rtol=1e-5, atol=1e-6)
+    assert len(checkpoint.history['loss']) == 6
+    assert load_checkpoint(file_path)['meta']['completed']
+    assert not checkpoint.stopped_early
+
+def test_training_stopped_early_is_not_resumed(tmp_path):
+    file_path = checkpoint_path(str(tmp_path), 2)
+    model = build_model()
+    stop = LambdaCallback(on_epoch_end=lambda epoch, logs: setattr(model, 'stop_training', epoch == 1))
+    fit(model, 5, [stop, TrainingCheckpoint(file_path)])
+    checkpoint = TrainingCheckpoint(file_path, resume_from=load_checkpoint(file_path))
+    assert checkpoint.initial_epoch == 2 and checkpoint.stopped_early
+
+    restored = build_model()
+    checkpoint.restore(restored)
+    for restored_weight, weight in zip(restored.get_weights(), model.get_weights()):
+        np.testing.assert_array_equal(restored_weight, weight)
+
+def test_early_stopping_state_is_restored(tmp_path):
+    file_path = str(tmp_path / 'checkpoint.npz')
+    model = build_model()
+    early_stopping = EarlyStopping(monitor='loss', patience=3, restore_best_weights=True)
+    fit(model, 2, [early_stopping, TrainingCheckpoint(file_path, early_stopping=early_stopping)])
+    snapshot = load_checkpoint(file_path)
+    assert snapshot['meta']['early_stopping']['best'] == early_stopping.best
+    assert len(snapshot['best_weights']) == len(model.get_weights())
+
+    resumed_early_stopping = EarlyStopping(monitor='loss', patience=3, restore_best_weights=True)
+    checkpoint = TrainingCheckpoint(file_path, early_stopping=resumed_early_stopping, resume_from=snapshot)
+    checkpoint.set_model(build_model())
+    checkpoint.set_params({'epochs': 4})
+    resumed_early_stopping.set_model(checkpoint.model)
+    resumed_early_stopping.on_train_begin()
+    checkpoint.on_train_begin()
+    checkpoint._writer.close()
+    assert resumed_early_stopping.best == early_stopping.best
+    assert resumed_early_stopping.best_weights is not None
+
+def test_interrupted_write_keeps_previous_checkpoint(tmp_path):
+    file_path = str(tmp_path / 'checkpoint.npz')
+    meta = {'epoch': 1, 'counts': {'weights': 1, 'optimizer': 0, 'best_weights': 0}}
+    save_checkpoint(file_path, {'meta': meta, 'weights': [np.ones(3)], 'optimizer': []})
+    with open(f"{file_path}.tmp", 'wb') as f:
+        f.write(b'partial')  # Left behind by a crash during the next write
+    snapshot = load_checkpoint(file_path)
+    assert snapshot['meta']['epoch'] == 1 and snapshot['best_weights'] is None
+    np.testing.assert_array_equal(snapshot['weights'][0], np.ones(3))
+    assert load_checkpoint(str(tmp_path / 'missing.npz')) is None
+
+def test_threshold_stopping_projection_is_restored(tmp_path):
+    # An unreachable threshold abandons the candidate on the second projected miss, at the 4th check
+    file_path = checkpoint_path(str(tmp_path), 3)
+    reference_stopping = ThresholdStopping(training_data(), -1e9, every_epochs=1)
+    fit(build_model(), 10, [reference_stopping])
+    assert reference_stopping.stopped_epoch == 4
+
+    interrupted_stopping = ThresholdStopping(training_data(), -1e9, every_epochs=1)
+    fit(build_model(), 3, [interrupted_stopping, TrainingCheckpoint(file_path, threshold_stopping=interrupted_stopping)])
+    snapshot = load_checkpoint(file_path)
+    assert len(snapshot['meta']['threshold_stopping']['evaluations']) == 3
+
+    resumed_stopping = ThresholdStopping(training_data(), -1e9, every_epochs=1)
+    checkpoint = TrainingCheckpoint(file_path, resume_from=snapshot, threshold_stopping=resumed_stopping)
+    fit(build_model(), 10, [resumed_stopping, checkpoint], initial_epoch=checkpoint.initial_epoch)
+    assert resumed_stopping.stopped_epoch == 4 and resumed_stopping.stop_reason == 'abandoned'
+    assert [entry['epoch'] for entry in resumed_stopping.evaluations] == [1, 2, 3, 4]
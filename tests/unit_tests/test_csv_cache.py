@@ -0,0 +1,82 @@
+import os
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from app.data_handler import load_csv
+from app.csv_cache import file_fingerprint, evict_cache, clear_cache
+
+@pytest.fixture
+def csv_file(tmp_path):
+    dates = pd.date_range('2020-01-01', periods=50, freq='h')
+    data = pd.DataFrame({'A': np.random.rand(50), 'B': np.arange(50)})
+    data.insert(0, 'date', dates.strftime('%d/%m/%Y %H:%M'))
+    file_path = tmp_path / 'data.csv'
+    data.to_csv(file_path, index=False)
+    return str(file_path)
+
+def test_load_csv_cache_hit_matches_parse(csv_file, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    parsed = load_csv(csv_file, headers=True, force_date=True, cache_dir=cache_dir)
+    with patch('app.data_handler.parse_csv') as mock_parse_csv:
+        cached = load_csv(csv_file, headers=True, force_date=True, cache_dir=cache_dir)
+        mock_parse_csv.assert_not_called()
+    pd.testing.assert_frame_equal(cached, parsed)
+    assert cached.index.name == 'date'
+
+def test_load_csv_cache_without_headers(csv_file, tmp_path):
+    headerless_file = str(tmp_path / 'headerless.csv')
+    pd.read_csv(csv_file).to_csv(headerless_file, index=False, header=False)
+    cache_dir = str(tmp_path / 'cache')
+    parsed = load_csv(headerless_file, headers=False, force_date=False, cache_dir=cache_dir)
+    cached = load_csv(headerless_file, headers=False, force_date=False, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(cached, parsed)
+    assert list(cached.columns) == ['col_0', 'col_1', 'col_2']
+
+def test_fingerprint_covers_content_and_options(csv_file):
+    key = file_fingerprint(csv_file, True, True)
+    assert key != file_fingerprint(csv_file, True, False)
+    assert key != file_fingerprint(csv_file, False, True)
+    with open(csv_file, 'a') as f:
+        f.write('01/01/2021 00:00,0.5,1\n')
+    assert key != file_fingerprint(csv_file, True, True)
+
+def test_evict_cache_removes_least_recently_used(csv_file, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    load_csv(csv_file, headers=True, force_date=True, cache_dir=cache_dir)
+    first_entry = os.listdir(cache_dir)[0]
+    os.utime(os.path.join(cache_dir, first_entry, 'meta.json'), (0, 0))
+    load_csv(csv_file, headers=True, force_date=False, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+    second_entry = next(name for name in os.listdir(cache_dir) if name != first_entry)
+    second_entry_path = os.path.join(cache_dir, second_entry)
+    evict_cache(cache_dir, sum(os.path.getsize(os.path.join(second_entry_path, name)) for name in os.listdir(second_entry_path)))
+    assert os.listdir(cache_dir) == [second_entry]
+    clear_cache(cache_dir)
+    assert not os.path.exists(cache_dir)
+
+def test_clear_cache_removes_only_cache_entries(csv_file, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    load_csv(csv_file, headers=True, force_date=True, cache_dir=cache_dir)
+    os.makedirs(os.path.join(cache_dir, 'abc.tmp123'))
+    os.makedirs(os.path.join(cache_dir, 'dataset_information'))
+    for name in ['key.json', 'key.json.tmp42']:
+        with open(os.path.join(cache_dir, 'dataset_information', name), 'w') as f:
+            f.write('{}')
+    with open(os.path.join(cache_dir, 'notes.txt'), 'w') as f:
+        f.write('not a cache entry')
+    clear_cache(cache_dir)
+    assert sorted(os.listdir(cache_dir)) == ['notes.txt']  # Dataset statistics are cleared too
+    clear_cache(None)
+
+def test_evict_cache_counts_dataset_statistics(csv_file, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    load_csv(csv_file, headers=True, force_date=True, cache_dir=cache_dir)
+    statistics_dir = os.path.join(cache_dir, 'dataset_information')
+    os.makedirs(statistics_dir)
+    statistics_file = os.path.join(statistics_dir, 'key.json')
+    with open(statistics_file, 'w') as f:
+        f.write('{}' + ' ' * 1000)
+    os.utime(statistics_file, (0, 0))
+    evict_cache(cache_dir, 1000)
+    assert not os.path.exists(statistics_file)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.data_profile import profile_frame, with_profile, ProfileAccumulator, PROFILE_BINS
+from app.windowing import create_sliding_windows
+from app.windowed_dataset import WindowedDataset, StreamingWindowedDataset
+
+@pytest.fixture
+def frame():
+    values = np.random.default_rng(1).normal(loc=1000.0, scale=2.0, size=(300, 3)).astype(np.float32)
+    values[[5, 17], 1] = np.nan
+    return pd.DataFrame(values, columns=['A', 'B', 'C'])
+
+def test_profile_frame_matches_numpy(frame):
+    profile = profile_frame(frame, chunk_rows=64)
+    values = frame.to_numpy()
+    assert profile.num_rows == 300
+    assert profile.columns == ['A', 'B', 'C']
+    np.testing.assert_array_equal(profile.nan_count, [0, 2, 0])
+    assert profile.has_nan
+    np.testing.assert_allclose(profile.column_min, np.nanmin(values, axis=0))
+    np.testing.assert_allclose(profile.column_max, np.nanmax(values, axis=0))
+    np.testing.assert_allclose(profile.column_mean, np.nanmean(values.astype(np.float64), axis=0), rtol=1e-12)
+    np.testing.assert_allclose(profile.column_var, np.nanvar(values.astype(np.float64), axis=0), rtol=1e-9)
+    assert profile.histograms.shape == (3, PROFILE_BINS)
+    np.testing.assert_array_equal(profile.histograms.sum(axis=1), [300, 298, 300])
+    expected, _ = np.histogram(values[:, 0], bins=PROFILE_BINS, range=(values[:, 0].min(), values[:, 0].max()))
+    assert np.abs(profile.histograms[0] - expected).sum() <= 2  # Edge rounding only
+
+def test_profile_normalize_and_summary(frame):
+    profile = profile_frame(frame.fillna(0.0).assign(D=1.0))
+    normalized = profile.normalize(frame.fillna(0.0).assign(D=1.0).to_numpy())
+    assert normalized.min() == 0.0 and normalized.max() == pytest.approx(1.0)
+    assert (normalized[:, 3] == 0).all()
+    summary = profile.to_dict()
+    assert not profile.has_nan
+    assert summary['columns']['D'] == {'nan_count': 0, 'min': 1.0, 'max': 1.0, 'mean': 1.0, 'var': 0.0}
+
+def test_all_nan_column():
+    accumulator = ProfileAccumulator()
+    accumulator.update(np.array([[1.0, np.nan], [2.0, np.nan]]))
+    profile = accumulator.result()
+    assert np.isnan(profile.column_min[1]) and profile.nan_count[1] == 2
+
+def test_datasets_use_profile(frame, tmp_path):
+    profile = profile_frame(frame)
+    assert WindowedDataset(frame, 4, profile=profile).profile is profile
+    file_path = str(tmp_path / 'data.csv')
+    frame.to_csv(file_path, index=False, header=False)
+    streamed = StreamingWindowedDataset(file_path, 4, chunk_size=50)
+    assert streamed.has_nan and streamed.num_rows == 300
+    np.testing.assert_array_equal(streamed.profile.nan_count, [0, 2, 0])
+    np.testing.assert_allclose(streamed.profile.column_mean, profile.column_mean, rtol=1e-6)
+
+def test_materialized_windows_carry_profile(frame):
+    profile = profile_frame(frame)
+    windows = with_profile(create_sliding_windows(frame.to_numpy(), 4), profile)
+    assert windows.profile is profile and not windows.flags.writeable
+    assert windows[:10].profile is None  # A subset is not described by the profile
+    assert np.expand_dims(frame.to_numpy(), -1).view(type(windows)).profile is None
@@ -0,0 +1,105 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+import tensorflow as tf
+from unittest.mock import patch
+from app.dataset_information import (
+    window_row_weights, compute_dataset_statistics, dataset_fingerprint, get_dataset_statistics, information_from_statistics, _statistics_cache, STATISTICS_CACHE_SIZE
+)
+from app.windowed_dataset import WindowedDataset, StreamingWindowedDataset
+from app.windowing import create_sliding_windows
+
+def legacy_statistics(data):
+    """The original computation: normalized columns of the flattened windows, concatenated."""
+    columns = []
+    for col in range(data.shape[-1]):
+        column_data = data[..., col].flatten()
+        columns.append((column_data - column_data.min()) / (column_data.max() - column_data.min()))
+    concatenated = tf.convert_to_tensor(np.concatenate(columns), dtype=tf.float32)
+    histogram = tf.cast(tf.histogram_fixed_width(concatenated, [0.0, 1.0], nbins=1000), tf.float32)
+    probabilities = histogram / tf.reduce_sum(histogram)
+    entropy = -tf.reduce_sum(probabilities * tf.math.log(probabilities + 1e-10) / tf.math.log(2.0))
+    return {
+        'num_samples': int(concatenated.shape[0]),
+        'mean': float(tf.reduce_mean(concatenated)),
+        'std': float(tf.math.reduce_std(concatenated)),
+        'entropy': float(entropy)
+    }
+
+@pytest.fixture
+def series():
+    return np.random.default_rng(0).normal(size=(500, 3)).astype(np.float32)
+
+def test_window_row_weights_count_windows():
+    weights = window_row_weights(0, 10, 10, 4)
+    np.testing.assert_array_equal(weights, [1, 2, 3, 4, 4, 4, 4, 3, 2, 1])
+    assert weights.sum() == 7 * 4
+    np.testing.assert_array_equal(window_row_weights(3, 7, 10, 4), weights[3:7])
+
+@pytest.mark.parametrize('window_size', [1, 7, 32])
+def test_windowed_statistics_match_flattened_windows(series, window_size):
+    statistics = compute_dataset_statistics(WindowedDataset(series, window_size), chunk_rows=64)
+    expected = legacy_statistics(create_sliding_windows(series, window_size, materialize=True))
+    assert statistics['num_samples'] == expected['num_samples']
+    assert statistics['mean'] == pytest.approx(expected['mean'], rel=1e-5)
+    assert statistics['std'] == pytest.approx(expected['std'], rel=1e-4)
+    assert statistics['entropy'] == pytest.approx(expected['entropy'], rel=1e-5)
+
+def test_row_and_window_array_statistics(series):
+    for data in [series, create_sliding_windows(series, 5)]:
+        statistics = compute_dataset_statistics(data, chunk_rows=50)
+        expected = legacy_statistics(data)
+        assert statistics['num_samples'] == expected['num_samples']
+        assert statistics['mean'] == pytest.approx(expected['mean'], rel=1e-5)
+        assert statistics['entropy'] == pytest.approx(expected['entropy'], rel=1e-5)
+
+def test_streaming_statistics_match_in_memory(series, tmp_path):
+    file_path = str(tmp_path / 'data.csv')
+    pd.DataFrame(series).to_csv(file_path, index=False, header=False)
+    streamed = compute_dataset_statistics(StreamingWindowedDataset(file_path, 8, chunk_size=64))
+    in_memory = compute_dataset_statistics(WindowedDataset(pd.read_csv(file_path, header=None).to_numpy(np.float32), 8))
+    assert streamed == pytest.approx(in_memory, rel=1e-9)
+
+def test_statistics_are_cached_by_fingerprint(series, tmp_path):
+    _statistics_cache.clear()
+    cache_dir = str(tmp_path / 'cache')
+    first = get_dataset_statistics(WindowedDataset(series, 8), cache_dir)
+    with patch('app.dataset_information.compute_dataset_statistics') as mock_compute:
+        assert get_dataset_statistics(WindowedDataset(series.copy(), 8), cache_dir) == first
+        _statistics_cache.clear()
+        assert get_dataset_statistics(WindowedDataset(series, 8), cache_dir) == first  # From disk
+        mock_compute.assert_not_called()
+    assert get_dataset_statistics(WindowedDataset(series, 9), None) != first
+
+def test_statistics_cache_keeps_the_most_recent_datasets(series):
+    _statistics_cache.clear()
+    datasets = [WindowedDataset(series[i:], 8) for i in range(STATISTICS_CACHE_SIZE + 2)]
+    first = dataset_fingerprint(datasets[0])
+    get_dataset_statistics(datasets[0])
+    for dataset in datasets[2:]:
+        get_dataset_statistics(dataset)
+        get_dataset_statistics(datasets[0])  # Recently used, stays in memory
+    assert len(_statistics_cache) == STATISTICS_CACHE_SIZE
+    assert first in _statistics_cache and dataset_fingerprint(datasets[2]) not in _statistics_cache
+    _statistics_cache.clear()
+
+def test_information_from_statistics():
+    information = information_from_statistics({'num_samples': 100, 'mean': 0.5, 'std': 0.25, 'entropy': 3.0}, '1h')
+    assert information['snr'] == pytest.approx(4.0)
+    assert information['channel_capacity'] == pytest.approx(np.log2(5) / 3600)
+    assert information['total_information_bits'] == pytest.approx(np.log2(5) * 100)
+
+def test_window_views_are_processed_on_their_series(series):
+    view = create_sliding_windows(series, 16)
+    assert dataset_fingerprint(view) == dataset_fingerprint(WindowedDataset(series, 16))
+    assert dataset_fingerprint(view) != dataset_fingerprint(create_sliding_windows(series, 16, materialize=True))
+    assert compute_dataset_statistics(view) == compute_dataset_statistics(WindowedDataset(series, 16))
+
+    long_view = create_sliding_windows(np.random.default_rng(1).normal(size=(20000, 8)).astype(np.float32), 128)
+    tracemalloc.start()
+    dataset_fingerprint(long_view)
+    compute_dataset_statistics(long_view)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < long_view.size * long_view.itemsize // 10  # The 82MB window tensor is never built
@@ -0,0 +1,101 @@
+import json
+import threading
+import time
+import urllib.request
+import urllib.error
+import numpy as np
+import pytest
+from keras.models import Sequential
+from keras.layers import Input, Conv1D, Flatten, Dense
+from app.encoding_server import MicroBatcher, EncodingService, EncodingServer, parse_model_paths
+from app.windowing import create_sliding_windows
+
+@pytest.fixture(scope='module')
+def encoder_path(tmp_path_factory):
+    model = Sequential([Input(shape=(8, 3)), Conv1D(4, 3, activation='relu'), Flatten(), Dense(5)])
+    path = str(tmp_path_factory.mktemp('models') / 'encoder.keras')
+    model.save(path)
+    return path
+
+@pytest.fixture
+def server(encoder_path):
+    service = EncodingService({'encoder': encoder_path}, max_batch_size=64, max_latency_ms=50.0)
+    server = EncodingServer(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def post(url, payload):
+    request = urllib.request.Request(f"{url}/encode", data=json.dumps(payload).encode(), headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    calls = []
+    def predict(inputs):
+        calls.append(len(inputs))
+        return inputs * 2
+    batcher = MicroBatcher(predict, max_batch_size=100, max_latency_ms=200.0)
+    results = {}
+    threads = [threading.Thread(target=lambda i=i: results.__setitem__(i, batcher.submit(np.full((2, 1), i)))) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+    assert all((results[i] == 2 * i).all() and results[i].shape == (2, 1) for i in range(10))
+    assert sum(calls) == 20 and len(calls) < 10
+    stats = batcher.stats.snapshot()
+    assert stats['requests'] == 10 and stats['rows'] == 20 and stats['p99_latency_ms'] >= stats['p50_latency_ms']
+
+def test_micro_batcher_reports_errors():
+    batcher = MicroBatcher(lambda inputs: 1 / 0, max_latency_ms=0.0)
+    with pytest.raises(ZeroDivisionError):
+        batcher.submit(np.zeros((1, 1)))
+    assert batcher.stats.snapshot()['errors'] == 1
+    batcher.close()
+
+def test_server_encodes_windows_and_rows(server, encoder_path):
+    model = server.service.models['encoder']
+    rows = np.random.rand(20, 3).astype(np.float32)
+    windows = np.ascontiguousarray(create_sliding_windows(rows, 8))
+    expected = np.asarray(model(windows, training=False))
+    np.testing.assert_allclose(post(server.url, {'windows': windows.tolist()})['encoded'], expected, rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(post(server.url, {'model': 'encoder', 'rows': rows.tolist()})['encoded'], expected, rtol=1e-5, atol=1e-6)
+
+def test_server_concurrent_requests_and_stats(server):
+    windows = np.random.rand(3, 8, 3).astype(np.float32).tolist()
+    threads = [threading.Thread(target=post, args=(server.url, {'windows': windows})) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with urllib.request.urlopen(f"{server.url}/stats") as response:
+        stats = json.loads(response.read())['encoder']
+    assert stats['requests'] == 8 and stats['rows'] == 24
+    assert stats['batches'] < 8
+    assert stats['p50_latency_ms'] is not None and stats['throughput_rows_per_second'] > 0
+
+def test_server_rejects_bad_input(server):
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        post(server.url, {'windows': np.zeros((1, 4, 3)).tolist()})
+    assert excinfo.value.code == 400
+
+def test_parse_model_paths():
+    assert parse_model_paths('a/enc.keras,fast=b/other.keras') == {'enc': 'a/enc.keras', 'fast': 'b/other.keras'}
+
+def test_service_feeds_rows_to_2d_input_encoders(tmp_path):
+    # Same input layout as the ANN encoder plugin: (None, input_dim)
+    model = Sequential([Input(shape=(6,)), Dense(4, activation='relu'), Dense(2)])
+    path = str(tmp_path / 'ann_encoder.keras')
+    model.save(path)
+    service = EncodingService({'ann': path}, max_latency_ms=0.0)
+    rows = np.random.rand(5, 6).astype(np.float32)
+    try:
+        np.testing.assert_allclose(service.encode(rows=rows.tolist()), np.asarray(model(rows, training=False)), rtol=1e-5, atol=1e-6)
+        with pytest.raises(ValueError):
+            service.encode(rows=np.zeros((2, 3)).tolist())
+    finally:
+        service.close()
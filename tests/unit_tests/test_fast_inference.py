@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from keras.models import Sequential, Model
+from keras.layers import Input, Conv1D, Flatten, Dense, Concatenate
+from app.fast_inference import FastInference, fast_inference, predict
+
+@pytest.fixture
+def model():
+    return Sequential([Input(shape=(8, 3)), Conv1D(4, 3, activation='relu'), Flatten(), Dense(5)])
+
+def test_matches_predict(model):
+    inputs = np.random.rand(50, 8, 3).astype(np.float32)
+    wrapper = FastInference(model, batch_size=16)  # Exercises the chunked path
+    np.testing.assert_allclose(wrapper.encode_batch(inputs), model.predict(inputs, verbose=0), rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(wrapper.encode_one(inputs[3]), model.predict(inputs[3:4], verbose=0)[0], rtol=1e-5, atol=1e-6)
+
+def test_wrapper_is_reused_and_follows_weight_updates(model):
+    wrapper = fast_inference(model)
+    assert fast_inference(model) is wrapper
+    inputs = np.random.rand(4, 8, 3).astype(np.float32)
+    model.set_weights([np.zeros_like(w) for w in model.get_weights()])
+    np.testing.assert_array_equal(wrapper.encode_batch(inputs), np.zeros((4, 5), dtype=np.float32))
+
+def test_multi_input_models_fall_back_to_predict():
+    first, second = Input(shape=(2,)), Input(shape=(3,))
+    model = Model([first, second], Dense(1)(Concatenate()([first, second])))
+    with pytest.raises(ValueError):
+        FastInference(model)
+    inputs = [np.ones((2, 2), dtype=np.float32), np.ones((2, 3), dtype=np.float32)]
+    assert predict(model, inputs).shape == (2, 1)
+
+def test_models_without_keras_inputs_use_their_own_predict():
+    class Interpreter:
+        input_shape = (None, 4)
+
+        def predict(self, inputs, verbose=0):
+            return inputs * 2
+    np.testing.assert_array_equal(predict(Interpreter(), np.ones((3, 4))), np.full((3, 4), 2.0))
@@ -0,0 +1,44 @@
+import json
+import tracemalloc
+import numpy as np
+from app.instrumentation import start_recording, stop_recording, stage
+
+def test_stage_is_noop_without_recording():
+    with stage('load_csv'):
+        pass
+    assert stop_recording() == []
+
+def test_stages_are_nested_and_serializable():
+    start_recording()
+    with stage('candidate', interface_size=4):
+        with stage('train'):
+            sum(range(100000))
+        with stage('evaluate', dataset='validation'):
+            pass
+    with stage('save'):
+        pass
+    stages = stop_recording()
+    assert [entry['name'] for entry in stages] == ['candidate', 'save']
+    candidate = stages[0]
+    assert candidate['interface_size'] == 4
+    assert [entry['name'] for entry in candidate['stages']] == ['train', 'evaluate']
+    assert candidate['wall_time'] >= candidate['stages'][0]['wall_time'] > 0
+    assert candidate['cpu_time'] >= 0
+    assert 'stages' not in stages[1]
+    json.dumps(stages)
+
+def test_trace_memory_records_nested_peaks():
+    start_recording(trace_memory=True)
+    with stage('outer'):
+        with stage('inner'):
+            buffer = np.ones(4 * 1024 * 1024, dtype=np.uint8)
+            del buffer
+    stages = stop_recording()
+    inner = stages[0]['stages'][0]
+    assert inner['tracemalloc_peak_kb'] >= 4096
+    assert stages[0]['tracemalloc_peak_kb'] >= inner['tracemalloc_peak_kb']
+
+def test_trace_memory_without_reset_peak(monkeypatch):
+    # Python 3.8 has no tracemalloc.reset_peak
+    monkeypatch.delattr(tracemalloc, 'reset_peak')
+    test_trace_memory_records_nested_peaks()
@@ -0,0 +1,55 @@
+import pytest
+from app.interface_search import candidate_sizes, linear_search, bracket_search, golden_section_search, batched_search, SEARCH_STRATEGIES
+
+def test_candidate_sizes():
+    assert candidate_sizes(4, 4, 16, True) == [4, 8, 12, 16]
+    assert candidate_sizes(12, 4, 16, False) == [12, 8, 4]
+    assert candidate_sizes(20, 4, 16, True) == [20]
+
+def make_predicate(first_accepted):
+    probes = []
+    def is_accepted(index):
+        probes.append(index)
+        return index >= first_accepted
+    return is_accepted, probes
+
+@pytest.mark.parametrize('strategy', list(SEARCH_STRATEGIES.values()))
+@pytest.mark.parametrize('num_candidates', [1, 2, 7, 64])
+def test_strategies_match_linear_search(strategy, num_candidates):
+    for first_accepted in range(num_candidates + 1):
+        is_accepted, _ = make_predicate(first_accepted)
+        expected = min(first_accepted, num_candidates - 1)
+        assert strategy(num_candidates, is_accepted) == expected
+
+@pytest.mark.parametrize('strategy', [bracket_search, golden_section_search])
+def test_strategies_train_logarithmic_number_of_candidates(strategy):
+    is_accepted, probes = make_predicate(45)
+    assert strategy(256, is_accepted) == 45
+    assert len(set(probes)) <= 16
+    linear_probes = make_predicate(45)
+    linear_search(256, linear_probes[0])
+    assert len(linear_probes[1]) == 46
+
+def make_batch_predicate(first_accepted):
+    rounds = []
+    def are_accepted(indices):
+        rounds.append(list(indices))
+        return [index >= first_accepted for index in indices]
+    return are_accepted, rounds
+
+@pytest.mark.parametrize('strategy', list(SEARCH_STRATEGIES))
+@pytest.mark.parametrize('batch_size', [1, 3, 8])
+def test_batched_search_matches_linear_search(strategy, batch_size):
+    for num_candidates in [1, 6, 33]:
+        for first_accepted in range(num_candidates + 1):
+            are_accepted, rounds = make_batch_predicate(first_accepted)
+            assert batched_search(num_candidates, are_accepted, batch_size, strategy) == min(first_accepted, num_candidates - 1)
+            assert all(0 < len(probes) <= batch_size for probes in rounds)
+
+@pytest.mark.parametrize('strategy', list(SEARCH_STRATEGIES))
+def test_batched_search_with_one_worker_probes_like_sequential(strategy):
+    is_accepted, sequential_probes = make_predicate(21)
+    SEARCH_STRATEGIES[strategy](40, is_accepted)
+    are_accepted, rounds = make_batch_predicate(21)
+    batched_search(40, are_accepted, 1, strategy)
+    assert [probes[0] for probes in rounds] == sequential_probes
@@ -0,0 +1,58 @@
+import os
+import numpy as np
+import pytest
+from keras.models import Sequential
+from keras.layers import Input, Dense
+from app.model_cache import ModelCache, model_key, model_memory_bytes
+
+def save_model(path, units):
+    model = Sequential([Input(shape=(4,)), Dense(units)])
+    model.save(path)
+    return model
+
+@pytest.fixture
+def model_paths(tmp_path):
+    return [str(tmp_path / f'model_{i}.keras') for i in range(3)]
+
+def test_hits_return_the_resident_model(model_paths):
+    save_model(model_paths[0], 8)
+    cache = ModelCache()
+    model = cache.get(model_paths[0])
+    assert cache.get(model_paths[0]) is model
+    assert model_paths[0] in cache
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert model_memory_bytes(model) == (4 * 8 + 8) * 4
+
+def test_changed_file_is_reloaded(model_paths):
+    save_model(model_paths[0], 8)
+    cache = ModelCache()
+    first = cache.get(model_paths[0])
+    save_model(model_paths[0], 16)
+    os.utime(model_paths[0], ns=(os.stat(model_paths[0]).st_atime_ns, os.stat(model_paths[0]).st_mtime_ns + 10 ** 9))
+    second = cache.get(model_paths[0])
+    assert second is not first and second.output_shape == (None, 16)
+    assert len(cache) == 1
+
+def test_lru_eviction_within_budget(model_paths):
+    for path in model_paths:
+        save_model(path, 8)
+    model_size = (4 * 8 + 8) * 4
+    cache = ModelCache(max_bytes=2 * model_size)
+    cache.preload(model_paths[:2])
+    cache.get(model_paths[0])  # model_1 becomes the least recently used
+    cache.get(model_paths[2])
+    assert model_paths[1] not in cache
+    assert model_paths[0] in cache and model_paths[2] in cache
+    assert cache.evictions == 1 and cache.total_bytes == 2 * model_size
+
+def test_model_larger_than_budget_stays_resident(model_paths):
+    save_model(model_paths[0], 8)
+    cache = ModelCache(max_bytes=1)
+    model = cache.get(model_paths[0])
+    assert model_paths[0] in cache and cache.get(model_paths[0]) is model
+
+def test_key_uses_resolved_path(model_paths, tmp_path):
+    save_model(model_paths[0], 8)
+    link = str(tmp_path / 'link.keras')
+    os.symlink(model_paths[0], link)
+    assert model_key(link) == model_key(model_paths[0])
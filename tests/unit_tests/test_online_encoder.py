@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from keras.models import Sequential
+from keras.layers import Input, Conv1D, Flatten, Dense
+from app.online_encoder import RingWindow, OnlineEncoder
+from app.windowing import create_sliding_windows
+
+@pytest.fixture(scope='module')
+def encoder():
+    return Sequential([Input(shape=(6, 2)), Conv1D(4, 3, activation='relu'), Flatten(), Dense(3)])
+
+def test_ring_window_keeps_last_rows_in_order():
+    ring = RingWindow(4, 2)
+    rows = np.arange(20, dtype=np.float32).reshape(10, 2)
+    for i, row in enumerate(rows):
+        ring.append(row)
+        assert ring.ready == (i >= 3)
+        if ring.ready:
+            np.testing.assert_array_equal(ring.window(), rows[i - 3:i + 1])
+
+def test_online_encoding_matches_batch_encoding(encoder):
+    series = np.random.rand(30, 2).astype(np.float32)
+    expected = np.asarray(encoder(np.ascontiguousarray(create_sliding_windows(series, 6)), training=False))
+    online = OnlineEncoder(encoder)
+    outputs = [online.push('EURUSD', row) for row in series]
+    assert all(output is None for output in outputs[:5])
+    np.testing.assert_allclose(np.stack(outputs[5:]), expected, rtol=1e-5, atol=1e-6)
+
+def test_streams_are_batched_and_independent(encoder):
+    series = {name: np.random.rand(12, 2).astype(np.float32) for name in ['a', 'b', 'c']}
+    batched = OnlineEncoder(encoder)
+    batched.warm_up('c', series['c'][:6])
+    for t in range(6, 12):
+        results = batched.push_many({name: rows[t] for name, rows in series.items()})
+        assert results['c'] is not None
+        assert (results['a'] is None) == (t < 11)
+    single = OnlineEncoder(encoder)
+    for row in series['a'][6:]:
+        last = single.push('a', row)
+    np.testing.assert_allclose(results['a'], last, rtol=1e-5, atol=1e-6)
+    expected_c = np.asarray(encoder(series['c'][6:][np.newaxis], training=False))[0]
+    np.testing.assert_allclose(results['c'], expected_c, rtol=1e-5, atol=1e-6)
+    with pytest.raises(ValueError):
+        batched.push('a', np.zeros(3))
+    # A bad row for a later stream rejects the whole tick before any stream advances
+    windows = {name: (batched._streams[name].count, batched._streams[name].window().copy()) for name in series}
+    with pytest.raises(ValueError):
+        batched.push_many({'a': np.ones(2), 'b': np.ones(2), 'new': np.ones(2), 'c': np.zeros(3)})
+    assert sorted(batched.streams) == ['a', 'b', 'c']
+    for name, (count, window) in windows.items():
+        assert batched._streams[name].count == count
+        np.testing.assert_array_equal(batched._streams[name].window(), window)
+
+def test_2d_input_encoders_encode_single_rows():
+    # Same input layout as the ANN encoder plugin: (None, input_dim)
+    model = Sequential([Input(shape=(5,)), Dense(4, activation='relu'), Dense(2)])
+    rows = np.random.rand(4, 5).astype(np.float32)
+    online = OnlineEncoder(model)
+    assert online.window_size == 1 and online.num_features == 5
+    outputs = [online.push('EURUSD', row) for row in rows]
+    np.testing.assert_allclose(np.stack(outputs), np.asarray(model(rows, training=False)), rtol=1e-5, atol=1e-6)
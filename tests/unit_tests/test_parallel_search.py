@@ -0,0 +1,35 @@
+import os
+import numpy as np
+from app.parallel_search import worker_cpu_sets, share_dataset, open_shared_dataset
+from app.windowed_dataset import WindowedDataset
+from app.windowing import create_sliding_windows
+from app.data_profile import profile_frame, with_profile
+
+def test_worker_cpu_sets_are_disjoint():
+    cpu_sets = worker_cpu_sets(3)
+    assert len(cpu_sets) == 3
+    all_cpus = [cpu for cores in cpu_sets for cpu in cores]
+    assert len(all_cpus) == len(set(all_cpus))
+    if hasattr(os, 'sched_getaffinity'):
+        assert sorted(all_cpus) == sorted(os.sched_getaffinity(0))
+
+def test_shared_datasets_are_memory_mapped(tmp_path):
+    series = np.random.rand(30, 2).astype(np.float32)
+    windowed = open_shared_dataset(share_dataset(WindowedDataset(series, 5), str(tmp_path), 'training'))
+    assert isinstance(windowed, WindowedDataset)
+    np.testing.assert_array_equal(windowed.windows(), WindowedDataset(series, 5).windows())
+    rows = open_shared_dataset(share_dataset(series, str(tmp_path), 'validation'))
+    assert isinstance(rows, np.memmap)
+    np.testing.assert_array_equal(rows, series)
+    profile = profile_frame(series)
+    profiled = open_shared_dataset(share_dataset(with_profile(series, profile), str(tmp_path), 'profiled'))
+    assert profiled.profile.num_rows == 30
+    np.testing.assert_array_equal(profiled, series)
+
+def test_window_views_are_shared_as_their_series(tmp_path):
+    series = np.random.rand(200, 3).astype(np.float32)
+    spec = share_dataset(create_sliding_windows(series, 32), str(tmp_path), 'training')
+    assert os.path.getsize(spec[1]) < series.nbytes + 1024  # Not the 32 times larger window tensor
+    shared = open_shared_dataset(spec)
+    assert isinstance(shared, WindowedDataset) and not shared.series.flags.owndata  # A view of the memory map
+    np.testing.assert_array_equal(shared.windows(), create_sliding_windows(series, 32))
@@ -0,0 +1,50 @@
+import sys
+import pytest
+from unittest.mock import patch
+import app.plugin_loader as plugin_loader
+from app.plugin_loader import (
+    plugin_registry, list_plugins, load_plugin, get_plugin_params, read_plugin_params, set_plugin_index_path, clear_plugin_registry
+)
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    set_plugin_index_path(None)
+    clear_plugin_registry()
+    yield
+    set_plugin_index_path(None)
+    clear_plugin_registry()
+
+def test_entry_points_are_enumerated_once():
+    with patch('app.plugin_loader.entry_points', wraps=plugin_loader.entry_points) as mock_entry_points:
+        assert 'cnn' in list_plugins('feature_extractor.encoders')
+        assert 'cnn' in list_plugins('feature_extractor.decoders')
+        get_plugin_params('feature_extractor.encoders', 'cnn')
+        with pytest.raises(ImportError):
+            load_plugin('feature_extractor.encoders', 'non_existent_plugin')
+        assert mock_entry_points.call_count == len(plugin_loader.PLUGIN_GROUPS)
+
+def test_plugin_params_are_read_without_importing_the_plugin():
+    sys.modules.pop('app.plugins.encoder_plugin_cnn', None)
+    params = get_plugin_params('feature_extractor.encoders', 'cnn')
+    assert 'app.plugins.encoder_plugin_cnn' not in sys.modules
+    plugin_class, _ = load_plugin('feature_extractor.encoders', 'cnn')
+    assert params == plugin_class.plugin_params
+
+def test_read_plugin_params_requires_a_literal():
+    assert read_plugin_params('app.plugins.encoder_plugin_cnn:Missing') == (None, None)
+    assert read_plugin_params('app.plugins.no_such_module:Plugin') == (None, None)
+
+def test_index_is_persisted_and_keyed_on_distributions(tmp_path):
+    index_path = str(tmp_path / 'plugin_index.json')
+    set_plugin_index_path(index_path)
+    params = get_plugin_params('feature_extractor.decoders', 'cnn')
+    clear_plugin_registry()
+    with patch('app.plugin_loader.entry_points') as mock_entry_points, \
+            patch('app.plugin_loader.read_plugin_params') as mock_read:
+        assert get_plugin_params('feature_extractor.decoders', 'cnn') == params
+        mock_entry_points.assert_not_called()
+        mock_read.assert_not_called()
+    clear_plugin_registry()
+    with patch('app.plugin_loader._distributions_key', return_value='changed'):
+        assert plugin_registry()['key'] == 'changed'
+        assert plugin_registry()['params'] == {}
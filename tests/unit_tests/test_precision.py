@@ -0,0 +1,25 @@
+import pytest
+from unittest.mock import patch
+from tensorflow.keras.mixed_precision import global_policy
+from app.precision import resolve_precision_policy, apply_precision_policy
+
+def test_resolve_precision_policy():
+    assert resolve_precision_policy('float32') == 'float32'
+    assert resolve_precision_policy('mixed_float16') == 'mixed_float16'
+    with pytest.raises(ValueError):
+        resolve_precision_policy('float64')
+
+def test_bfloat16_falls_back_without_cpu_support():
+    with patch('app.precision.cpu_supports_bfloat16', return_value=False), \
+         patch('app.precision.tf.config.list_physical_devices', return_value=[]):
+        assert resolve_precision_policy('bfloat16') == 'float32'
+    with patch('app.precision.cpu_supports_bfloat16', return_value=True):
+        assert resolve_precision_policy('bfloat16') == 'mixed_bfloat16'
+
+def test_apply_precision_policy_sets_global_policy():
+    try:
+        apply_precision_policy('mixed_float16')
+        assert global_policy().name == 'mixed_float16'
+    finally:
+        apply_precision_policy('float32')
+    assert global_policy().name == 'float32'
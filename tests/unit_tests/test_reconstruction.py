@@ -0,0 +1,57 @@
+import pytest
+import pandas as pd
+import numpy as np
+from app.reconstruction import unwindow_data, overlap_counts
+from benchmarks.bench_reconstruction import legacy_unwindow_data
+
+# Per-row overlap-add averaged with the segment divisors of the original code (valid for num_rows >= window_size)
+def reference_unwindow(values):
+    num_rows, window_size = values.shape
+    total_rows_out = num_rows + window_size - 1
+    output = np.zeros((total_rows_out, window_size))
+    for col in range(window_size):
+        for row in range(num_rows):
+            extended_row = np.zeros(total_rows_out)
+            extended_row[row:row + window_size] = values[row, col]
+            output[:, col] += extended_row
+        for row in range(window_size - 1):
+            output[row, col] /= (row + 1)
+        for row in range(window_size - 1, total_rows_out - window_size):
+            output[row, col] /= window_size
+        for row in range(total_rows_out - window_size, total_rows_out):
+            output[row, col] /= (total_rows_out - row)
+    return output
+
+def test_unwindow_data_matches_reference():
+    windowed_df = pd.DataFrame(np.random.rand(60, 5), columns=list('abcde'))
+    result = unwindow_data(windowed_df)
+    assert result.shape == (64, 5)
+    assert list(result.columns) == list('abcde')
+    np.testing.assert_array_equal(result.to_numpy(), reference_unwindow(windowed_df.to_numpy()))
+
+def test_unwindow_data_constant_input():
+    windowed_df = pd.DataFrame(np.full((10, 3), 2.5))
+    result = unwindow_data(windowed_df)
+    np.testing.assert_allclose(result.to_numpy(), 2.5)
+
+def test_overlap_counts():
+    np.testing.assert_array_equal(overlap_counts(5, 3), [1, 2, 3, 3, 3, 2, 1])
+    np.testing.assert_array_equal(overlap_counts(2, 4), [1, 2, 2, 2, 1])
+
+@pytest.mark.skipif(int(pd.__version__.split('.')[0]) < 3, reason='The legacy averaging is a no-op only under Copy-on-Write')
+@pytest.mark.filterwarnings('ignore:A value is being set on a copy')
+def test_output_changed_from_legacy_sums_to_averages():
+    # The original code's chained-indexing division never applied: it returned the undivided overlap sums
+    windowed_df = pd.DataFrame(np.random.default_rng(0).random((300, 4)))
+    legacy = legacy_unwindow_data(windowed_df).to_numpy()
+    result = unwindow_data(windowed_df).to_numpy()
+    np.testing.assert_allclose(legacy, result * overlap_counts(300, 4)[:, np.newaxis], rtol=1e-12)
+    assert np.abs(result - legacy).max() > 1.0
+
+def test_unwindow_data_fewer_rows_than_window():
+    # Each output row is averaged over the windows that actually cover it, at most num_rows of them
+    windowed_df = pd.DataFrame({'a': [1.0, 3.0], 'b': [2.0, 2.0], 'c': [0.0, 4.0], 'd': [5.0, 5.0]})
+    result = unwindow_data(windowed_df)
+    np.testing.assert_array_equal(result['a'], [1.0, 2.0, 2.0, 2.0, 3.0])
+    np.testing.assert_array_equal(result['b'], np.full(5, 2.0))
+    np.testing.assert_array_equal(overlap_counts(2, 4), [1, 2, 2, 2, 1])
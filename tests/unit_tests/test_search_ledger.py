@@ -0,0 +1,83 @@
+import os
+import json
+from app.search_ledger import SearchLedger, ledger_path, candidate_dir
+from app.plugins.encoder_plugin_cnn import Plugin as EncoderPlugin
+from app.plugins.decoder_plugin_cnn import Plugin as DecoderPlugin
+
+CONFIG = {'input_file': 'train.csv', 'encoder_plugin': 'cnn', 'decoder_plugin': 'cnn', 'window_size': 16,
+          'epochs': 10, 'threshold_error': 0.3, 'incremental_search': True}
+
+def record_candidate(ledger, tmp_path, interface_size, validation_mae):
+    files = []
+    for name in ('encoder', 'decoder'):
+        file_path = tmp_path / f"{name}_{interface_size}.keras"
+        file_path.write_text('model')
+        files.append(str(file_path))
+    candidate = {'interface_size': interface_size, 'validation_mse': validation_mae ** 2, 'validation_mae': validation_mae,
+                 'accepted': validation_mae <= 0.3, 'stages': [{'name': 'candidate'}]}
+    ledger.record(candidate, *files, {'interface_size': interface_size, 'layer': object()}, {})
+    return files
+
+def test_resumed_ledger_skips_completed_candidates(tmp_path):
+    file_path = ledger_path(str(tmp_path))
+    ledger = SearchLedger(file_path, CONFIG)
+    encoder_file, _ = record_candidate(ledger, tmp_path, 4, 0.5)
+    record_candidate(ledger, tmp_path, 6, 0.2)
+
+    resumed = SearchLedger(file_path, CONFIG, resume=True)
+    entry = resumed.get(4)
+    assert entry['encoder_file'] == encoder_file
+    assert entry['candidate']['from_ledger'] and not entry['candidate']['accepted']
+    assert 'stages' not in entry['candidate']
+    assert entry['encoder_params'] == {'interface_size': 4}  # Values that are not JSON are left out
+    assert resumed.get(6)['candidate']['accepted']
+    assert resumed.get(8) is None
+    assert SearchLedger(file_path, CONFIG).get(4) is None  # Without resume the search starts over
+
+def test_acceptance_follows_the_current_threshold(tmp_path):
+    file_path = ledger_path(str(tmp_path))
+    record_candidate(SearchLedger(file_path, CONFIG), tmp_path, 4, 0.5)
+    resumed = SearchLedger(file_path, dict(CONFIG, threshold_error=0.6), resume=True)
+    assert resumed.get(4)['candidate']['accepted']
+
+def test_ledger_of_other_settings_is_not_reused(tmp_path):
+    file_path = ledger_path(str(tmp_path))
+    record_candidate(SearchLedger(file_path, CONFIG), tmp_path, 4, 0.5)
+    ledger = SearchLedger(file_path, dict(CONFIG, epochs=20), resume=True)
+    assert ledger.get(4) is None and ledger.stale
+    assert not SearchLedger(file_path, CONFIG, resume=True).stale
+
+def test_candidates_with_missing_models_are_trained_again(tmp_path):
+    file_path = ledger_path(str(tmp_path))
+    encoder_file, _ = record_candidate(SearchLedger(file_path, CONFIG), tmp_path, 4, 0.5)
+    os.remove(encoder_file)
+    assert SearchLedger(file_path, CONFIG, resume=True).get(4) is None
+    with open(file_path) as f:
+        assert list(json.load(f)['candidates']) == ['4']
+    assert candidate_dir('run', 4).endswith('interface_4')
+
+def test_ledger_of_other_data_or_stopping_options_is_not_reused(tmp_path):
+    file_path = ledger_path(str(tmp_path / 'run'))
+    input_file = tmp_path / 'train.csv'
+    input_file.write_text('1,2\n3,4\n')
+    config = dict(CONFIG, input_file=str(input_file))
+    record_candidate(SearchLedger(file_path, config), tmp_path, 4, 0.5)
+    assert not SearchLedger(file_path, config, resume=True).stale
+    assert SearchLedger(file_path, dict(config, headers=True), resume=True).stale
+    assert SearchLedger(file_path, dict(config, threshold_stopping=True), resume=True).stale
+    input_file.write_text('1,2\n3,5\n')  # New contents under the same path
+    assert SearchLedger(file_path, config, resume=True).stale
+
+def test_ledger_of_another_architecture_is_not_reused(tmp_path):
+    def plugins(**params):
+        encoder, decoder = EncoderPlugin(), DecoderPlugin()
+        encoder.set_params(**CONFIG, **params)
+        decoder.set_params(**CONFIG, **params)
+        return {'encoder_plugin': encoder, 'decoder_plugin': decoder}
+    file_path = ledger_path(str(tmp_path))
+    record_candidate(SearchLedger(file_path, CONFIG, **plugins()), tmp_path, 4, 0.5)
+    resumed_plugins = plugins(resume=True)
+    resumed_plugins['encoder_plugin'].params['input_shape'] = 16  # Set per candidate, not an architecture setting
+    assert SearchLedger(file_path, CONFIG, resume=True, **resumed_plugins).get(4) is not None
+    ledger = SearchLedger(file_path, CONFIG, resume=True, **plugins(intermediate_layers=5))
+    assert ledger.stale and ledger.get(4) is None
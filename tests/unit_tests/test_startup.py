@@ -0,0 +1,4 @@
+from benchmarks.bench_startup import imported_heavy_modules
+
+def test_main_import_does_not_load_heavy_modules():
+    assert imported_heavy_modules() == []
@@ -0,0 +1,75 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from keras.models import Sequential
+from keras.layers import Input, Conv1D, Flatten, Dense, Reshape
+from app.tflite_export import convert_to_tflite, TFLiteModel, export_tflite, sample_evenly, model_inputs
+from app.data_processor import load_and_evaluate_encoder
+from app.windowing import create_sliding_windows
+
+WINDOW_SIZE, NUM_CHANNELS = 8, 3
+
+@pytest.fixture(scope='module')
+def windows():
+    rng = np.random.default_rng(0)
+    series = np.cumsum(rng.normal(size=(300, NUM_CHANNELS)), axis=0).astype(np.float32)
+    return series, np.ascontiguousarray(create_sliding_windows(series, WINDOW_SIZE))
+
+@pytest.fixture(scope='module')
+def encoder():
+    return Sequential([Input(shape=(WINDOW_SIZE, NUM_CHANNELS)), Conv1D(4, 3, activation='relu'), Flatten(), Dense(5)])
+
+@pytest.mark.parametrize('quantization, tolerance', [('float32', 1e-5), ('float16', 1e-2), ('int8', 0.5)])
+def test_converted_model_matches_keras(encoder, windows, quantization, tolerance):
+    _, inputs = windows
+    model = TFLiteModel(model_content=convert_to_tflite(encoder, quantization, sample_evenly(inputs, 100)))
+    assert model.input_shape == (None, WINDOW_SIZE, NUM_CHANNELS)
+    expected = encoder.predict(inputs, verbose=0)
+    outputs = model.predict(inputs)
+    assert outputs.dtype == np.float32 and outputs.shape == expected.shape
+    scale = np.abs(expected).max()
+    assert np.abs(outputs - expected).max() <= tolerance * max(scale, 1.0)
+    # Batch size changes between calls resize the interpreter
+    np.testing.assert_allclose(model.predict(inputs[:1]), outputs[:1], rtol=1e-5, atol=1e-6)
+
+def test_int8_needs_calibration_data(encoder):
+    with pytest.raises(ValueError):
+        convert_to_tflite(encoder, 'int8')
+
+def test_export_command_and_tflite_evaluation(encoder, windows, tmp_path):
+    series, inputs = windows
+    input_file = tmp_path / 'input.csv'
+    pd.DataFrame(series, columns=['a', 'b', 'c']).to_csv(input_file, index=False)
+    decoder = Sequential([Input(shape=(5,)), Dense(WINDOW_SIZE * NUM_CHANNELS), Reshape((WINDOW_SIZE, NUM_CHANNELS))])
+    encoder_path, decoder_path = str(tmp_path / 'encoder.keras'), str(tmp_path / 'decoder.keras')
+    encoder.save(encoder_path)
+    decoder.save(decoder_path)
+    config = {
+        'input_file': str(input_file), 'headers': True, 'no_csv_cache': True, 'use_sliding_windows': True,
+        'load_encoder': encoder_path, 'load_decoder': decoder_path, 'tflite_quantization': 'float32',
+        'save_log': str(tmp_path / 'report.json')
+    }
+    report = export_tflite(config)
+    assert report['encoder']['max_abs_error'] < 1e-4
+    assert report['reconstruction']['tflite_mae'] == pytest.approx(report['reconstruction']['keras_mae'], rel=1e-3)
+    with open(tmp_path / 'report.json') as f:
+        assert json.load(f)['encoder']['tflite_file'] == str(tmp_path / 'encoder.float32.tflite')
+
+    output_file = tmp_path / 'encoded.csv'
+    load_and_evaluate_encoder(dict(config, load_encoder=report['encoder']['tflite_file'], window_size=WINDOW_SIZE,
+                                   evaluate_encoder=str(output_file)))
+    encoded = pd.read_csv(output_file).to_numpy()
+    np.testing.assert_allclose(encoded, encoder.predict(inputs, verbose=0), rtol=1e-4, atol=1e-4)
+
+def test_model_inputs_follow_the_encoder_input_rank(windows):
+    series, inputs = windows
+    window_encoder = Sequential([Input(shape=(WINDOW_SIZE, NUM_CHANNELS)), Flatten(), Dense(2)])
+    np.testing.assert_array_equal(model_inputs(series, window_encoder), inputs)
+    row_encoder = Sequential([Input(shape=(NUM_CHANNELS, 1)), Flatten(), Dense(2)])
+    assert model_inputs(series, row_encoder).shape == (300, NUM_CHANNELS, 1)
+    # Same input layout as the ANN encoder plugin: (None, input_dim)
+    ann_encoder = Sequential([Input(shape=(NUM_CHANNELS,)), Dense(2)])
+    np.testing.assert_array_equal(model_inputs(series, ann_encoder), series)
+    with pytest.raises(ValueError):
+        model_inputs(series[:, :2], ann_encoder)
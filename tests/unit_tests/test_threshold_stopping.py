@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from keras.models import Sequential
+from keras.layers import Input, Dense, Reshape, Flatten
+from keras.optimizers import Adam
+from app.threshold_stopping import ThresholdStopping, validation_mae, projected_best_mae
+from app.windowed_dataset import WindowedDataset
+
+def build_model(learning_rate=0.01):
+    model = Sequential([Input(shape=(4, 2)), Flatten(), Dense(8), Reshape((4, 2))])
+    model.compile(optimizer=Adam(learning_rate=learning_rate), loss='mse', metrics=['mae'])
+    return model
+
+@pytest.fixture
+def dataset():
+    rng = np.random.default_rng(0)
+    return WindowedDataset(rng.normal(size=(203, 2)).astype(np.float32), 4)
+
+def test_validation_mae_matches_evaluate(dataset):
+    model = build_model()
+    expected = model.evaluate(dataset.as_tf_dataset(32), verbose=0, return_dict=True)['mae']
+    assert validation_mae(model, dataset, batch_size=64) == pytest.approx(expected, rel=1e-5)
+    windows = dataset.windows()
+    sample = windows[np.linspace(0, len(windows) - 1, 10).astype(int)]
+    sample_mae = float(np.mean(np.abs(model.predict(sample, verbose=0) - sample)))
+    assert validation_mae(model, dataset, max_samples=10) == pytest.approx(sample_mae, rel=1e-5)
+
+def test_projected_best_mae():
+    assert projected_best_mae([1.0, 0.5], 10) is None
+    assert projected_best_mae([1.0, 0.5, 0.25], 10) == pytest.approx(0.25 - 0.25 * (1 - 0.5 ** 10))
+    assert projected_best_mae([0.5, 0.5, 0.5], 10) == 0.5
+    assert projected_best_mae([1.0, 0.5, 0.25], 0) == 0.25
+    # An irregular curve is extrapolated from its best check with the optimistic ratio
+    assert projected_best_mae([0.5, 0.6, 0.55], 1) == pytest.approx(0.5 - 0.05 * 0.9)
+
+def test_training_stops_when_the_threshold_is_met(dataset):
+    model = build_model()
+    callback = ThresholdStopping(dataset, threshold_error=10.0, every_epochs=2, max_samples=50)
+    history = model.fit(dataset.as_tf_dataset(32), epochs=20, verbose=0, callbacks=[callback])
+    assert callback.stop_reason == 'threshold_met' and callback.stopped_epoch == 2
+    assert len(history.history['loss']) == 2
+    assert 'full_validation_mae' in callback.evaluations[-1]
+
+def test_candidate_that_cannot_reach_the_threshold_is_abandoned(dataset):
+    model = build_model(learning_rate=0.0)  # A flat learning curve
+    callback = ThresholdStopping(dataset, threshold_error=0.01, every_epochs=1)
+    history = model.fit(dataset.as_tf_dataset(32), epochs=20, verbose=0, callbacks=[callback])
+    assert callback.stop_reason == 'abandoned'
+    assert len(history.history['loss']) == 4  # Projected misses at the third and fourth checks
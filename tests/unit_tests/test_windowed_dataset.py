@@ -0,0 +1,69 @@
+import pytest
+import pandas as pd
+import numpy as np
+from app.windowed_dataset import WindowedDataset, StreamingWindowedDataset
+from app.data_handler import load_csv, load_csv_chunks
+from app.windowing import create_sliding_windows
+
+@pytest.fixture
+def series():
+    return pd.DataFrame(np.random.rand(40, 3).astype(np.float32))
+
+def test_windowed_dataset_shape(series):
+    dataset = WindowedDataset(series, 8)
+    assert dataset.shape == (33, 8, 3)
+    assert len(dataset) == 33
+    assert dataset.series.shape == (40, 3)
+
+def test_windowed_dataset_batches_match_windows(series):
+    dataset = WindowedDataset(series, 8)
+    batches = [x.numpy() for x, y in dataset.as_tf_dataset(batch_size=5)]
+    assert [len(batch) for batch in batches] == [5] * 6 + [3]
+    np.testing.assert_array_equal(np.concatenate(batches), create_sliding_windows(series, 8))
+
+def test_windowed_dataset_shuffle_is_a_permutation(series):
+    dataset = WindowedDataset(series, 8)
+    batches = [x.numpy() for x in dataset.as_tf_dataset(batch_size=4, shuffle=True, seed=1, with_targets=False)]
+    shuffled = np.concatenate(batches)
+    expected = create_sliding_windows(series, 8)
+    # Each window is identified by its first row, which is unique for random data
+    order = [int(np.where((expected[:, 0, :] == window[0]).all(axis=1))[0][0]) for window in shuffled]
+    assert sorted(order) == list(range(33))
+    assert order != list(range(33))
+
+@pytest.fixture
+def csv_file(tmp_path):
+    dates = pd.date_range('2020-01-01', periods=95, freq='h')
+    data = pd.DataFrame(np.random.rand(95, 3), columns=['A', 'B', 'C'])
+    data.insert(0, 'date', dates.strftime('%d/%m/%Y %H:%M'))
+    file_path = tmp_path / 'data.csv'
+    data.to_csv(file_path, index=False)
+    return str(file_path)
+
+def test_load_csv_chunks_overlap(csv_file):
+    chunks = list(load_csv_chunks(csv_file, headers=True, force_date=True, chunk_size=20, overlap=7))
+    full = load_csv(csv_file, headers=True, force_date=True)
+    assert [len(chunk) for chunk in chunks] == [20, 27, 27, 27, 22]
+    assert all(chunk.dtypes.eq(np.float32).all() for chunk in chunks)
+    pd.testing.assert_index_equal(chunks[1].index, full.index[13:40])
+    np.testing.assert_allclose(chunks[1].to_numpy(), full.iloc[13:40].to_numpy(), rtol=1e-6)
+
+def test_streaming_windowed_dataset_matches_in_memory(csv_file):
+    dataset = StreamingWindowedDataset(csv_file, 8, headers=True, force_date=True, chunk_size=20)
+    full = load_csv(csv_file, headers=True, force_date=True).astype(np.float32)
+    assert dataset.shape == (88, 8, 3)
+    assert not dataset.has_nan
+    batches = [x.numpy() for x, y in dataset.as_tf_dataset(batch_size=16)]
+    np.testing.assert_array_equal(np.concatenate(batches), create_sliding_windows(full, 8))
+    shuffled = np.concatenate([x.numpy() for x in dataset.as_tf_dataset(batch_size=16, shuffle=True, seed=3, with_targets=False)])
+    assert shuffled.shape == (88, 8, 3)
+    np.testing.assert_array_equal(np.sort(shuffled[:, 0, 0]), np.sort(create_sliding_windows(full, 8)[:, 0, 0]))
+
+def test_batches_are_gathered_from_the_series_itself():
+    # No copy of the series is embedded in the pipeline: later changes to it show in the batches
+    series = np.arange(40, dtype=np.float32).reshape(20, 2)
+    dataset = WindowedDataset(series, 4)
+    pipeline = dataset.as_tf_dataset(batch_size=8, with_targets=False)
+    dataset.series[:] = -1.0
+    batch = next(iter(pipeline)).numpy()
+    assert batch.shape == (8, 4, 2) and (batch == -1.0).all()
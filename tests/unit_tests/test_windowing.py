@@ -0,0 +1,41 @@
+import pytest
+import pandas as pd
+import numpy as np
+from app.windowing import create_sliding_windows
+
+# Reference implementation with the per-row copy loop
+def reference_windows(data_array, window_size):
+    num_samples = data_array.shape[0] - window_size + 1
+    windows = np.zeros((num_samples, window_size, data_array.shape[1]))
+    for i in range(num_samples):
+        windows[i] = data_array[i:i + window_size]
+    return windows
+
+def test_create_sliding_windows_matches_reference():
+    data = pd.DataFrame(np.random.rand(50, 3), columns=['a', 'b', 'c'])
+    windows = create_sliding_windows(data, 8)
+    assert windows.shape == (43, 8, 3)
+    np.testing.assert_array_equal(windows, reference_windows(data.to_numpy(), 8))
+
+def test_create_sliding_windows_is_read_only_view():
+    data_array = np.arange(20, dtype=np.float64).reshape(10, 2)
+    windows = create_sliding_windows(data_array, 4)
+    assert np.shares_memory(windows, data_array)
+    assert not windows.flags.writeable
+    with pytest.raises(ValueError):
+        windows[0, 0, 0] = 1.0
+
+def test_create_sliding_windows_materialize():
+    data_array = np.arange(20, dtype=np.float64).reshape(10, 2)
+    windows = create_sliding_windows(data_array, 4, materialize=True)
+    assert not np.shares_memory(windows, data_array)
+    assert windows.flags.writeable and windows.flags.c_contiguous
+    np.testing.assert_array_equal(windows, reference_windows(data_array, 4))
+
+def test_create_sliding_windows_insufficient_data():
+    windows = create_sliding_windows(np.ones((2, 3)), 5)
+    assert windows.shape == (0, 5, 3)
+
+def test_create_sliding_windows_1d_series():
+    windows = create_sliding_windows(np.array([1, 2, 3, 4, 5]), 3)
+    np.testing.assert_array_equal(windows[:, :, 0], [[1, 2, 3], [2, 3, 4], [3, 4, 5]])